@@ -1,2 +1,12 @@
 from .syncer import sync_alignment
+from .batch import sync_many
+from .parallel import sync_parallel
+from .aio import AsyncSyncer, sync_alignment_async, sync_many_async
+from .streaming import StreamingSyncer
+from .cache import FitCache
+from .matching import ReferenceIndex
+from .stats import SyncStats
+from .models import ColumnarAlignment, FastCharAlignment
+from .timeline import AlignmentTimeline
+from .binary import AlignmentFile, write_alignments
 from .utils import CharAlignment
\ No newline at end of file
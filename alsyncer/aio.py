@@ -0,0 +1,181 @@
+import asyncio
+from array import array
+from concurrent.futures import Executor
+from typing import Any, Iterable
+
+from .matching import ReferenceIndex
+from .models import Alignment, ColumnarAlignment
+from .syncer import sync_columns
+from .utils import get_alignment_text, get_char_factory, get_durations
+
+
+
+class AsyncSyncer:
+    """
+    Runs syncs from asyncio code on an executor, so the event loop is never blocked by them
+    At most `max_in_flight` syncs are sent to the executor at once, the next ones wait for a free slot (backpressure)
+
+    The alignment is only updated once its sync is done, from the event loop.
+    If the call is cancelled or misses its deadline, the alignment is left untouched.
+    A sync already running in a thread can't be stopped, its result is just discarded, and it keeps its slot until it ends
+
+    Parameters:
+        executor: Executor | None = None - thread or process pool, defaults to the default executor of the loop
+        max_in_flight: int | None = None - number of syncs sent to the executor at once, unbounded if None
+    """
+
+    def __init__(self, executor: Executor | None = None, max_in_flight: int | None = None):
+        if max_in_flight is not None and max_in_flight < 1:
+            raise Exception("max_in_flight must be at least 1")
+
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+
+    async def sync(
+            self, alignment: Alignment | ColumnarAlignment, reference_text: str | ReferenceIndex,
+            timeout: float | None = None, **options: Any
+        ) -> None:
+        """
+        Synchronises the alignment to the reference text, like `sync_alignment`
+
+        Parameters:
+            alignment: Alignment | ColumnarAlignment
+            reference_text: str | ReferenceIndex
+            timeout: float | None = None - deadline of the call in seconds, waiting for a slot included. Raises TimeoutError when missed
+            **options: Any - options of `sync_alignment`
+        """
+
+        async with asyncio.timeout(timeout):
+            if self._slots is None:
+                characters, durations = await self._submit(alignment, reference_text, options)
+            else:
+                await self._slots.acquire()
+                try:
+                    future = self._submit(alignment, reference_text, options)
+                except BaseException:
+                    self._slots.release()
+                    raise
+
+                # The slot is freed when the job ends, not when this call stops waiting for it
+                future.add_done_callback(self._release)
+                characters, durations = await asyncio.shield(future)
+
+        _apply(alignment, characters, durations)
+
+    async def sync_many(
+            self, pairs: Iterable[tuple[Alignment | ColumnarAlignment, str | ReferenceIndex]],
+            timeout: float | None = None, **options: Any
+        ) -> list[Exception | None]:
+        """
+        Synchronises many alignments concurrently, within the in-flight limit
+        A failing pair doesn't fail the whole batch, its alignment is left untouched and its error is returned instead.
+        Cancelling the batch cancels every sync that is left
+
+        Parameters:
+            pairs: Iterable[tuple[Alignment | ColumnarAlignment, str | ReferenceIndex]] - (alignment, reference text) pairs
+            timeout: float | None = None - deadline of each sync, a missed one gives a TimeoutError
+            **options: Any - options of `sync_alignment`
+
+        Returns:
+            list[Exception | None] - the error of each pair, in input order (None if it succeeded)
+        """
+
+        results = await asyncio.gather(
+            *(self.sync(alignment, reference_text, timeout, **options) for alignment, reference_text in pairs),
+            return_exceptions=True
+        )
+
+        errors: list[Exception | None] = []
+        for result in results:
+            # Cancellation isn't an error of the pair
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            errors.append(result)
+
+        return errors
+
+    def _submit(
+            self, alignment: Alignment | ColumnarAlignment, reference_text: str | ReferenceIndex, options: dict[str, Any]
+        ) -> "asyncio.Future[tuple[str, list[int | float]]]":
+        """
+        Sends the sync of a copy of the alignment to the executor
+        Only its characters and durations are sent, so it works with process pools aswell
+        """
+
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(
+            self.executor, sync_columns,
+            get_alignment_text(alignment), list(get_durations(alignment)), reference_text, options
+        )
+
+    def _release(self, future: asyncio.Future) -> None:
+        """
+        Frees the slot of a finished job
+        Its error is retrieved, as nobody may be waiting for it anymore
+        """
+
+        if not future.cancelled():
+            future.exception()
+        self._slots.release()
+
+
+
+async def sync_alignment_async(
+        alignment: Alignment | ColumnarAlignment, reference_text: str | ReferenceIndex,
+        executor: Executor | None = None, timeout: float | None = None, **options: Any
+    ) -> None:
+    """
+    Synchronises the alignment to the reference text on an executor, without blocking the event loop
+    See `AsyncSyncer.sync`, use an `AsyncSyncer` to bound the number of syncs in flight
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+        reference_text: str | ReferenceIndex
+        executor: Executor | None = None - thread or process pool, defaults to the default executor of the loop
+        timeout: float | None = None - deadline in seconds, raises TimeoutError when missed
+        **options: Any - options of `sync_alignment`
+    """
+
+    await AsyncSyncer(executor).sync(alignment, reference_text, timeout, **options)
+
+
+async def sync_many_async(
+        pairs: Iterable[tuple[Alignment | ColumnarAlignment, str | ReferenceIndex]],
+        executor: Executor | None = None, max_in_flight: int | None = None,
+        timeout: float | None = None, **options: Any
+    ) -> list[Exception | None]:
+    """
+    Synchronises many alignments on an executor, without blocking the event loop
+    See `AsyncSyncer.sync_many`
+
+    Parameters:
+        pairs: Iterable[tuple[Alignment | ColumnarAlignment, str | ReferenceIndex]] - (alignment, reference text) pairs
+        executor: Executor | None = None - thread or process pool, defaults to the default executor of the loop
+        max_in_flight: int | None = None - number of syncs sent to the executor at once, unbounded if None
+        timeout: float | None = None - deadline of each sync in seconds
+        **options: Any - options of `sync_alignment`
+
+    Returns:
+        list[Exception | None] - the error of each pair, in input order (None if it succeeded)
+    """
+
+    return await AsyncSyncer(executor, max_in_flight).sync_many(pairs, timeout, **options)
+
+
+
+def _apply(alignment: Alignment | ColumnarAlignment, characters: str, durations: list[int | float]) -> None:
+    """
+    Replaces the content of the alignment with the synchronised characters and durations
+    """
+
+    if isinstance(alignment, ColumnarAlignment):
+        alignment.characters = characters
+        alignment.durations = array('d', durations)
+        return
+
+    new_char = get_char_factory(alignment)
+    alignment[:] = [
+        new_char(character=char, duration=duration)
+        for char, duration in zip(characters, durations)
+    ]
@@ -0,0 +1,94 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+from .models import Alignment, FastCharAlignment
+from .syncer import sync_alignment
+from .utils import get_char_factory
+
+
+# What is sent to the workers: characters, durations, reference text, and the sync options
+Payload = tuple[str, list[int | float], str, bool, bool, bool]
+
+
+
+def sync_many(
+        pairs: Iterable[tuple[Alignment, str]],
+        workers: int | None = None,
+        chunksize: int = 1,
+        round_alignment: bool = True,
+        anchors: bool = False,
+        words: bool = False
+    ) -> list[Exception | None]:
+    """
+    Synchronises many alignments to their reference texts, spread over a process pool
+    Only the characters and durations are sent to the workers, not the `CharAlignment` objects
+    Mutates every alignment in place, like `sync_alignment`
+
+    A failing pair doesn't fail the whole batch, its alignment is left untouched and its error is returned instead
+
+    Parameters:
+        pairs: Iterable[tuple[Alignment, str]] - (alignment, reference text) pairs
+        workers: int | None = None - number of processes, defaults to the number of CPUs. With 1, runs in this process
+        chunksize: int = 1 - number of pairs sent to a worker at once
+        round_alignment: bool = True
+        anchors: bool = False
+        words: bool = False
+
+    Returns:
+        list[Exception | None] - the error of each pair, in input order (None if it succeeded)
+    """
+
+    pairs = list(pairs)
+    payloads: list[Payload] = [
+        (
+            ''.join(al.character for al in alignment),
+            [al.duration for al in alignment],
+            reference_text,
+            round_alignment, anchors, words
+        )
+        for alignment, reference_text in pairs
+    ]
+
+    if workers == 1:
+        results = map(_sync_payload, payloads)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_sync_payload, payloads, chunksize=chunksize))
+
+    errors: list[Exception | None] = []
+    for (alignment, _), result in zip(pairs, results):
+        if isinstance(result, Exception):
+            errors.append(result)
+            continue
+
+        characters, durations = result
+        new_char = get_char_factory(alignment)
+        alignment[:] = [
+            new_char(character=char, duration=duration)
+            for char, duration in zip(characters, durations)
+        ]
+        errors.append(None)
+
+    return errors
+
+
+
+def _sync_payload(payload: Payload) -> tuple[str, list[int | float]] | Exception:
+    """
+    Synchronises one payload in a worker
+    Returns the synchronised characters and durations, or the error
+    """
+
+    characters, durations, reference_text, round_alignment, anchors, words = payload
+
+    alignment = [
+        FastCharAlignment(character=char, duration=duration)
+        for char, duration in zip(characters, durations)
+    ]
+
+    try:
+        sync_alignment(alignment, reference_text, round_alignment=round_alignment, anchors=anchors, words=words)
+    except Exception as e:
+        return e
+
+    return ''.join(al.character for al in alignment), [al.duration for al in alignment]
@@ -0,0 +1,173 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, Iterator
+
+from .models import Alignment, ColumnarAlignment
+from .utils import get_alignment_text, get_durations
+
+
+# File layout, everything little-endian:
+#   header: magic, version, number of records, offset of the index
+#   records: durations as float64, then the text in UTF-8, padded to 8 bytes so the next durations stay aligned
+#   index: for each record, offset of its durations, number of characters, and length of its text in bytes
+MAGIC = b"ALSY"
+VERSION = 1
+HEADER = struct.Struct("<4sIQQ")
+INDEX_ENTRY = struct.Struct("<QQQ")
+
+
+
+def write_alignments(path: str, alignments: Iterable[Alignment | ColumnarAlignment]) -> int:
+    """
+    Writes alignments to a binary file, one record each, in a single pass
+    Durations are stored as float64, `ColumnarAlignment.to_alignment` gives integers back where they are ones
+
+    Parameters:
+        path: str
+        alignments: Iterable[Alignment | ColumnarAlignment]
+
+    Returns:
+        int - number of records written
+    """
+
+    index: list[tuple[int, int, int]] = []
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+
+        for alignment in alignments:
+            durations = get_durations(alignment)
+            if not isinstance(durations, array):
+                durations = array('d', (float(duration) for duration in durations))
+            text = get_alignment_text(alignment).encode("utf-8")
+
+            index.append((file.tell(), len(durations), len(text)))
+            _write_durations(file, durations)
+            file.write(text)
+            file.write(b"\0" * (-len(text) % 8))
+
+        index_offset = file.tell()
+        for entry in index:
+            file.write(INDEX_ENTRY.pack(*entry))
+
+        # The header is only known at the end
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, len(index), index_offset))
+
+    return len(index)
+
+
+def _write_durations(file: BinaryIO, durations: array) -> None:
+    """
+    Writes an array of doubles in little-endian
+    """
+
+    if sys.byteorder != "little":
+        durations = array('d', durations)
+        durations.byteswap()
+    file.write(durations.tobytes())
+
+
+
+class AlignmentFile:
+    """
+    Memory-mapped binary file of alignments, see `write_alignments`
+    Opening it only reads the header, records are read when they are accessed and the OS pages them in and out as needed,
+    so millions of records take no memory until used
+
+    Indexing gives a `ColumnarAlignment` that can be synchronised, copying only that record.
+    `view` gives the record without copying its durations, to read it only: syncing resizes the durations, which a mapped file can't do
+
+    Parameters:
+        path: str
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self._count, self._index_offset = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise Exception("Not an alignment file")
+        if version != VERSION:
+            self._map.close()
+            raise Exception(f"Unsupported alignment file version: {version}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, k: int) -> ColumnarAlignment:
+        text, raw = self._record(k)
+
+        # A single copy of the bytes
+        durations = array('d')
+        durations.frombytes(raw)
+        raw.release()
+        if sys.byteorder != "little":
+            durations.byteswap()
+
+        alignment = ColumnarAlignment()
+        alignment.characters = text
+        alignment.durations = durations
+        return alignment
+
+    def __iter__(self) -> Iterator[ColumnarAlignment]:
+        for k in range(self._count):
+            yield self[k]
+
+    def view(self, k: int) -> tuple[str, memoryview]:
+        """
+        Returns the text of the record, and its durations as a view on the file, without copying them
+        The view keeps the file from being closed, release it once done
+
+        Parameters:
+            k: int
+
+        Returns:
+            tuple[str, memoryview] - text, and durations as doubles
+        """
+
+        text, raw = self._record(k)
+
+        if sys.byteorder == "little":
+            return text, raw.cast('d')
+
+        # Big-endian machines need their own copy
+        swapped = array('d')
+        swapped.frombytes(raw)
+        raw.release()
+        swapped.byteswap()
+        return text, memoryview(swapped)
+
+    def _record(self, k: int) -> tuple[str, memoryview]:
+        """
+        Returns the text of the record, and the bytes of its durations as a view on the file
+        """
+
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError(f"Record index out of range: {k}")
+
+        offset, length, text_length = INDEX_ENTRY.unpack_from(self._map, self._index_offset + k * INDEX_ENTRY.size)
+        text_offset = offset + 8 * length
+        text = str(self._map[text_offset:text_offset + text_length], "utf-8")
+
+        return text, memoryview(self._map)[offset:text_offset]
+
+    def close(self) -> None:
+        """
+        Closes the file
+        NOTE: Raises if views of the records are still held
+        """
+
+        self._map.close()
+
+    def __enter__(self) -> "AlignmentFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
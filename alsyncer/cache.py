@@ -0,0 +1,223 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from .matching import ReferenceIndex
+from .stats import SyncStats
+from .syncer import fit_alignment
+
+
+# Additions and missing chars, as returned by `fit_alignment`
+FitResult = tuple[list[int], list[int]]
+
+
+
+class FitCache:
+    """
+    Cache of `fit_alignment` results, keyed by a hash of the alignment text, the reference text and the fit options
+    A hit skips fitting completely, only the duration distribution is left to redo
+
+    Recent results are kept in memory, the least recently used ones are dropped first.
+    With a path, results are also stored in an SQLite file, so they survive between runs and processes
+
+    Parameters:
+        max_entries: int = 1024 - number of results kept in memory
+        path: str | None = None - SQLite file of the on-disk store, not used if None
+        max_disk_entries: int = 100_000 - number of results kept on disk, the least recently used ones are dropped first
+    """
+
+    def __init__(self, max_entries: int = 1024, path: str | None = None, max_disk_entries: int = 100_000):
+        if max_entries < 1 or max_disk_entries < 1:
+            raise Exception("Cache sizes must be at least 1")
+
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[str, FitResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._clock = 0 # Increases on every disk access, orders entries by last use
+
+        self._connection: sqlite3.Connection | None = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS fits (key TEXT PRIMARY KEY, result TEXT NOT NULL, used INTEGER NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS fits_used ON fits (used)")
+            self._clock = self._connection.execute("SELECT COALESCE(MAX(used), 0) FROM fits").fetchone()[0]
+            self._connection.commit()
+
+    @staticmethod
+    def key(
+            alignment_text: str, reference_text: str,
+            anchors: bool = False, words: bool = False, matcher: str = "greedy", band: int | str | None = None,
+            normalize: bool = False
+        ) -> str:
+        """
+        Returns the key of a fit
+        The engine isn't part of it, since every engine gives the same result
+
+        Parameters:
+            alignment_text: str
+            reference_text: str
+            anchors: bool = False
+            words: bool = False
+            matcher: str = "greedy"
+            band: int | str | None = None
+            normalize: bool = False
+
+        Returns:
+            str
+        """
+
+        digest = hashlib.sha256()
+        # Only marked when normalizing, so keys stored before the option existed stay valid
+        digest.update(f"{int(anchors)}{int(words)}{matcher}:{band}:{'normalize:' if normalize else ''}{len(alignment_text)}:".encode())
+        digest.update(alignment_text.encode("utf-8", "surrogatepass"))
+        digest.update(reference_text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> FitResult | None:
+        """
+        Returns the cached result of the key, or None
+
+        Parameters:
+            key: str
+
+        Returns:
+            FitResult | None
+        """
+
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+            if self._connection is not None:
+                row = self._connection.execute("SELECT result FROM fits WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    additions, missing = json.loads(row[0])
+                    result = additions, missing
+                    self._touch(key)
+                    self._remember(key, result)
+                    self.disk_hits += 1
+                    return result
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: FitResult) -> None:
+        """
+        Stores the result of the key
+
+        Parameters:
+            key: str
+            result: FitResult
+        """
+
+        with self._lock:
+            self._remember(key, result)
+
+            if self._connection is None:
+                return
+
+            self._clock += 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fits (key, result, used) VALUES (?, ?, ?)",
+                (key, json.dumps(result, separators=(',', ':')), self._clock)
+            )
+
+            # Drop the least recently used entries over the cap
+            self._connection.execute(
+                "DELETE FROM fits WHERE key IN (SELECT key FROM fits ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,)
+            )
+            self._connection.commit()
+
+    def fit(
+            self, alignment_text: str, reference_text: str | ReferenceIndex,
+            engine: str = "auto", anchors: bool = False, words: bool = False, matcher: str = "greedy",
+            band: int | str | None = None, normalize: bool = False, stats: SyncStats | None = None
+        ) -> FitResult:
+        """
+        Returns the cached fit of the texts, fitting and storing it on a miss
+        See `fit_alignment` for the parameters
+
+        Parameters:
+            alignment_text: str
+            reference_text: str | ReferenceIndex
+            engine: str = "auto"
+            anchors: bool = False
+            words: bool = False
+            matcher: str = "greedy"
+            band: int | str | None = None
+            normalize: bool = False
+            stats: SyncStats | None = None - adds the counters of the fitting to it on a miss, a hit adds nothing
+
+        Returns:
+            FitResult
+        """
+
+        text = reference_text.text if isinstance(reference_text, ReferenceIndex) else reference_text
+        key = self.key(alignment_text, text, anchors, words, matcher, band, normalize)
+
+        result = self.get(key)
+        if result is None:
+            result = fit_alignment(alignment_text, reference_text, engine=engine, anchors=anchors, words=words, matcher=matcher, band=band, normalize=normalize, stats=stats)
+            self.put(key, result)
+
+        return result
+
+    def clear(self) -> None:
+        """
+        Empties the cache, on disk aswell, and resets the counters
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM fits")
+                self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Closes the on-disk store, the in-memory cache can still be used
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, result: FitResult) -> None:
+        """
+        Stores a result in memory, dropping the least recently used one over the cap
+        """
+
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _touch(self, key: str) -> None:
+        """
+        Marks a disk entry as just used
+        """
+
+        self._clock += 1
+        self._connection.execute("UPDATE fits SET used = ? WHERE key = ?", (self._clock, key))
+        self._connection.commit()
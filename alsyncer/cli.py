@@ -0,0 +1,359 @@
+"""
+Command line entry point, synchronises alignments in bulk:
+    alsyncer records.jsonl --workers 4 --words > synced.jsonl
+
+Failed records are written to failures.jsonl by default (--failures), and the summary and the progress to stderr.
+With --failures -, the failures go to stderr as JSONL instead, and nothing else is written there then
+
+JSONL input has one record per line: {"alignment": [{"character": "H", "duration": 100}, ...], "reference": "..."}
+Other keys (e.g. an id) are kept in the output. Binary input is a file of `write_alignments`,
+with the references in a JSONL file of strings (--references), or one reference text for every record (--reference-file)
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterator, TextIO
+
+from .binary import AlignmentFile, write_alignments
+from .matching import ReferenceIndex
+from .models import ColumnarAlignment
+from .syncer import sync_alignment, sync_columns
+
+
+# A task sent to the workers: record number, then either the raw JSONL line, or the characters, durations and reference of a binary record
+Task = tuple[int, str | None, str | None, array | None, str | None]
+
+# What the workers send back: number of synchronised characters, whether it succeeded, then the output line (JSONL),
+# the characters and durations (binary), or the failure line
+Result = tuple[int, bool, str | tuple[str, array]]
+
+# Set in every worker by `_init_worker`
+_options: dict[str, Any] = {}
+_reference: str | ReferenceIndex | None = None
+_output_format = "jsonl"
+
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the command line
+
+    Parameters:
+        argv: list[str] | None = None - arguments, defaults to the ones of the process
+
+    Returns:
+        int - exit code, 1 if a record failed
+    """
+
+    parser = argparse.ArgumentParser(prog="alsyncer", description="Synchronises alignments to their reference texts, in bulk")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="input files, - for stdin (JSONL only)")
+    parser.add_argument("--format", choices=("jsonl", "binary"), default="jsonl", help="format of the inputs")
+    parser.add_argument("--references", help="JSONL file of the reference texts of binary records, one string per line")
+    parser.add_argument("--reference-file", help="text file of the reference of every record without one")
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout")
+    parser.add_argument("--output-format", choices=("jsonl", "binary"), default="jsonl")
+    parser.add_argument("--failures", default="failures.jsonl", help="JSONL file of the failed records, - for stderr (then without summary)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="number of processes, defaults to the number of CPUs. With 1, runs in this process")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="records read ahead of the output, defaults to 4 per worker")
+    parser.add_argument("--progress", action="store_true", help="print the progress every second, not with --failures -")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't print the summary")
+
+    parser.add_argument("--words", action="store_true")
+    parser.add_argument("--anchors", action="store_true")
+    parser.add_argument("--matcher", choices=("greedy", "myers"), default="greedy")
+    parser.add_argument("--band", type=lambda value: value if value == "adaptive" else int(value), help="band width, or adaptive")
+    parser.add_argument("--verify", choices=("off", "cheap", "full"), default="off")
+    parser.add_argument("--backend", choices=("auto", "python", "numpy"), default="auto")
+    parser.add_argument("--exact", action="store_true")
+    parser.add_argument("--normalize", action="store_true", help="fit ignoring case, quotes, spacing and punctuation")
+    parser.add_argument("--no-round", action="store_true", help="keep floating point durations")
+    args = parser.parse_args(argv)
+
+    if args.format == "binary" and "-" in args.inputs:
+        parser.error("binary input must be read from files")
+    if args.format == "binary" and not (args.references or args.reference_file):
+        parser.error("binary input needs --references or --reference-file")
+    if args.output_format == "binary" and args.output == "-":
+        parser.error("binary output must be written to a file")
+    if args.progress and args.failures == "-":
+        parser.error("--progress writes to stderr, it needs the failures in a file")
+
+    workers = args.workers
+    if workers is None:
+        workers = os.cpu_count() or 1
+    max_in_flight = args.max_in_flight or 4 * workers
+
+    options = {
+        "round_alignment": not args.no_round,
+        "anchors": args.anchors,
+        "words": args.words,
+        "matcher": args.matcher,
+        "band": args.band,
+        "verify": args.verify,
+        "backend": args.backend,
+        "exact": args.exact,
+        "normalize": args.normalize,
+    }
+    reference = None
+    if args.reference_file:
+        with open(args.reference_file, encoding="utf-8") as file:
+            reference = file.read()
+
+    tasks = _read_jsonl(args.inputs) if args.format == "jsonl" else _read_binary(args.inputs, args.references)
+    progress = _Progress(sys.stderr if args.progress else None)
+
+    failures = sys.stderr if args.failures == "-" else open(args.failures, "w", encoding="utf-8")
+    try:
+        results = _process(tasks, workers, max_in_flight, options, reference, args.output_format)
+        successes = _successes(results, failures, progress)
+
+        if args.output_format == "binary":
+            write_alignments(args.output, (
+                _columnar(characters, durations) for characters, durations in successes
+            ))
+        else:
+            output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+            try:
+                for line in successes:
+                    output.write(line + "\n")
+            finally:
+                if output is not sys.stdout:
+                    output.close()
+    finally:
+        if failures is not sys.stderr:
+            failures.close()
+
+    # stderr only holds the failures then
+    if not args.quiet and failures is not sys.stderr:
+        progress.summary()
+
+    return 1 if progress.failed else 0
+
+
+
+class _Progress:
+    """
+    Counts the records and characters done, and prints the throughput
+    """
+
+    def __init__(self, stream: TextIO | None):
+        self.stream = stream
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.done = 0
+        self.failed = 0
+        self.characters = 0
+
+    def update(self, ok: bool, characters: int) -> None:
+        self.done += 1
+        self.failed += not ok
+        self.characters += characters
+
+        now = time.perf_counter()
+        if self.stream is not None and now - self.last >= 1:
+            self.last = now
+            self.stream.write(f"{self.done} records ({self.failed} failed), {self.done / (now - self.start):.0f} records/s\n")
+            self.stream.flush()
+
+    def summary(self) -> None:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        sys.stderr.write(
+            f"alsyncer: {self.done} records ({self.failed} failed) in {elapsed:.2f}s, "
+            f"{self.done / elapsed:.0f} records/s, {self.characters / elapsed:.0f} chars/s\n"
+        )
+
+
+
+def _columnar(characters: str, durations: array | list[int | float]) -> ColumnarAlignment:
+    """
+    Wraps synchronised columns for the binary output, without copying arrays again
+    """
+
+    if not isinstance(durations, array):
+        return ColumnarAlignment(characters, durations)
+
+    alignment = ColumnarAlignment()
+    alignment.characters = characters
+    alignment.durations = durations
+    return alignment
+
+
+def _read_jsonl(paths: list[str]) -> Iterator[Task]:
+    """
+    Reads the lines of the inputs, lazily, they are parsed in the workers
+    """
+
+    number = 0
+    for path in paths:
+        file = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            for line in file:
+                if not line.strip():
+                    continue
+                yield number, line, None, None, None
+                number += 1
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+
+def _read_binary(paths: list[str], references_path: str | None) -> Iterator[Task]:
+    """
+    Reads the records of binary inputs, lazily, with their references if given in a separate file
+    The durations are copied once from the file into an array, which is sent to the workers as it is
+    """
+
+    references = open(references_path, encoding="utf-8") if references_path else None
+    number = 0
+    try:
+        for path in paths:
+            with AlignmentFile(path) as alignments:
+                for k in range(len(alignments)):
+                    alignment = alignments[k]
+                    reference = None
+                    if references is not None:
+                        line = references.readline()
+                        reference = json.loads(line) if line.strip() else None
+                    yield number, None, alignment.characters, alignment.durations, reference
+                    number += 1
+    finally:
+        if references is not None:
+            references.close()
+
+
+def _process(
+        tasks: Iterator[Task], workers: int, max_in_flight: int,
+        options: dict[str, Any], reference: str | None, output_format: str
+    ) -> Iterator[Result]:
+    """
+    Runs the tasks on a process pool, with at most max_in_flight of them read ahead
+    Yields the results in input order
+    """
+
+    if workers == 1:
+        _init_worker(options, reference, output_format)
+        yield from map(_run_task, tasks)
+        return
+
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(options, reference, output_format)) as executor:
+        for task in tasks:
+            pending.append(executor.submit(_run_task, task))
+            # Wait for the oldest one, so the output stays in order and the memory stays bounded
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def _successes(results: Iterator[Result], failures: TextIO, progress: _Progress) -> Iterator[Any]:
+    """
+    Writes the failed records, and yields the output of the others
+    """
+
+    for characters, ok, output in results:
+        progress.update(ok, characters)
+        if ok:
+            yield output
+        else:
+            failures.write(output + "\n")
+
+
+
+def _init_worker(options: dict[str, Any], reference: str | None, output_format: str) -> None:
+    """
+    Sets the options of the worker, and indexes the shared reference once
+    """
+
+    global _options, _reference, _output_format
+
+    _options = options
+    _reference = ReferenceIndex(reference) if reference is not None else None
+    _output_format = output_format
+
+
+def _run_task(task: Task) -> Result:
+    """
+    Parses and synchronises one record in a worker
+    Errors are returned as a failure line instead of raised, so they can't stop the pool
+    """
+
+    number, line, characters, durations, reference = task
+    extra: dict[str, Any] = {}
+
+    try:
+        if line is not None:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise Exception("Record must be an object")
+            characters, durations = _parse_alignment(record.pop("alignment", None))
+            reference = record.pop("reference", None)
+            extra = record
+
+        if reference is None:
+            reference = _reference
+        if reference is None:
+            raise Exception("Record has no reference")
+        if not isinstance(reference, (str, ReferenceIndex)):
+            raise Exception("Reference must be a string")
+
+        if isinstance(durations, array):
+            # Binary records are synchronised in their columns directly
+            alignment = ColumnarAlignment()
+            alignment.characters = characters
+            alignment.durations = durations
+            sync_alignment(alignment, reference, **_options)
+            characters, durations = alignment.characters, alignment.durations
+        else:
+            characters, durations = sync_columns(characters, durations, reference, _options)
+    except Exception as e:
+        failure = {"record": number, "error": f"{type(e).__name__}: {e}"}
+        if line is not None:
+            failure["input"] = line.rstrip("\n")
+        return 0, False, json.dumps(failure, ensure_ascii=False)
+
+    if _output_format == "binary":
+        return len(characters), True, (characters, durations)
+
+    # Binary records store floats, the ones that are integers are given back as integers
+    if isinstance(durations, array):
+        durations = [int(duration) if duration.is_integer() else duration for duration in durations]
+
+    output = {"record": number, **extra, "alignment": [
+        {"character": char, "duration": duration}
+        for char, duration in zip(characters, durations)
+    ]}
+    return len(characters), True, json.dumps(output, ensure_ascii=False)
+
+
+def _parse_alignment(alignment: Any) -> tuple[str, list[int | float]]:
+    """
+    Checks an alignment parsed from JSON, returns its characters and durations
+    """
+
+    if not isinstance(alignment, list):
+        raise Exception("Record must have an alignment list")
+
+    characters = []
+    durations = []
+    for al in alignment:
+        character = al.get("character") if isinstance(al, dict) else None
+        duration = al.get("duration") if isinstance(al, dict) else None
+        if not isinstance(character, str) or len(character) != 1:
+            raise Exception(f"Invalid character alignment: {al}")
+        if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+            raise Exception(f"Invalid character alignment: {al}")
+        characters.append(character)
+        durations.append(duration)
+
+    return ''.join(characters), durations
+
+
+if __name__ == "__main__":
+    sys.exit(main())
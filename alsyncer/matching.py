@@ -0,0 +1,790 @@
+import bisect
+import re
+import sys
+from array import array
+from functools import lru_cache
+
+
+# Above this size (alignment length * reference length), the suffix automaton is used instead of the greedy scan
+AUTOMATON_THRESHOLD = 4096
+
+WORD_PATTERN = re.compile(r"\S+")
+
+# Starting width of the adaptive band, see `band_gaps`
+BAND_WIDTH = 64
+
+# Length of the substrings whose positions a `ReferenceIndex` keeps, to seed searches within a range of the reference text
+QGRAM_LENGTH = 6
+
+# Indexes kept by each process that receives them pickled, see `ReferenceIndex.__reduce__`
+UNPICKLED_INDEXES = 4
+
+# Above this many seed occurrences per searched character, an indexed search gives up for the automaton of the range (repetitive texts)
+SEED_BUDGET = 8
+
+
+
+class SuffixAutomaton:
+    """
+    Suffix automaton built once over a text
+    Answers "longest common substring with another text" in linear time of the other text
+
+    Only the part of the text within the given bounds is indexed, positions are still given in the whole text
+
+    Parameters:
+        text: str
+        start: int = 0
+        end: int | None = None
+    """
+
+    def __init__(self, text: str, start: int = 0, end: int | None = None):
+        self.text = text
+        self.start = start
+        self.end = len(text) if end is None else end
+
+        # State 0 is the initial state
+        self.transitions: list[dict[str, int]] = [{}]
+        self.links: list[int] = [-1]
+        self.lengths: list[int] = [0]
+        self.first_ends: list[int] = [-1] # End index of the first occurrence of the strings of each state
+
+        last = 0
+        for i in range(self.start, self.end):
+            last = self._extend(last, text[i], i)
+
+    def _extend(self, last: int, char: str, i: int) -> int:
+        """
+        Extends the automaton with one character
+        Returns the new last state
+        """
+
+        transitions = self.transitions
+        links = self.links
+        lengths = self.lengths
+
+        current = len(lengths)
+        transitions.append({})
+        links.append(0)
+        lengths.append(lengths[last] + 1)
+        self.first_ends.append(i)
+
+        state = last
+        while state != -1 and char not in transitions[state]:
+            transitions[state][char] = current
+            state = links[state]
+
+        if state == -1:
+            return current
+
+        next_state = transitions[state][char]
+        if lengths[state] + 1 == lengths[next_state]:
+            links[current] = next_state
+            return current
+
+        # Split the state by cloning it
+        clone = len(lengths)
+        transitions.append(dict(transitions[next_state]))
+        links.append(links[next_state])
+        lengths.append(lengths[state] + 1)
+        self.first_ends.append(self.first_ends[next_state])
+
+        while state != -1 and transitions[state].get(char) == next_state:
+            transitions[state][char] = clone
+            state = links[state]
+
+        links[next_state] = clone
+        links[current] = clone
+        return current
+
+    def longest_common_substring(self, text: str, start: int = 0, end: int | None = None) -> tuple[int, int, int]:
+        """
+        Finds the longest substring of the given text (within the given bounds) that appears in the automaton text
+        Ties are broken like the greedy scan: leftmost in the given text, then first occurrence in the automaton text
+
+        Parameters:
+            text: str
+            start: int = 0
+            end: int | None = None
+
+        Returns:
+            tuple[int, int, int] - start in the given text, start in the automaton text, and length (0 if nothing matches)
+        """
+
+        transitions = self.transitions
+        links = self.links
+        lengths = self.lengths
+
+        best_length = 0
+        best_end = -1
+        best_state = 0
+
+        if end is None:
+            end = len(text)
+
+        state = 0
+        length = 0
+        for i in range(start, end):
+            char = text[i]
+            while state != 0 and char not in transitions[state]:
+                state = links[state]
+                length = lengths[state]
+
+            if char in transitions[state]:
+                state = transitions[state][char]
+                length += 1
+            else:
+                state = 0
+                length = 0
+
+            # Strictly greater keeps the leftmost window
+            if length > best_length:
+                best_length = length
+                best_end = i
+                best_state = state
+
+        if not best_length:
+            return start, self.start, 0
+
+        # All the strings of a state share their end positions, so the first one also holds for this substring
+        return (
+            best_end - best_length + 1,
+            self.first_ends[best_state] - best_length + 1,
+            best_length
+        )
+
+
+
+def greedy_longest_common_substring(
+        alignment_text: str, reference_text: str,
+        alignment_start: int, alignment_end: int,
+        reference_start: int, reference_end: int
+    ) -> tuple[int, int, int]:
+    """
+    Finds the longest common substring by scanning every length from the longest possible one
+    For each length, windows are taken from left to right and indexed in the reference text
+    Only the parts of the texts within the given bounds are searched
+
+    Parameters:
+        alignment_text: str
+        reference_text: str
+        alignment_start: int
+        alignment_end: int
+        reference_start: int
+        reference_end: int
+
+    Returns:
+        tuple[int, int, int] - start in the alignment text, start in the reference text, and length (0 if nothing matches)
+    """
+
+    # Start fitting with the minimum length
+    min_length = min(alignment_end - alignment_start, reference_end - reference_start)
+
+    # Regressively fit until there is nothing anymore
+    for current_length in range(min_length, 0, -1):
+
+        # Progressively cut substrings from left to right
+        for start_i in range(alignment_start, alignment_end - current_length + 1):
+            substring = alignment_text[start_i:start_i+current_length]
+
+            # Try to index them in the reference text
+            pos = reference_text.find(substring, reference_start, reference_end)
+            if pos != -1:
+                return start_i, pos, current_length
+
+    return alignment_start, reference_start, 0
+
+
+
+def longest_common_substring(
+        alignment_text: str, reference_text: str,
+        engine: str = "auto",
+        alignment_start: int = 0, alignment_end: int | None = None,
+        reference_start: int = 0, reference_end: int | None = None,
+        index: "ReferenceIndex | None" = None
+    ) -> tuple[int, int, int]:
+    """
+    Finds the longest common substring of the alignment text and the reference text with the given engine
+    Only the parts of the texts within the given bounds are searched, and returned positions are in the whole texts
+    Every engine returns the same result
+
+    Parameters:
+        alignment_text: str
+        reference_text: str
+        engine: str = "auto" - "greedy", "automaton", or "auto" to pick the automaton on large inputs
+        alignment_start: int = 0
+        alignment_end: int | None = None
+        reference_start: int = 0
+        reference_end: int | None = None
+        index: ReferenceIndex | None = None - prebuilt index of the reference text, its automaton is used when the whole reference text is searched
+
+    Returns:
+        tuple[int, int, int] - start in the alignment text, start in the reference text, and length (0 if nothing matches)
+    """
+
+    if alignment_end is None:
+        alignment_end = len(alignment_text)
+    if reference_end is None:
+        reference_end = len(reference_text)
+
+    # The prebuilt automaton gives the same result as any engine
+    if index is not None and engine in ("auto", "automaton") and reference_start == 0 and reference_end == len(index.text):
+        return index.automaton.longest_common_substring(alignment_text, alignment_start, alignment_end)
+
+    if engine == "auto":
+        size = (alignment_end - alignment_start) * (reference_end - reference_start)
+        engine = "automaton" if size > AUTOMATON_THRESHOLD else "greedy"
+
+    # Ranges of the reference text are searched from the positions of its substrings, without building anything
+    if index is not None and engine == "automaton":
+        found = indexed_longest_common_substring(
+            alignment_text, index,
+            alignment_start, alignment_end,
+            reference_start, reference_end
+        )
+        if found is not None:
+            return found
+
+    if engine == "greedy":
+        return greedy_longest_common_substring(
+            alignment_text, reference_text,
+            alignment_start, alignment_end,
+            reference_start, reference_end
+        )
+
+    if engine == "automaton":
+        automaton = SuffixAutomaton(reference_text, reference_start, reference_end)
+        return automaton.longest_common_substring(alignment_text, alignment_start, alignment_end)
+
+    raise Exception(f"Unknown matching engine: {engine}")
+
+
+
+def indexed_longest_common_substring(
+        alignment_text: str, index: "ReferenceIndex",
+        alignment_start: int, alignment_end: int,
+        reference_start: int, reference_end: int
+    ) -> tuple[int, int, int] | None:
+    """
+    Finds the longest common substring within a range of the indexed reference text, from the positions of its q-grams
+    Gives the same result as the other engines, but only when it is at least `QGRAM_LENGTH` long. Returns None otherwise,
+    or when the texts are so repetitive that the seeds cost more than building an automaton of the range
+
+    Every match of at least the best length so far holds a q-gram starting at one of the alignment positions taken every
+    (best length - QGRAM_LENGTH + 1) characters, so only those are looked up. Their occurrences within the range are found by bisection,
+    and each one is extended both ways to the whole match
+
+    Parameters:
+        alignment_text: str
+        index: ReferenceIndex
+        alignment_start: int
+        alignment_end: int
+        reference_start: int
+        reference_end: int
+
+    Returns:
+        tuple[int, int, int] | None - start in the alignment text, start in the reference text, and length
+    """
+
+    reference_text = index.text
+    qgrams = index.qgrams
+    q = QGRAM_LENGTH
+
+    budget = SEED_BUDGET * (alignment_end - alignment_start + reference_end - reference_start)
+    last_qgram = reference_end - q # Last reference position a q-gram can start at
+
+    # Best match as (length, alignment start, reference start), and the end of the last match found on each diagonal
+    best_length = 0
+    best_start = 0
+    best_pos = 0
+    extended: dict[int, int] = {}
+
+    i = alignment_start
+    while i <= alignment_end - q:
+        positions = qgrams.get(alignment_text[i:i+q])
+        if positions is not None:
+            first = bisect.bisect_left(positions, reference_start)
+            last = bisect.bisect_right(positions, last_qgram)
+
+            budget -= last - first
+            if budget < 0:
+                return None
+
+            for k in range(first, last):
+                pos = positions[k]
+                diagonal = i - pos
+
+                # Already inside a match found from another seed
+                if extended.get(diagonal, -1) > i:
+                    continue
+
+                start = i - _common_suffix(alignment_text, alignment_start, i, reference_text, reference_start, pos)
+                end = i + q + _common_prefix(alignment_text, i + q, alignment_end, reference_text, pos + q, reference_end)
+                extended[diagonal] = end
+
+                # Longest first, then leftmost in the alignment text, then first in the reference text
+                length = end - start
+                if (
+                    length > best_length or
+                    (length == best_length and (start, start - diagonal) < (best_start, best_pos))
+                ):
+                    best_length = length
+                    best_start = start
+                    best_pos = start - diagonal
+
+        i += max(1, best_length - q + 1)
+
+    if best_length < q:
+        return None
+
+    return best_start, best_pos, best_length
+
+
+def _common_prefix(text: str, start: int, end: int, other_text: str, other_start: int, other_end: int) -> int:
+    """
+    Returns the length of the common prefix of text[start:end] and other_text[other_start:other_end]
+    Compares growing slices, then narrows down on the first difference
+    """
+
+    limit = min(end - start, other_end - other_start)
+
+    length = 0
+    step = 8
+    while length < limit:
+        size = min(step, limit - length)
+        if text[start+length:start+length+size] == other_text[other_start+length:other_start+length+size]:
+            length += size
+            step *= 2
+        elif size == 1:
+            break
+        else:
+            step = size // 2
+
+    return length
+
+
+def _common_suffix(text: str, start: int, end: int, other_text: str, other_start: int, other_end: int) -> int:
+    """
+    Returns the length of the common suffix of text[start:end] and other_text[other_start:other_end]
+    """
+
+    limit = min(end - start, other_end - other_start)
+
+    length = 0
+    step = 8
+    while length < limit:
+        size = min(step, limit - length)
+        if text[end-length-size:end-length] == other_text[other_end-length-size:other_end-length]:
+            length += size
+            step *= 2
+        elif size == 1:
+            break
+        else:
+            step = size // 2
+
+    return length
+
+
+
+def band_gaps(
+        alignment_text: str, reference_text: str,
+        alignment_start: int, alignment_end: int,
+        reference_start: int, reference_end: int,
+        band: int | str, engine: str = "auto"
+    ) -> list[tuple[int, int, int, int]]:
+    """
+    Sweeps both texts along their diagonal, matching the longest common substring within a window of the band width ahead of the last match
+    Returns the gaps left between the matches, to be fitted on their own, so the cost stays around O(N * band) on long texts
+    When nothing matches in the band, the rest of the texts is returned as one gap, to be searched in full
+
+    The matches are only the longest within their window, so the fit may differ from a search over the whole texts
+
+    Parameters:
+        alignment_text: str
+        reference_text: str
+        alignment_start: int
+        alignment_end: int
+        reference_start: int
+        reference_end: int
+        band: int | str - width of the window, or "adaptive" to start at `BAND_WIDTH`,
+                          widen it to the last gap (drift) between matches, and double it when nothing matches
+        engine: str = "auto" - see `longest_common_substring`
+
+    Returns:
+        list[tuple[int, int, int, int]] - bounds of the gaps, in order
+    """
+
+    adaptive = band == "adaptive"
+    if adaptive:
+        width = BAND_WIDTH
+    elif isinstance(band, int) and band >= 1:
+        width = band
+    else:
+        raise Exception(f"Invalid band: {band}")
+
+    gaps: list[tuple[int, int, int, int]] = []
+
+    i = alignment_start
+    j = reference_start
+    while alignment_end - i > width or reference_end - j > width:
+        start_i, pos, length = longest_common_substring(
+            alignment_text, reference_text, engine,
+            i, min(alignment_end, i + width),
+            j, min(reference_end, j + width)
+        )
+
+        if not length:
+            if adaptive:
+                width *= 2
+                continue
+            break
+
+        if start_i != i or pos != j:
+            gaps.append((i, start_i, j, pos))
+
+        if adaptive:
+            width = max(BAND_WIDTH, 2 * max(start_i - i, pos - j))
+
+        i = start_i + length
+        j = pos + length
+
+    if i != alignment_end or j != reference_end:
+        gaps.append((i, alignment_end, j, reference_end))
+
+    return gaps
+
+
+
+def myers_diff(
+        alignment_text: str, reference_text: str,
+        alignment_start: int = 0, alignment_end: int | None = None,
+        reference_start: int = 0, reference_end: int | None = None
+    ) -> tuple[list[int], list[int]]:
+    """
+    Finds a shortest edit script between the texts with Myers' O((N+M)D) algorithm, in linear memory
+    Each box of the edit graph is split at its middle snake (Hirschberg-style), and the two halves are solved on their own
+    Only the parts of the texts within the given bounds are compared
+
+    Contrary to the longest common substring search, it always gives the fewest additions plus missing chars,
+    but may split a long common substring to do so
+
+    Parameters:
+        alignment_text: str
+        reference_text: str
+        alignment_start: int = 0
+        alignment_end: int | None = None
+        reference_start: int = 0
+        reference_end: int | None = None
+
+    Returns:
+        tuple[list[int], list[int]] - additions in the alignment text and missing chars from the reference text, sorted
+    """
+
+    if alignment_end is None:
+        alignment_end = len(alignment_text)
+    if reference_end is None:
+        reference_end = len(reference_text)
+
+    additions: list[int] = []
+    missing: list[int] = []
+
+    # Boxes of the edit graph left to solve, as (left, top, right, bottom)
+    # Left and right are bounds in the alignment text, top and bottom in the reference text
+    stack = [(alignment_start, reference_start, alignment_end, reference_end)]
+
+    while stack:
+        left, top, right, bottom = stack.pop()
+
+        # Skip the common prefix and suffix
+        while left < right and top < bottom and alignment_text[left] == reference_text[top]:
+            left += 1
+            top += 1
+        while left < right and top < bottom and alignment_text[right-1] == reference_text[bottom-1]:
+            right -= 1
+            bottom -= 1
+
+        if left == right or top == bottom:
+            additions.extend(range(left, right))
+            missing.extend(range(top, bottom))
+            continue
+
+        start_x, start_y, end_x, end_y, forward = _middle_snake(alignment_text, reference_text, left, top, right, bottom)
+
+        # The snake is one edit and a diagonal, the edit comes first if it was found going forward
+        if end_x - start_x > end_y - start_y:
+            additions.append(start_x if forward else end_x - 1)
+        elif end_y - start_y > end_x - start_x:
+            missing.append(start_y if forward else end_y - 1)
+
+        stack.append((end_x, end_y, right, bottom))
+        stack.append((left, top, start_x, start_y))
+
+    # Each box gives its edits on its own, in no particular order between boxes
+    additions.sort()
+    missing.sort()
+
+    return additions, missing
+
+
+def _middle_snake(
+        alignment_text: str, reference_text: str,
+        left: int, top: int, right: int, bottom: int
+    ) -> tuple[int, int, int, int, bool]:
+    """
+    Finds the middle snake of a box of the edit graph, searching from both corners at once
+    Returns its start and end points, and whether it was found going forward
+    """
+
+    width = right - left
+    height = bottom - top
+    delta = width - height
+    odd = delta % 2 == 1
+    max_d = (width + height + 1) // 2
+
+    # Furthest x reached forward on each diagonal k, and furthest y reached backward on each diagonal c
+    # Negative diagonals wrap around to the end of the lists
+    forward_x = [0] * (2 * max_d + 2)
+    backward_y = [0] * (2 * max_d + 2)
+    forward_x[1] = left
+    backward_y[1] = bottom
+
+    for d in range(max_d + 1):
+
+        for k in range(d, -d - 1, -2):
+            if k == -d or (k != d and forward_x[k-1] < forward_x[k+1]):
+                previous_x = x = forward_x[k+1] # Down
+            else:
+                previous_x = forward_x[k-1] # Right
+                x = previous_x + 1
+            y = top + (x - left) - k
+            previous_y = y if d == 0 or x != previous_x else y - 1
+
+            while x < right and y < bottom and alignment_text[x] == reference_text[y]:
+                x += 1
+                y += 1
+            forward_x[k] = x
+
+            c = k - delta
+            if odd and -(d - 1) <= c <= d - 1 and y >= backward_y[c]:
+                return previous_x, previous_y, x, y, True
+
+        for c in range(d, -d - 1, -2):
+            if c == -d or (c != d and backward_y[c-1] > backward_y[c+1]):
+                previous_y = y = backward_y[c+1] # Up
+            else:
+                previous_y = backward_y[c-1] # Left
+                y = previous_y - 1
+            x = left + (y - top) + c + delta
+            previous_x = x if d == 0 or y != previous_y else x + 1
+
+            while x > left and y > top and alignment_text[x-1] == reference_text[y-1]:
+                x -= 1
+                y -= 1
+            backward_y[c] = y
+
+            k = c + delta
+            if not odd and -d <= k <= d and x <= forward_x[k]:
+                return x, y, previous_x, previous_y, False
+
+    raise Exception("No middle snake found") # Can't happen, the box always has a path
+
+
+
+def unique_anchors(alignment_text: str, reference_text: str, reference_words: dict[str, int] | None = None) -> list[tuple[int, int, int]]:
+    """
+    Finds words that occur exactly once in both texts, and keeps the longest chain of them that is in the same order in both
+    Those are safe matches that split the fitting into small independent gaps (patience-style)
+
+    Parameters:
+        alignment_text: str
+        reference_text: str
+        reference_words: dict[str, int] | None = None - unique words of the reference text if already known, see `ReferenceIndex`
+
+    Returns:
+        list[tuple[int, int, int]] - start in the alignment text, start in the reference text, and length of each anchor, in order
+    """
+
+    alignment_words = _unique_words(alignment_text)
+    if reference_words is None:
+        reference_words = _unique_words(reference_text)
+
+    # Words unique in both, in the order of the alignment text
+    pairs = [
+        (alignment_start, reference_words[word], len(word))
+        for word, alignment_start in alignment_words.items()
+        if word in reference_words
+    ]
+    pairs.sort()
+
+    # Longest increasing chain of reference positions (patience sorting)
+    # Each pile keeps the index of the pair ending the best chain of that size
+    pile_tops: list[int] = []
+    pile_positions: list[int] = []
+    previous: list[int] = []
+    for i, (_, reference_start, _) in enumerate(pairs):
+        pile = bisect.bisect_left(pile_positions, reference_start)
+        previous.append(pile_tops[pile-1] if pile else -1)
+
+        if pile == len(pile_tops):
+            pile_tops.append(i)
+            pile_positions.append(reference_start)
+        else:
+            pile_tops[pile] = i
+            pile_positions[pile] = reference_start
+
+    chain: list[tuple[int, int, int]] = []
+    i = pile_tops[-1] if pile_tops else -1
+    while i != -1:
+        chain.append(pairs[i])
+        i = previous[i]
+    chain.reverse()
+
+    return chain
+
+
+def _unique_words(text: str) -> dict[str, int]:
+    """
+    Returns the words that occur exactly once in the text, with their start index
+    """
+
+    starts: dict[str, int] = {}
+    repeated: set[str] = set()
+    for match in WORD_PATTERN.finditer(text):
+        word = match.group()
+        if word in starts:
+            repeated.add(word)
+        else:
+            starts[word] = match.start()
+
+    for word in repeated:
+        del starts[word]
+
+    return starts
+
+
+
+def tokenize_words(*texts: str) -> list[tuple[str, list[tuple[int, int]]]]:
+    """
+    Turns each text into a token string where every word is a single character, shared between the texts
+    Comparing tokens is then just comparing integers, and every engine can be used on the token strings directly
+
+    Parameters:
+        *texts: str
+
+    Returns:
+        list[tuple[str, list[tuple[int, int]]]] - token string and (start, end) span of each word, for each text
+    """
+
+    ids: dict[str, int] = {}
+    return [_tokenize(text, ids) for text in texts]
+
+
+def _tokenize(text: str, ids: dict[str, int], shared: dict[str, int] | None = None) -> tuple[str, list[tuple[int, int]]]:
+    """
+    Tokenizes one text, adding its new words to the ids
+    Words of the shared ids are looked up first, those are never modified
+    """
+
+    if shared is None:
+        shared = {}
+
+    codes: list[str] = []
+    spans: list[tuple[int, int]] = []
+    for match in WORD_PATTERN.finditer(text):
+        word = match.group()
+        code = shared.get(word)
+        if code is None:
+            code = ids.get(word)
+        if code is None:
+            code = ids[word] = len(shared) + len(ids)
+            if code > sys.maxunicode:
+                raise Exception("Too many distinct words to tokenize")
+        codes.append(chr(code))
+        spans.append(match.span())
+
+    return ''.join(codes), spans
+
+
+
+class ReferenceIndex:
+    """
+    Index of a reference text, built once and reused by every alignment synchronised to it
+    Holds the suffix automaton of the whole text, the positions of its q-grams to search ranges of it,
+    its unique words for anchors, and its word tokens for word fitting, so those don't depend on the reference text anymore for each alignment
+
+    Immutable once built, and only read afterwards, so it can be shared between threads
+
+    Parameters:
+        text: str
+        words: bool = True - whether to also index the words, for `anchors` and `words` fitting
+    """
+
+    __slots__ = ("text", "automaton", "qgrams", "unique_words", "word_ids", "word_spans", "word_index")
+
+    def __init__(self, text: str, words: bool = True):
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "automaton", SuffixAutomaton(text))
+
+        # Sorted positions of every substring of QGRAM_LENGTH characters, see `indexed_longest_common_substring`
+        qgrams: dict[str, list[int]] = {}
+        for i in range(len(text) - QGRAM_LENGTH + 1):
+            qgram = text[i:i+QGRAM_LENGTH]
+            positions = qgrams.get(qgram)
+            if positions is None:
+                qgrams[qgram] = [i]
+            else:
+                positions.append(i)
+        object.__setattr__(self, "qgrams", {qgram: array('q', positions) for qgram, positions in qgrams.items()})
+
+        unique_words: dict[str, int] | None = None
+        word_ids: dict[str, int] | None = None
+        word_spans: list[tuple[int, int]] | None = None
+        word_index: ReferenceIndex | None = None
+
+        if words:
+            unique_words = _unique_words(text)
+            word_ids = {}
+            word_tokens, word_spans = _tokenize(text, word_ids)
+            word_index = ReferenceIndex(word_tokens, words=False)
+
+        object.__setattr__(self, "unique_words", unique_words)
+        object.__setattr__(self, "word_ids", word_ids)
+        object.__setattr__(self, "word_spans", word_spans)
+        object.__setattr__(self, "word_index", word_index)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise Exception("ReferenceIndex is immutable")
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"ReferenceIndex({self.text!r})"
+
+    def __reduce__(self) -> tuple:
+        # Only the text is sent to another process, which builds the index once and reuses it for the next tasks
+        return _unpickle_index, (self.text, self.word_index is not None)
+
+    def tokenize(self, text: str) -> tuple[str, list[tuple[int, int]]]:
+        """
+        Tokenizes another text with the same tokens as the words of the reference text, see `tokenize_words`
+
+        Parameters:
+            text: str
+
+        Returns:
+            tuple[str, list[tuple[int, int]]] - token string and (start, end) span of each word
+        """
+
+        if self.word_ids is None:
+            raise Exception("Words of the reference text are not indexed")
+
+        return _tokenize(text, {}, self.word_ids)
+
+
+@lru_cache(maxsize=UNPICKLED_INDEXES)
+def _unpickle_index(text: str, words: bool) -> ReferenceIndex:
+    """
+    Builds the index of a text received from another process, or returns the one already built for it
+    """
+
+    return ReferenceIndex(text, words)
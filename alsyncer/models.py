@@ -1,3 +1,7 @@
+from array import array
+from dataclasses import dataclass
+from typing import Iterable
+
 from pydantic import BaseModel
 
 
@@ -8,4 +12,111 @@ class CharAlignment(BaseModel):
     character: str
     duration: int | float # ms
 
-Alignment = list[CharAlignment]
\ No newline at end of file
+Alignment = list[CharAlignment]
+
+
+
+@dataclass(slots=True, eq=False)
+class FastCharAlignment:
+    """
+    Lightweight drop-in for `CharAlignment`, with the same fields but no pydantic validation on construction
+    Much faster to build and smaller in memory. Use `FastCharAlignment.validated` where inputs come from outside (API boundaries)
+    Compares equal to a `CharAlignment` with the same character and duration
+    """
+
+    character: str
+    duration: int | float # ms
+
+    @classmethod
+    def validated(cls, character: str, duration: int | float) -> "FastCharAlignment":
+        """
+        Builds a character alignment, validated like a `CharAlignment`
+
+        Parameters:
+            character: str
+            duration: int | float
+
+        Returns:
+            FastCharAlignment
+        """
+
+        model = CharAlignment(character=character, duration=duration)
+        return cls(model.character, model.duration)
+
+    def to_model(self) -> CharAlignment:
+        """
+        Converts to a validated `CharAlignment`
+
+        Returns:
+            CharAlignment
+        """
+
+        return CharAlignment(character=self.character, duration=self.duration)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (FastCharAlignment, CharAlignment)):
+            return NotImplemented
+        return self.character == other.character and self.duration == other.duration
+
+
+
+class ColumnarAlignment:
+    """
+    Array-backed alignment: all the characters in one string, and all the durations in one array of doubles
+    Much lighter than a list of `CharAlignment` on long transcripts, and accepted by every stage of `sync_alignment`
+
+    Parameters:
+        characters: str = ""
+        durations: Iterable[int | float] = ()
+    """
+
+    __slots__ = ("characters", "durations")
+
+    def __init__(self, characters: str = "", durations: Iterable[int | float] = ()):
+        self.characters = characters
+        self.durations = array('d', durations)
+
+        if len(self.characters) != len(self.durations):
+            raise Exception("There must be as many durations as characters")
+
+    @classmethod
+    def from_alignment(cls, alignment: Alignment) -> "ColumnarAlignment":
+        """
+        Converts a list of `CharAlignment` to a columnar alignment
+
+        Parameters:
+            alignment: Alignment
+
+        Returns:
+            ColumnarAlignment
+        """
+
+        return cls(
+            ''.join(al.character for al in alignment),
+            [al.duration for al in alignment]
+        )
+
+    def to_alignment(self) -> Alignment:
+        """
+        Converts back to a list of `CharAlignment`
+        NOTE: Durations are stored as floats, the ones that are integers are given back as integers
+
+        Returns:
+            Alignment
+        """
+
+        return [
+            CharAlignment(character=char, duration=int(duration) if duration.is_integer() else duration)
+            for char, duration in zip(self.characters, self.durations)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.characters)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnarAlignment):
+            return NotImplemented
+        return self.characters == other.characters and self.durations == other.durations
+
+    def __repr__(self) -> str:
+        return f"ColumnarAlignment(characters={self.characters!r}, durations={self.durations.tolist()!r})"
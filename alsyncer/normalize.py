@@ -0,0 +1,88 @@
+import re
+import unicodedata
+from array import array
+
+
+# Typographic quotes and dashes, folded to their ASCII counterpart
+QUOTES = str.maketrans({
+    "‘": "'", "’": "'", "‚": "'", "‛": "'", "′": "'", "´": "'", "`": "'",
+    "“": '"', "”": '"', "„": '"', "‟": '"', "″": '"', "«": '"', "»": '"',
+    "‐": "-", "‑": "-", "‒": "-", "–": "-", "—": "-", "−": "-",
+})
+
+SPACE_PATTERN = re.compile(r"\s")
+
+
+
+class NormalizedText:
+    """
+    Normalized views of a text, to fit texts that only differ by case, quotes, spacing or punctuation
+    Built once per text, both views keep a constant-time map back to the indexes of the original text
+
+    `folded` has the same length as the text, each character folded on its own (lowercase, straight quotes, whitespace as a space),
+    so its indexes are the original ones.
+    `normalized` is the folded text without punctuation and with whitespace runs collapsed to a single space,
+    `offsets[i]` is the index in the original text of its character i
+
+    Parameters:
+        text: str
+        case: bool = True - whether to ignore case
+        quotes: bool = True - whether to fold typographic quotes and dashes to ASCII ones
+        spaces: bool = True - whether to treat any whitespace as a space, and collapse runs of it
+        punctuation: bool = True - whether to leave punctuation out of the normalized view
+    """
+
+    __slots__ = ("text", "folded", "normalized", "offsets")
+
+    def __init__(self, text: str, case: bool = True, quotes: bool = True, spaces: bool = True, punctuation: bool = True):
+        self.text = text
+        self.folded = _fold(text, case, quotes, spaces)
+
+        # Punctuation is found once per distinct character
+        dropped = {
+            char for char in set(self.folded)
+            if punctuation and unicodedata.category(char).startswith("P")
+        }
+
+        characters: list[str] = []
+        self.offsets = array('q')
+        previous_space = False
+        for i, char in enumerate(self.folded):
+            if char in dropped:
+                continue
+
+            if spaces and char == " ":
+                if previous_space:
+                    continue
+                previous_space = True
+            else:
+                previous_space = False
+
+            characters.append(char)
+            self.offsets.append(i)
+
+        self.normalized = ''.join(characters)
+
+    def __len__(self) -> int:
+        return len(self.normalized)
+
+
+
+def _fold(text: str, case: bool, quotes: bool, spaces: bool) -> str:
+    """
+    Folds each character of the text on its own, keeping its length
+    """
+
+    if quotes:
+        text = text.translate(QUOTES)
+    if spaces:
+        text = SPACE_PATTERN.sub(" ", text)
+
+    if case:
+        lowered = text.lower()
+        # Some characters lowercase to several ones, those are left as they are
+        if len(lowered) != len(text):
+            lowered = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+        text = lowered
+
+    return text
@@ -0,0 +1,240 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .matching import ReferenceIndex, longest_common_substring
+from .models import Alignment, ColumnarAlignment, FastCharAlignment
+from .syncer import _add_missing, _check_synchronised, _fit_ranges, _initial_ranges, _remove_additions
+from .utils import get_alignment_duration, get_alignment_text, get_char_factory, get_durations, round_alignment as round_alignment_func
+
+
+# Ranges smaller than this (alignment plus reference length) are not split further before being sent to the workers
+MIN_SPLIT = 256
+
+Range = tuple[int, int, int, int]
+
+# What is sent to the workers: characters, durations and reference text of the segment, its ranges to fit (as a work stack),
+# whether the alignment is columnar, the engine, matcher and backend
+SegmentPayload = tuple[str, list[int | float], str, list[Range], bool, str, str, str]
+
+
+
+def sync_parallel(
+        alignment: Alignment | ColumnarAlignment, reference_text: str | ReferenceIndex,
+        workers: int | None = None,
+        segments: int | None = None,
+        round_alignment: bool = True,
+        anchors: bool = False,
+        words: bool = False,
+        engine: str = "auto",
+        matcher: str = "greedy",
+        band: int | str | None = None,
+        verify: str = "off",
+        backend: str = "auto"
+    ) -> None:
+    """
+    Synchronises one long alignment, fitting and distributing independent segments of it on a process pool
+    Gives exactly the same alignment as `sync_alignment` with the same options
+
+    The first matches are found here, like the fitting would, until there are enough independent ranges left.
+    The texts are then cut inside matches, between two characters matched one after the other:
+    no duration is distributed across such a cut, so each segment is distributed on its own, like in `StreamingSyncer`.
+    Each worker only gets the characters, durations and reference text of its segment. The rounding is done here, in order
+
+    With the Myers matcher, ranges can't be split further, so only anchors, words or a band give several segments
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+        reference_text: str | ReferenceIndex
+        workers: int | None = None - number of processes, defaults to the number of CPUs. With 1, runs in this process
+        segments: int | None = None - number of segments to aim for, defaults to 4 per worker
+        round_alignment: bool = True
+        anchors: bool = False
+        words: bool = False
+        engine: str = "auto"
+        matcher: str = "greedy"
+        band: int | str | None = None
+        verify: str = "off" - "off", "cheap" or "full", see `sync_alignment`
+        backend: str = "auto"
+    """
+
+    if verify not in ("off", "cheap", "full"):
+        raise Exception(f"Unknown verify mode: {verify}")
+    if matcher not in ("greedy", "myers"):
+        raise Exception(f"Unknown matcher: {matcher}")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if segments is None:
+        segments = 4 * workers
+
+    index = None
+    if isinstance(reference_text, ReferenceIndex):
+        index = reference_text
+        reference_text = index.text
+
+    alignment_text = get_alignment_text(alignment)
+    durations = get_durations(alignment)
+
+    og_alignment_duration = get_alignment_duration(alignment) if verify == "full" else None
+    original_durations = list(durations) if verify == "full" else None
+
+    # Ranges in order, first one first
+    ranges = _initial_ranges(alignment_text, reference_text, engine, anchors, words, matcher, band, index, None)
+    ranges.reverse()
+
+    if matcher == "greedy":
+        ranges = _split_ranges(alignment_text, reference_text, ranges, segments, engine)
+
+    columnar = isinstance(alignment, ColumnarAlignment)
+    payloads: list[SegmentPayload] = []
+    for alignment_start, alignment_end, reference_start, reference_end, segment_ranges in _segments(
+            len(alignment_text), len(reference_text), ranges, segments
+        ):
+        # Ranges are given relative to the segment, as a work stack
+        stack = [
+            (range_alignment_start - alignment_start, range_alignment_end - alignment_start,
+             range_reference_start - reference_start, range_reference_end - reference_start)
+            for range_alignment_start, range_alignment_end, range_reference_start, range_reference_end in reversed(segment_ranges)
+        ]
+        payloads.append((
+            alignment_text[alignment_start:alignment_end],
+            [durations[i] for i in range(alignment_start, alignment_end)],
+            reference_text[reference_start:reference_end],
+            stack, columnar, engine, matcher, backend
+        ))
+
+    if workers == 1 or len(payloads) == 1:
+        results = list(map(_sync_segment, payloads))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_sync_segment, payloads))
+
+    # Stitch the segments back in order
+    characters = ''.join(segment_characters for segment_characters, _, _ in results)
+    if columnar:
+        alignment.characters = characters
+        alignment.durations = array('d')
+        for _, segment_durations, _ in results:
+            alignment.durations.extend(segment_durations)
+    else:
+        new_char = get_char_factory(alignment)
+        alignment[:] = [
+            new_char(character=char, duration=duration)
+            for char, duration in zip(characters, (duration for _, segment_durations, _ in results for duration in segment_durations))
+        ]
+    change = sum(segment_change for _, _, segment_change in results)
+
+    if round_alignment:
+        # The bias left is what rounding took from the total
+        change -= round_alignment_func(alignment, backend=backend)
+
+    if verify != "off":
+        _check_synchronised(alignment, reference_text, alignment_text, verify, change, og_alignment_duration, original_durations)
+
+
+
+def _split_ranges(alignment_text: str, reference_text: str, ranges: list[Range], segments: int, engine: str) -> list[Range]:
+    """
+    Splits the largest ranges around their longest common substring, like the fitting does, until there are enough of them
+    Returns the ranges left, in order
+    """
+
+    ranges = list(ranges)
+    unsplittable: set[Range] = set()
+
+    while len(ranges) < segments:
+        candidates = [
+            (bounds[1] - bounds[0] + bounds[3] - bounds[2], i)
+            for i, bounds in enumerate(ranges)
+            if bounds not in unsplittable
+        ]
+        if not candidates:
+            break
+
+        size, i = max(candidates)
+        if size < MIN_SPLIT:
+            break
+
+        alignment_start, alignment_end, reference_start, reference_end = ranges[i]
+        start_i, pos, length = longest_common_substring(
+            alignment_text, reference_text, engine,
+            alignment_start, alignment_end,
+            reference_start, reference_end
+        )
+
+        # Nothing in common, the fitting will take it whole
+        if not length:
+            unsplittable.add(ranges[i])
+            continue
+
+        parts: list[Range] = []
+        if start_i != alignment_start or pos != reference_start:
+            parts.append((alignment_start, start_i, reference_start, pos))
+        if start_i + length < alignment_end or pos + length < reference_end:
+            parts.append((start_i + length, alignment_end, pos + length, reference_end))
+        ranges[i:i+1] = parts
+
+    return ranges
+
+
+def _segments(
+        alignment_length: int, reference_length: int, ranges: list[Range], segments: int
+    ) -> list[tuple[int, int, int, int, list[Range]]]:
+    """
+    Groups the ranges into segments of about the same size
+    Segments are cut in the middle of the matches between the ranges, when they are at least 2 characters long
+    Returns the bounds of each segment, with its ranges
+    """
+
+    target = sum(bounds[1] - bounds[0] + bounds[3] - bounds[2] for bounds in ranges) / max(segments, 1)
+
+    cut_segments: list[tuple[int, int, int, int, list[Range]]] = []
+    alignment_start = 0
+    reference_start = 0
+    current: list[Range] = []
+    size = 0
+
+    for i, bounds in enumerate(ranges):
+        current.append(bounds)
+        size += bounds[1] - bounds[0] + bounds[3] - bounds[2]
+
+        # The match between this range and the next one
+        match_start = bounds[1]
+        match_end = ranges[i+1][0] if i + 1 < len(ranges) else alignment_length
+        if size < target or match_end - match_start < 2 or i + 1 == len(ranges):
+            continue
+
+        cut = (match_start + match_end) // 2
+        reference_cut = bounds[3] + cut - match_start
+        cut_segments.append((alignment_start, cut, reference_start, reference_cut, current))
+
+        alignment_start = cut
+        reference_start = reference_cut
+        current = []
+        size = 0
+
+    cut_segments.append((alignment_start, alignment_length, reference_start, reference_length, current))
+    return cut_segments
+
+
+
+def _sync_segment(payload: SegmentPayload) -> tuple[str, list[int | float], int | float]:
+    """
+    Fits and distributes one segment in a worker, without rounding
+    Returns the synchronised characters and durations, and the change of their total duration
+    """
+
+    characters, durations, reference_text, stack, columnar, engine, matcher, backend = payload
+
+    additions, missing = _fit_ranges(characters, reference_text, stack, engine, matcher, None)
+
+    if columnar:
+        alignment = ColumnarAlignment(characters, durations)
+    else:
+        alignment = [FastCharAlignment(char, duration) for char, duration in zip(characters, durations)]
+
+    change = _remove_additions(alignment, additions, backend)
+    change += _add_missing(alignment, reference_text, missing, backend)
+
+    return get_alignment_text(alignment), list(get_durations(alignment)), change
@@ -0,0 +1,87 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator
+
+
+STAGES = ("fit", "remove", "add", "round")
+
+
+
+class SyncStats:
+    """
+    Wall time of each stage and counters of the hot paths, for `sync_alignment`
+    Accumulates over every sync it is given to, so one object can follow a whole run
+
+    Stages are "fit", "remove", "add" and "round", in seconds. In exact mode, the whole distribution and rounding are timed as "add".
+    Counters:
+        syncs - number of synced alignments
+        probes - longest common substring searches in the fitting
+        searched - characters covered by those searches, in both texts
+        max_depth - most ranges waiting to be fitted at once, the fitting is iterative so this is its recursion depth
+        addition_chunks, missing_chunks - groups of contiguous additions and missing chars
+        removed, inserted - number of removed and inserted characters
+    """
+
+    __slots__ = ("seconds", "syncs", "probes", "searched", "max_depth", "addition_chunks", "missing_chunks", "removed", "inserted")
+
+    def __init__(self):
+        self.seconds: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.syncs = 0
+        self.probes = 0
+        self.searched = 0
+        self.max_depth = 0
+        self.addition_chunks = 0
+        self.missing_chunks = 0
+        self.removed = 0
+        self.inserted = 0
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """
+        Adds the time spent in the block to the stage
+
+        Parameters:
+            stage: str
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] += time.perf_counter() - start
+
+    def as_dict(self) -> dict[str, int | float]:
+        """
+        Returns everything as a flat dict, to export to a metrics system
+        Stage times are named "<stage>_seconds"
+
+        Returns:
+            dict[str, int | float]
+        """
+
+        exported: dict[str, int | float] = {f"{stage}_seconds": seconds for stage, seconds in self.seconds.items()}
+        for name in self.__slots__[1:]:
+            exported[name] = getattr(self, name)
+        return exported
+
+    def __repr__(self) -> str:
+        return f"SyncStats({', '.join(f'{name}={value!r}' for name, value in self.as_dict().items())})"
+
+
+
+def timed(stats: SyncStats | None, stage: str) -> ContextManager[None]:
+    """
+    Times the stage if there are stats, otherwise does nothing
+
+    Parameters:
+        stats: SyncStats | None
+        stage: str
+
+    Returns:
+        ContextManager[None]
+    """
+
+    if stats is None:
+        return nullcontext()
+
+    return stats.time(stage)
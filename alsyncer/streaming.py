@@ -0,0 +1,193 @@
+from .models import Alignment
+from .syncer import fit_alignment, remove_additions, add_missing
+from .utils import round_alignment as round_alignment_func
+
+
+
+class StreamingSyncer:
+    """
+    Synchronises an alignment to a reference text while it arrives fragment by fragment (e.g. live STT output)
+    Characters are returned once finalized, at most `max_pending` characters are held back
+
+    The alignment is cut between two characters that are matched one after the other, with nothing added or missing between them,
+    and no duration is distributed across such a cut. The rounding bias is carried from one part to the next.
+    The result always has the reference text and keeps the total duration, but it is not always the same as `sync_alignment`:
+    each part is fitted without the characters that come after it, so where the texts allow several fits
+    (e.g. repeated characters), it may pick another one than the fit of the full input. A larger lookahead makes it rarer
+
+    Without two characters matched one after the other (ad-libs, noise), there is no safe cut.
+    Once `max_pending` characters are held back, the oldest ones are then finalized anyway, up to the lookahead:
+    their additions and missing chars are distributed within them. If none of them matched, or they reach the end of the reference text,
+    their duration is carried to the next character instead
+
+    Parameters:
+        reference_text: str
+        lookahead: int = 32 - number of characters held back before being finalized
+        round_alignment: bool = True
+        engine: str = "auto" - see `fit_alignment`
+        max_pending: int | None = None - most characters held back before forcing a cut, defaults to 8 lookaheads
+    """
+
+    def __init__(
+            self, reference_text: str, lookahead: int = 32, round_alignment: bool = True, engine: str = "auto",
+            max_pending: int | None = None
+        ):
+        if lookahead < 1:
+            raise Exception("Lookahead must be at least 1")
+        if max_pending is None:
+            max_pending = 8 * lookahead
+        if max_pending <= 2 * lookahead:
+            raise Exception("max_pending must be more than 2 lookaheads")
+
+        self.reference_text = reference_text
+        self.lookahead = lookahead
+        self.max_pending = max_pending
+        self.round_alignment = round_alignment
+        self.engine = engine
+
+        self._pending: Alignment = []
+        self._reference_start = 0
+        self._bias: float = 0
+
+    def feed(self, fragment: Alignment) -> Alignment:
+        """
+        Adds a fragment of the alignment
+
+        Parameters:
+            fragment: Alignment
+
+        Returns:
+            Alignment - the characters that got finalized, synchronised to the reference text
+        """
+
+        self._pending.extend(fragment)
+
+        # Wait for enough characters, so we don't fit on every character
+        if len(self._pending) < 2 * self.lookahead:
+            return []
+
+        return self._flush(final=False)
+
+    def finish(self) -> Alignment:
+        """
+        Ends the stream
+
+        Returns:
+            Alignment - all the remaining characters, synchronised to the rest of the reference text
+        """
+
+        return self._flush(final=True)
+
+    def _flush(self, final: bool) -> Alignment:
+        """
+        Fits the pending characters, and finalizes them up to the last safe cut
+        """
+
+        pending = self._pending
+        reference_start = self._reference_start
+
+        # Only fit against the part of the reference text the pending characters can reach
+        if final:
+            reference_window = self.reference_text[reference_start:]
+        else:
+            reference_window = self.reference_text[reference_start:reference_start + len(pending) + self.lookahead]
+
+        pending_text = ''.join(al.character for al in pending)
+        additions, missing = fit_alignment(pending_text, reference_window, engine=self.engine)
+
+        if final:
+            alignment_cut = len(pending)
+            reference_cut = len(reference_window)
+        elif len(pending) >= self.max_pending:
+            # Too much held back, cut wherever the fit is at the end of the lookahead
+            alignment_cut, reference_cut = _forced_cut(len(pending), additions, missing, len(pending) - self.lookahead)
+        else:
+            cut = _last_cut(len(pending), len(reference_window), additions, missing, len(pending) - self.lookahead)
+            if cut is None:
+                return []
+            alignment_cut, reference_cut = cut
+
+        part = pending[:alignment_cut]
+        part_additions = [i for i in additions if i < alignment_cut]
+
+        # None of them matched, so there is nothing to give their duration to yet.
+        # The end of the reference text is also kept for the last part, so it never ends up with only additions
+        if not final and (len(part_additions) == alignment_cut or reference_start + reference_cut == len(self.reference_text)):
+            pending[alignment_cut].duration += sum(al.duration for al in part)
+            self._pending = pending[alignment_cut:]
+            return []
+
+        remove_additions(part, part_additions)
+        add_missing(part, reference_window[:reference_cut], [i for i in missing if i < reference_cut])
+
+        if self.round_alignment:
+            self._bias = round_alignment_func(part, self._bias)
+
+        self._pending = pending[alignment_cut:]
+        self._reference_start = reference_start + reference_cut
+
+        return part
+
+
+
+def _forced_cut(alignment_length: int, additions: list[int], missing: list[int], alignment_cut: int) -> tuple[int, int]:
+    """
+    Finds where the fit is in the reference text at the given alignment index, whether the characters around it match or not
+    Additions come before missing chars, so missing chars right at the cut are left to the next part
+    Returns the (alignment, reference) indexes right after the cut
+    """
+
+    additions_set = set(additions)
+    missing_set = set(missing)
+
+    alignment_i = 0
+    reference_i = 0
+    while alignment_i < alignment_cut:
+        if alignment_i in additions_set:
+            alignment_i += 1
+        elif reference_i in missing_set:
+            reference_i += 1
+        else:
+            alignment_i += 1
+            reference_i += 1
+
+    return alignment_cut, reference_i
+
+
+def _last_cut(
+        alignment_length: int, reference_length: int,
+        additions: list[int], missing: list[int],
+        max_alignment_cut: int
+    ) -> tuple[int, int] | None:
+    """
+    Finds the last cut between two characters matched one after the other, at most at the given alignment index
+    Returns the (alignment, reference) indexes right after the cut, or None if there is none
+    """
+
+    additions_set = set(additions)
+    missing_set = set(missing)
+
+    cut = None
+    previous_match = None
+
+    alignment_i = 0
+    reference_i = 0
+    while alignment_i < alignment_length and reference_i < reference_length:
+        if alignment_i in additions_set:
+            alignment_i += 1
+            previous_match = None
+            continue
+        if reference_i in missing_set:
+            reference_i += 1
+            previous_match = None
+            continue
+
+        # Both characters match
+        if previous_match is not None and alignment_i <= max_alignment_cut:
+            cut = alignment_i, reference_i
+
+        previous_match = alignment_i, reference_i
+        alignment_i += 1
+        reference_i += 1
+
+    return cut
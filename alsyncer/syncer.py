@@ -1,151 +1,356 @@
 import math
+from array import array
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any
 
-from .models import Alignment, CharAlignment
-from .utils import chunk, round_alignment as round_alignment_func
+from .models import Alignment, CharAlignment, ColumnarAlignment, FastCharAlignment
+from .matching import ReferenceIndex, band_gaps, longest_common_substring, myers_diff, tokenize_words, unique_anchors
+from .normalize import NormalizedText
+from .stats import SyncStats, timed
+from .vectorized import MISSING_NUMPY_THRESHOLD, distribute_missing, missing_neighbours, np, redistribute_additions, use_numpy
+from .utils import chunk, get_alignment_text, get_alignment_duration, get_char_factory, get_durations, insert_chars, remove_chars, round_alignment as round_alignment_func
 
+if TYPE_CHECKING:
+    from .cache import FitCache
+
+
+# Largest change of the total duration (ms) put on floating point errors by the checks, see `sync_alignment`
+DURATION_TOLERANCE = 1e-6
 
 
 
 def fit_alignment(
-        alignment_text: str, reference_text: str, 
-        alignment_gap: int = 0, reference_gap: int = 0
+        alignment_text: str, reference_text: str | ReferenceIndex,
+        alignment_gap: int = 0, reference_gap: int = 0,
+        engine: str = "auto",
+        anchors: bool = False,
+        words: bool = False,
+        matcher: str = "greedy",
+        band: int | str | None = None,
+        normalize: bool = False,
+        stats: SyncStats | None = None
     ) -> tuple[list[int], list[int]]:
     """
     Fits the given alignment text to a reference text
     Returns a list of additions in the alignment text, and missing characters from the reference text, under the form of indexes
+
+    Works on bounds over the original texts with an explicit work stack, so it neither copies the texts nor recurses
     
     Parameters:
         alignment_text: str
-        reference_text: str
-        alignment_gap: int = 0
-        reference_gap: int = 0
+        reference_text: str | ReferenceIndex - the reference text, or its prebuilt index to reuse it between alignments
+        alignment_gap: int = 0 - offset added to the returned additions
+        reference_gap: int = 0 - offset added to the returned missing chars
+        engine: str = "auto" - longest common substring engine, see `matching.longest_common_substring`
+        anchors: bool = False - whether to first match the words that are unique in both texts, and only fit the gaps between them.
+                                Much faster on near-identical texts, but may give a different fit than the plain greedy search
+        words: bool = False - whether to first fit both texts word by word, and only fit characters inside the words that didn't match.
+                              Much faster on long texts, takes precedence over anchors
+        matcher: str = "greedy" - "greedy" to fit the longest common substring first, then the parts around it,
+                                  or "myers" to find the fewest additions plus missing chars with a Myers diff, see `matching.myers_diff`
+        band: int | str | None = None - width of the diagonal window matches are first searched in, or "adaptive" to follow the drift between the texts.
+                                        Makes long texts cost around O(N * band), but may give a different fit, see `matching.band_gaps`
+        normalize: bool = False - whether to ignore case, quotes, spacing and punctuation, see `_fit_normalized`.
+                                  Matched characters may then differ from the reference ones, `sync_alignment` replaces them
+        stats: SyncStats | None = None - adds the probes, searched characters and depth of the fitting to it
 
     Returns:
         tuple[list[int], list[int]] - additions and missing chars
     """
 
-    # Start fitting with the minimum length
-    min_length = min(len(alignment_text), len(reference_text))
+    if matcher not in ("greedy", "myers"):
+        raise Exception(f"Unknown matcher: {matcher}")
 
-    # Regressively fit until there is nothing anymore
-    for current_length in range(min_length, 0, -1):
+    index = None
+    if isinstance(reference_text, ReferenceIndex):
+        index = reference_text
+        reference_text = index.text
 
-        # The difference between the alignment text and the current length tells us how many substrings we can take
-        diff = len(alignment_text) - current_length
+    # The views differ from the indexed text, so the index isn't used
+    if normalize:
+        return _fit_normalized(alignment_text, reference_text, alignment_gap, reference_gap, engine, anchors, words, matcher, band, stats)
 
-        # Progressively cut substrings from left to right
-        for start_i in range(diff+1):
-            substring = alignment_text[start_i:start_i+current_length]
+    stack = _initial_ranges(alignment_text, reference_text, engine, anchors, words, matcher, band, index, stats)
+    return _fit_ranges(alignment_text, reference_text, stack, engine, matcher, index, alignment_gap, reference_gap, stats)
 
-            # Try to index them in the reference text
-            try:
-                pos = reference_text.index(substring)
-            except ValueError:
-                continue
-            
-            has_before = pos != 0 or start_i != 0
-            has_after = (
-                pos + current_length < len(reference_text) or
-                start_i + current_length < len(alignment_text)
+
+def _initial_ranges(
+        alignment_text: str, reference_text: str, engine: str,
+        anchors: bool, words: bool, matcher: str, band: int | str | None,
+        index: ReferenceIndex | None, stats: SyncStats | None
+    ) -> list[tuple[int, int, int, int]]:
+    """
+    Returns the ranges to fit, as a work stack (last range first)
+    They are the whole texts, or the gaps left between anchors, word matches, or matches in the band
+    """
+
+    # Bounds left to fit, as (alignment start, alignment end, reference start, reference end)
+    # The last one is fitted first, so parts after a match are pushed before parts before it
+    stack = [(0, len(alignment_text), 0, len(reference_text))]
+
+    if words:
+        stack = _anchor_gaps(alignment_text, reference_text, _word_anchors(alignment_text, reference_text, engine, matcher, band, index, stats))
+    elif anchors:
+        reference_words = index.unique_words if index is not None else None
+        stack = _anchor_gaps(alignment_text, reference_text, unique_anchors(alignment_text, reference_text, reference_words))
+
+    # Sweep each range along its diagonal, only the gaps between the matches are left
+    if band is not None:
+        stack = [
+            gap
+            for bounds in reversed(stack)
+            for gap in band_gaps(alignment_text, reference_text, *bounds, band, engine)
+        ]
+        stack.reverse()
+
+    return stack
+
+
+def _fit_ranges(
+        alignment_text: str, reference_text: str, stack: list[tuple[int, int, int, int]],
+        engine: str, matcher: str, index: ReferenceIndex | None,
+        alignment_gap: int = 0, reference_gap: int = 0, stats: SyncStats | None = None
+    ) -> tuple[list[int], list[int]]:
+    """
+    Fits every range of the work stack, see `fit_alignment`
+    Ranges are independent, each one only gives additions and missing chars within its bounds
+    Consumes the stack
+    """
+
+    additions: list[int] = []
+    missing: list[int] = []
+
+    # Counted in locals, so it costs next to nothing without stats
+    probes = 0
+    searched = 0
+    max_depth = len(stack)
+
+    while stack:
+        if len(stack) > max_depth:
+            max_depth = len(stack)
+
+        alignment_start, alignment_end, reference_start, reference_end = stack.pop()
+        probes += 1
+        searched += alignment_end - alignment_start + reference_end - reference_start
+
+        # Each gap is diffed at once
+        if matcher == "myers":
+            gap_additions, gap_missing = myers_diff(
+                alignment_text, reference_text,
+                alignment_start, alignment_end,
+                reference_start, reference_end
             )
+            additions.extend(i + alignment_gap for i in gap_additions)
+            missing.extend(i + reference_gap for i in gap_missing)
+            continue
+
+        # Find the longest part both texts have in common
+        start_i, pos, current_length = longest_common_substring(
+            alignment_text, reference_text, engine,
+            alignment_start, alignment_end,
+            reference_start, reference_end,
+            index
+        )
+
+        # If nothing was fit, everything is either added or missing
+        if not current_length:
+            additions.extend(range(alignment_start + alignment_gap, alignment_end + alignment_gap))
+            missing.extend(range(reference_start + reference_gap, reference_end + reference_gap))
+            continue
+
+        # Fit part after
+        after_alignment_start = start_i + current_length
+        after_reference_start = pos + current_length
+        if after_alignment_start < alignment_end or after_reference_start < reference_end:
+            stack.append((after_alignment_start, alignment_end, after_reference_start, reference_end))
+
+        # Fit part before
+        if start_i != alignment_start or pos != reference_start:
+            stack.append((alignment_start, start_i, reference_start, pos))
+
+    if stats is not None:
+        stats.probes += probes
+        stats.searched += searched
+        stats.max_depth = max(stats.max_depth, max_depth)
+
+    return additions, missing
+
 
-            additions: list[int] = []
-            missing: list[int] = []
-
-            # Fit part before
-            if has_before:
-                before_alignment_text = alignment_text[:start_i]
-                before_reference_text = reference_text[:pos]
-                _a, _m = fit_alignment(before_alignment_text, before_reference_text, alignment_gap, reference_gap)
-                additions.extend(_a)
-                missing.extend(_m)
-
-            # Fit part after
-            if has_after:
-                this_alignment_gap = start_i+current_length
-                this_reference_gap = pos+current_length
-
-                after_alignment_text = alignment_text[this_alignment_gap:]
-                after_reference_text = reference_text[this_reference_gap:]
-
-                alignment_gap += this_alignment_gap
-                reference_gap += this_reference_gap
-                
-                _a, _m = fit_alignment(after_alignment_text, after_reference_text, alignment_gap, reference_gap)
-                additions.extend(_a)
-                missing.extend(_m)
-
-            return additions, missing
-
-    # If nothing was fit, return everything
-    return (
-        [_a + alignment_gap for _a in range(len(alignment_text))],
-        [_m + reference_gap for _m in range(len(reference_text))],
+def _fit_normalized(
+        alignment_text: str, reference_text: str,
+        alignment_gap: int, reference_gap: int,
+        engine: str, anchors: bool, words: bool, matcher: str, band: int | str | None,
+        stats: SyncStats | None
+    ) -> tuple[list[int], list[int]]:
+    """
+    Fits the normalized views of both texts, then maps the matches back to the original indexes, see `normalize.NormalizedText`
+    Matched characters following each other in both texts are used as anchors,
+    and the gaps left between them (dropped punctuation and spaces, unmatched parts) are fitted on the folded texts
+    """
+
+    alignment = NormalizedText(alignment_text)
+    reference = NormalizedText(reference_text)
+
+    additions, missing = fit_alignment(
+        alignment.normalized, reference.normalized,
+        engine=engine, anchors=anchors, words=words, matcher=matcher, band=band, stats=stats
     )
+    additions_set = set(additions)
+    missing_set = set(missing)
 
+    matched_alignment = [alignment.offsets[i] for i in range(len(alignment)) if i not in additions_set]
+    matched_reference = [reference.offsets[i] for i in range(len(reference)) if i not in missing_set]
 
+    # Runs of matches, as (start in the alignment text, start in the reference text, length)
+    runs: list[list[int]] = []
+    for alignment_i, reference_i in zip(matched_alignment, matched_reference):
+        if runs and runs[-1][0] + runs[-1][2] == alignment_i and runs[-1][1] + runs[-1][2] == reference_i:
+            runs[-1][2] += 1
+        else:
+            runs.append([alignment_i, reference_i, 1])
 
+    stack = _anchor_gaps(alignment_text, reference_text, runs)
+    return _fit_ranges(alignment.folded, reference.folded, stack, engine, matcher, None, alignment_gap, reference_gap, stats)
 
 
-def remove_additions(alignment: Alignment, additions: list[int]) -> None:
+def _word_anchors(
+        alignment_text: str, reference_text: str, engine: str, matcher: str, band: int | str | None,
+        index: ReferenceIndex | None = None, stats: SyncStats | None = None
+    ) -> list[tuple[int, int, int]]:
+    """
+    Fits both texts on word tokens, and returns the matched words as anchors
+    (start in the alignment text, start in the reference text, length)
+    With an index, the reference text is already tokenized
+    """
+
+    if index is not None and index.word_index is not None:
+        alignment_tokens, alignment_spans = index.tokenize(alignment_text)
+        reference_spans = index.word_spans
+        token_additions, token_missing = fit_alignment(alignment_tokens, index.word_index, engine=engine, matcher=matcher, band=band, stats=stats)
+    else:
+        (alignment_tokens, alignment_spans), (reference_tokens, reference_spans) = tokenize_words(alignment_text, reference_text)
+        token_additions, token_missing = fit_alignment(alignment_tokens, reference_tokens, engine=engine, matcher=matcher, band=band, stats=stats)
+
+    token_additions_set = set(token_additions)
+    token_missing_set = set(token_missing)
+
+    matched_alignment = [span for i, span in enumerate(alignment_spans) if i not in token_additions_set]
+    matched_reference = [span for i, span in enumerate(reference_spans) if i not in token_missing_set]
+
+    # Matched tokens are in the same order in both texts
+    return [
+        (alignment_start, reference_start, alignment_end - alignment_start)
+        for (alignment_start, alignment_end), (reference_start, _) in zip(matched_alignment, matched_reference)
+    ]
+
+
+def _anchor_gaps(alignment_text: str, reference_text: str, anchors: list[tuple[int, int, int]]) -> list[tuple[int, int, int, int]]:
+    """
+    Returns the bounds of the gaps between the given anchors of both texts, as a work stack (last gap first)
+    """
+
+    gaps: list[tuple[int, int, int, int]] = []
+
+    alignment_start = 0
+    reference_start = 0
+    for anchor_alignment_start, anchor_reference_start, length in anchors:
+        gaps.append((alignment_start, anchor_alignment_start, reference_start, anchor_reference_start))
+        alignment_start = anchor_alignment_start + length
+        reference_start = anchor_reference_start + length
+
+    gaps.append((alignment_start, len(alignment_text), reference_start, len(reference_text)))
+
+    return [
+        gap for gap in reversed(gaps)
+        if gap[0] != gap[1] or gap[2] != gap[3] # Skip empty gaps
+    ]
+
+
+
+
+
+def remove_additions(alignment: Alignment | ColumnarAlignment, additions: list[int], backend: str = "auto") -> None:
     """
     Removes the list of given additions from the alignment
     NOTE: May adjust the alignment into containing floating point values
     Mutates in place
 
     Parameters:
-        alignment: Alignment
+        alignment: Alignment | ColumnarAlignment
         additions: list[int]
+        backend: str = "auto" - "python", "numpy", or "auto" to use NumPy when it is installed, see `vectorized.use_numpy`
+    """
+
+    _remove_additions(alignment, additions, backend)
+
+
+def _remove_additions(alignment: Alignment | ColumnarAlignment, additions: list[int], backend: str) -> int | float:
+    """
+    Removes the additions, see `remove_additions`
+    Returns the change of the total duration, tracked over the characters it touched. Zero up to floating point errors, anything else is a bug
     """
 
     if not additions:
-        return
+        return 0
     
     # Alignment is full of additions, duration cannot be preserved, this is not possible
     if len(additions) == len(alignment):
         raise Exception("Alignment cannot be full of additions")
 
+    if use_numpy(backend, len(additions)):
+        change = _redistribute_additions_numpy(alignment, additions)
+        remove_chars(alignment, additions)
+        return change
+
+    durations = get_durations(alignment)
+    change: int | float = 0
+
     # We process by chunks - if some additions are grouped together,
     # they need to be handled together so the extremities end up correctly distributed
     for chunk_additions in chunk(additions):
+        change -= sum(durations[i] for i in chunk_additions)
 
         # If its from the beginning, just put everything to the next one
         if chunk_additions[0] == 0:
-            addit_sum = sum(alignment[i].duration for i in chunk_additions)
-            alignment[chunk_additions[-1]+1].duration += addit_sum
+            addit_sum = sum(durations[i] for i in chunk_additions)
+            durations[chunk_additions[-1]+1] += addit_sum
+            change += addit_sum
 
         # If its to the end, do the opposite
         elif chunk_additions[-1] == len(alignment)-1:
-            addit_sum = sum(alignment[i].duration for i in chunk_additions)
-            alignment[chunk_additions[0]-1].duration += addit_sum
+            addit_sum = sum(durations[i] for i in chunk_additions)
+            durations[chunk_additions[0]-1] += addit_sum
+            change += addit_sum
 
         else:
             addit_sum_left = sum(
-                alignment[i].duration for i in 
+                durations[i] for i in 
                 chunk_additions[:math.floor(len(chunk_additions)/2)]
             )
             addit_sum_right = sum(
-                alignment[i].duration for i in 
+                durations[i] for i in 
                 chunk_additions[math.ceil(len(chunk_additions)/2):]
             )
 
             # If odd, split the middle
             if len(chunk_additions) % 2 == 1:
-                addit_middle = alignment[chunk_additions[len(chunk_additions)//2]].duration
+                addit_middle = durations[chunk_additions[len(chunk_additions)//2]]
                 addit_sum_left += addit_middle / 2
                 addit_sum_right += addit_middle / 2
 
-            alignment[chunk_additions[0]-1].duration += addit_sum_left
-            alignment[chunk_additions[-1]+1].duration += addit_sum_right
+            durations[chunk_additions[0]-1] += addit_sum_left
+            durations[chunk_additions[-1]+1] += addit_sum_right
+            change += addit_sum_left + addit_sum_right
 
 
     # Remove additions from alignment at the end
-    for i in reversed(additions): # Reverse to not have to carry gap
-        alignment.pop(i)
+    remove_chars(alignment, additions)
 
+    return change
 
 
-def add_missing(alignment: Alignment, reference_text: str, missing: list[int]) -> None:
+
+def add_missing(alignment: Alignment | ColumnarAlignment, reference_text: str, missing: list[int], backend: str = "auto") -> None:
     """
     Adds all the missing characters from the reference text to the alignment
     Handles durations distribution
@@ -153,19 +358,40 @@ def add_missing(alignment: Alignment, reference_text: str, missing: list[int]) -
     Mutates in place
 
     Parameters:
-        alignment: Alignment
+        alignment: Alignment | ColumnarAlignment
         reference_text: str
         missing: list[int]
+        backend: str = "auto" - "python", "numpy", or "auto" to use NumPy when it is installed, see `vectorized.use_numpy`
+    """
+
+    _add_missing(alignment, reference_text, missing, backend)
+
+
+def _add_missing(alignment: Alignment | ColumnarAlignment, reference_text: str, missing: list[int], backend: str) -> int | float:
+    """
+    Adds the missing characters, see `add_missing`
+    Returns the change of the total duration, tracked over the characters it touched, see `_remove_additions`
     """
 
     if not missing:
-        return
+        return 0
     
     # Alignment is empty, we cannot distribute anything
     if not alignment:
         raise Exception("Alignment cannot be empty")
 
+    if use_numpy(backend, len(missing), MISSING_NUMPY_THRESHOLD):
+        return _add_missing_numpy(alignment, reference_text, missing)
+
+    durations = get_durations(alignment)
     chunked_missing = chunk(missing)
+    change: int | float = 0
+
+    # Durations of the alignment are updated right away, but new characters are only collected
+    # They are all merged in a single pass at the end, at their index in the original alignment
+    insertions: list[tuple[int, list[str], list[int | float]]] = []
+    alignment_length = len(alignment)
+    inserted_count = 0 # Number of missing characters before the current chunk
 
     # We also process by chunks
     for chunk_i, chunk_missing in enumerate(chunked_missing):
@@ -185,7 +411,7 @@ def add_missing(alignment: Alignment, reference_text: str, missing: list[int]) -
         # If its from the beginning, split evenly with the next one
         if chunk_missing[0] == 0:
             # Get next char
-            next_char = alignment[0]
+            next_dur = durations[0]
 
             if next_char_distributed:
                 # If next one is distributed aswell, different handling
@@ -194,35 +420,34 @@ def add_missing(alignment: Alignment, reference_text: str, missing: list[int]) -
                 # If next chunk ends
                 if next_chunk[-1] == len(reference_text) - 1:
                     # It will be split evenly with next chunk aswell
-                    duration_per_char = next_char.duration / (len(chunk_missing) + 1 + len(next_chunk)) # Account for this chunk, next one, and the char.
+                    duration_per_char = next_dur / (len(chunk_missing) + 1 + len(next_chunk)) # Account for this chunk, next one, and the char.
 
                 # Next chunk is distributed on both ends
                 else:
                     # Take in account its own half of next chunk
                     # We use 2 because in some cases next chunk may be odd and one would take 1/X
-                    duration_per_char = 2 / (
-                        2 * (len(chunk_missing))
-                        + 2
-                        + len(next_chunk)
-                    ) * next_char.duration
+                    duration_per_char = _share(2 * (len(chunk_missing)) + 2 + len(next_chunk), next_dur)
 
             else:
-                duration_per_char = next_char.duration / (len(chunk_missing) + 1)
-
-            # Add in the beginning
-            alignment[0:0] = [
-                CharAlignment(character=reference_text[i], duration=duration_per_char)
-                for i in chunk_missing
-            ]
+                duration_per_char = next_dur / (len(chunk_missing) + 1)
 
             # Override next char only if not distributed (it will be done later)
             if not next_char_distributed:
-                next_char.duration = duration_per_char
+                durations[0] = duration_per_char
+                change += duration_per_char - next_dur
+            change += duration_per_char * len(chunk_missing)
+
+            # Add in the beginning
+            insertions.append((
+                0,
+                [reference_text[i] for i in chunk_missing],
+                [duration_per_char] * len(chunk_missing)
+            ))
 
         # If its to the end, do the opposite
         elif chunk_missing[-1] == len(reference_text)-1:
             # Get prev char
-            prev_char = alignment[-1]
+            prev_dur = durations[alignment_length-1]
 
             if prev_char_distributed:
                 # If prev one is distributed aswell, different handling
@@ -231,38 +456,36 @@ def add_missing(alignment: Alignment, reference_text: str, missing: list[int]) -
                 # If prev chunk starts
                 if prev_chunk[0] == 0:
                     # It will be split evenly with prev chunk aswell
-                    duration_per_char = prev_char.duration / (len(chunk_missing) + 1 + len(prev_chunk))
+                    duration_per_char = prev_dur / (len(chunk_missing) + 1 + len(prev_chunk))
 
                 # Prev chunk is distributed on both ends
                 else:
                     # Take in account its own half of prev chunk
                     # We use 2 because in some cases next chunk may be odd and one would take 1/X
-                    duration_per_char = 2 / (
-                        2 * (len(chunk_missing))
-                        + 2
-                        + len(prev_chunk)
-                    ) * prev_char.duration
+                    duration_per_char = _share(2 * (len(chunk_missing)) + 2 + len(prev_chunk), prev_dur)
 
             else:
-                duration_per_char = prev_char.duration / (len(chunk_missing) + 1)
-
-            # Add in the end
-            alignment[len(alignment):len(alignment)] = [
-                CharAlignment(character=reference_text[i], duration=duration_per_char)
-                for i in chunk_missing
-            ]
+                duration_per_char = prev_dur / (len(chunk_missing) + 1)
 
             # Override prev char
-            prev_char.duration = duration_per_char
+            durations[alignment_length-1] = duration_per_char
+            change += duration_per_char - prev_dur + duration_per_char * len(chunk_missing)
+
+            # Add in the end
+            insertions.append((
+                alignment_length,
+                [reference_text[i] for i in chunk_missing],
+                [duration_per_char] * len(chunk_missing)
+            ))
 
         # It's anywhere in the middle
         else:
             # Get surrounding chars
-            prev_char = alignment[chunk_missing[0] - 1]
-            next_char = alignment[chunk_missing[0]]
+            # Index of the next char in the original alignment
+            next_i = chunk_missing[0] - inserted_count
 
-            prev_dur = prev_char.duration
-            next_dur = next_char.duration
+            prev_dur = durations[next_i - 1]
+            next_dur = durations[next_i]
 
             # Get dividers for both
             # 2 is for the edge, then we take length because we only take half but multiplied by two. Only 1 if odd
@@ -287,20 +510,21 @@ def add_missing(alignment: Alignment, reference_text: str, missing: list[int]) -
                     next_div += len(next_chunk)
 
             # Update them
-            prev_char.duration = 2 / prev_div * prev_dur
+            durations[next_i - 1] = _share(prev_div, prev_dur)
+            change += durations[next_i - 1] - prev_dur
 
             if not next_char_distributed:
-                next_char.duration = 2 / next_div * next_dur
+                durations[next_i] = _share(next_div, next_dur)
+                change += durations[next_i] - next_dur
 
             # Update new chars
-            new_chars: Alignment = []
-            for i, missing_index in enumerate(chunk_missing):
-                char = reference_text[missing_index]
+            new_durations: list[int | float] = []
+            for i in range(len(chunk_missing)):
                 mid = (len(chunk_missing) + 1 ) / 2
 
                 # Only take from prev
                 if i + 1 < mid:
-                    dur = 2 / prev_div * prev_dur
+                    dur = _share(prev_div, prev_dur)
 
                 # Take from both (odd)
                 elif i + 1 == mid:
@@ -308,66 +532,333 @@ def add_missing(alignment: Alignment, reference_text: str, missing: list[int]) -
 
                 # Only from next
                 elif i + 1 > mid:
-                    dur = 2 / next_div * next_dur
+                    dur = _share(next_div, next_dur)
+
+                new_durations.append(dur)
+            change += sum(new_durations)
+
+            insertions.append((
+                next_i,
+                [reference_text[i] for i in chunk_missing],
+                new_durations
+            ))
+
+        inserted_count += len(chunk_missing)
+
+    insert_chars(alignment, insertions)
+
+    return change
+
+
+def _share(div: int, duration: int | float | Fraction) -> int | float | Fraction:
+    """
+    Returns `2 / div * duration`, the part of a neighbour given to each character on its side
+    Stays exact for fractions, floats keep this order of operations so their results don't change
+    """
+
+    if isinstance(duration, Fraction):
+        return Fraction(2, div) * duration
+
+    return 2 / div * duration
+
+
+
+def _redistribute_additions_numpy(alignment: Alignment | ColumnarAlignment, additions: list[int]) -> float:
+    """
+    Distributes the durations of the additions to their neighbours with the NumPy backend
+    Gives the same durations as the pure Python path, down to the bit and to the int/float type
+    Returns the change of the total duration
+    """
+
+    if isinstance(alignment, ColumnarAlignment):
+        durations = np.frombuffer(alignment.durations, dtype=np.float64)
+        removed = durations[additions]
+        targets, received, _ = redistribute_additions(removed, additions, len(alignment))
+
+        # Unbuffered, so an index receiving twice adds in order
+        np.add.at(durations, targets, received)
+        return float(received.sum() - removed.sum())
+
+    durations = get_durations(alignment)
+    values = [durations[i] for i in additions]
+    targets, received, integers = redistribute_additions(
+        np.array(values, dtype=np.float64), additions, len(alignment),
+        np.array([type(value) is int for value in values])
+    )
 
-                new_chars.append(
-                    CharAlignment(character=char, duration=dur)
-                )
+    for i, duration, integer in zip(targets.tolist(), received.tolist(), integers.tolist()):
+        durations[i] += int(duration) if integer else duration
 
-            alignment[chunk_missing[0]:chunk_missing[0]] = new_chars
+    return float(received.sum()) - sum(values)
 
 
+def _add_missing_numpy(alignment: Alignment | ColumnarAlignment, reference_text: str, missing: list[int]) -> float:
+    """
+    Adds the missing characters with the NumPy backend
+    Gives the same durations as the pure Python path, down to the bit
+    Returns the change of the total duration
+    """
 
+    # Only the neighbours of the chunks are read, not the whole alignment
+    neighbours = missing_neighbours(missing, len(alignment))
+    if isinstance(alignment, ColumnarAlignment):
+        durations = np.frombuffer(alignment.durations, dtype=np.float64)
+        neighbour_durations = durations[neighbours]
+    else:
+        alignment_durations = get_durations(alignment)
+        neighbour_durations = np.array(
+            [alignment_durations[i] for i in neighbours.ravel().tolist()], dtype=np.float64
+        ).reshape(neighbours.shape)
+
+    updated_indexes, updated_durations, next_indexes, chunk_bounds, inserted_durations = distribute_missing(
+        neighbour_durations, len(alignment), len(reference_text), missing
+    )
+
+    change = float(inserted_durations.sum())
+
+    if isinstance(alignment, ColumnarAlignment):
+        change += float(updated_durations.sum() - durations[updated_indexes].sum())
+        durations[updated_indexes] = updated_durations
+    else:
+        for i, duration in zip(updated_indexes.tolist(), updated_durations.tolist()):
+            change += duration - alignment_durations[i]
+            alignment_durations[i] = duration
+
+    # Chunks are contiguous, so their characters are a slice of the reference text
+    inserted_durations = inserted_durations.tolist()
+    insertions: list[tuple[int, list[str], list[int | float]]] = [
+        (
+            next_i,
+            list(reference_text[missing[start]:missing[end-1]+1]),
+            inserted_durations[start:end]
+        )
+        for next_i, (start, end) in zip(next_indexes.tolist(), chunk_bounds.tolist())
+    ]
 
+    insert_chars(alignment, insertions)
 
+    return change
 
 
-def sync_alignment(alignment: Alignment, reference_text: str, round_alignment: bool = True) -> Alignment:
+
+
+
+
+
+def _distribute_exact(alignment: Alignment | ColumnarAlignment, reference_text: str, additions: list[int], missing: list[int]) -> Fraction:
+    """
+    Distributes the durations like `remove_additions` and `add_missing`, with exact fractions instead of floats
+    Then rounds them with the same carried bias, which leaves only integers and can't miss an integer sum
+    Mutates in place, returns the change of the total duration
+    """
+
+    alignment_text = get_alignment_text(alignment)
+
+    # Fractions can't be stored in the alignment itself, they are distributed on a working copy
+    exact_alignment = [
+        FastCharAlignment(char, Fraction(duration))
+        for char, duration in zip(alignment_text, get_durations(alignment))
+    ]
+
+    change = _remove_additions(exact_alignment, additions, "python")
+    change += _add_missing(exact_alignment, reference_text, missing, "python")
+    # The bias left is what rounding took from the total
+    change -= round_alignment_func(exact_alignment, backend="python")
+
+    if isinstance(alignment, ColumnarAlignment):
+        alignment.characters = get_alignment_text(exact_alignment)
+        alignment.durations = array('d', (al.duration for al in exact_alignment))
+        return change
+
+    new_char = get_char_factory(alignment)
+    alignment[:] = [new_char(character=al.character, duration=al.duration) for al in exact_alignment]
+
+    return change
+
+
+
+def sync_alignment(
+        alignment: Alignment | ColumnarAlignment, reference_text: str | ReferenceIndex,
+        round_alignment: bool = True,
+        anchors: bool = False,
+        words: bool = False,
+        matcher: str = "greedy",
+        band: int | str | None = None,
+        verify: str = "off",
+        backend: str = "auto",
+        exact: bool = False,
+        cache: "FitCache | None" = None,
+        normalize: bool = False,
+        stats: SyncStats | None = None
+    ) -> Alignment:
     """
     Synchronises the given alignment to a reference text
 
     Parameters:
-        alignment: Alignment
-        reference_text: str
+        alignment: Alignment | ColumnarAlignment
+        reference_text: str | ReferenceIndex - the reference text, or its prebuilt index to reuse it between alignments
         round_alignment: bool = True - whether to round the final alignment to include only integers.
                                        Missing/additions distribution introduces floating point durations,
                                        And usually you want the durations to be integers (milliseconds)
+        anchors: bool = False - whether to fit between unique word anchors first, see `fit_alignment`
+        words: bool = False - whether to fit word by word first, and characters only inside mismatched words, see `fit_alignment`
+        matcher: str = "greedy" - "greedy" or "myers", see `fit_alignment`
+        band: int | str | None = None - width of the diagonal window, or "adaptive", see `fit_alignment`
+        verify: str = "off" - checks against bugs, raising if the result is wrong:
+                              "off" checks nothing,
+                              "cheap" checks the length, and the change of the total duration tracked while distributing, without any extra pass,
+                              "full" also sums the durations before and after, checks the text, and reports the original alignment when a check fails
+        backend: str = "auto" - duration distribution and rounding backend, "python", "numpy", or "auto" to use NumPy when it is installed
+        exact: bool = False - whether to distribute the durations with exact fractions instead of floats.
+                              The alignment always ends up with integer durations, `round_alignment` and `backend` are ignored.
+                              Results can differ from the float path where its rounding errors fall on a tie
+        cache: FitCache | None = None - cache of the fits, a hit skips fitting and only redistributes the durations
+        normalize: bool = False - whether to fit ignoring case, quotes, spacing and punctuation, see `fit_alignment`.
+                                  The characters of the alignment are then replaced by the exact reference ones
+        stats: SyncStats | None = None - adds the time of each stage and the counters of this sync to it
 
     Returns:
         Alignment
     """
 
-    ## Temporary: store for checks
-    from copy import deepcopy
-    original_alignment = deepcopy(alignment)
-    ## ---
+    if verify not in ("off", "cheap", "full"):
+        raise Exception(f"Unknown verify mode: {verify}")
 
-    alignment_text = ''.join(al.character for al in alignment)
+    # The index is only used for fitting
+    reference = reference_text
+    if isinstance(reference_text, ReferenceIndex):
+        reference_text = reference_text.text
+
+    alignment_text = get_alignment_text(alignment)
+
+    # Only the durations are kept, the original alignment is rebuilt if a check fails
+    og_alignment_duration = get_alignment_duration(alignment) if verify == "full" else None
+    original_durations = list(get_durations(alignment)) if verify == "full" else None
 
     # List of added characters in the alignment, aswell as missing ones
-    additions, missing = fit_alignment(alignment_text, reference_text)
+    with timed(stats, "fit"):
+        if cache is None:
+            additions, missing = fit_alignment(alignment_text, reference, anchors=anchors, words=words, matcher=matcher, band=band, normalize=normalize, stats=stats)
+        else:
+            additions, missing = cache.fit(alignment_text, reference, anchors=anchors, words=words, matcher=matcher, band=band, normalize=normalize, stats=stats)
+
+    if stats is not None:
+        stats.syncs += 1
+        stats.addition_chunks += len(chunk(additions))
+        stats.missing_chunks += len(chunk(missing))
+        stats.removed += len(additions)
+        stats.inserted += len(missing)
+
+    if exact:
+        with timed(stats, "add"):
+            change = _distribute_exact(alignment, reference_text, additions, missing)
 
-    remove_additions(alignment, additions)
-    add_missing(alignment, reference_text, missing)
+    else:
+        with timed(stats, "remove"):
+            change = _remove_additions(alignment, additions, backend)
+        with timed(stats, "add"):
+            change += _add_missing(alignment, reference_text, missing, backend)
 
-    if round_alignment:
-        round_alignment_func(alignment)
+        if round_alignment:
+            with timed(stats, "round"):
+                # The bias left is what rounding took from the total
+                change -= round_alignment_func(alignment, backend=backend)
 
-    ## Temporary: check in case there are bugs
-    og_alignment_duration = sum(al.duration for al in original_alignment)
-    new_alignment_duration = sum(al.duration for al in alignment)
+    # Matched characters may only be equal once normalized
+    if normalize:
+        _copy_reference_characters(alignment, reference_text)
 
-    # Only check if both are integers, otherwise we'd possibly have floating point errors
-    both_integers = isinstance(og_alignment_duration, int) and isinstance(new_alignment_duration, int)
+    if verify != "off":
+        _check_synchronised(alignment, reference_text, alignment_text, verify, change, og_alignment_duration, original_durations)
+
+
+def sync_columns(
+        characters: str, durations: list[int | float], reference_text: str | ReferenceIndex, options: dict[str, Any]
+    ) -> tuple[str, list[int | float]]:
+    """
+    Synchronises an alignment given as its characters and durations, as sent to executors and worker processes
+
+    Parameters:
+        characters: str
+        durations: list[int | float]
+        reference_text: str | ReferenceIndex
+        options: dict[str, Any] - options of `sync_alignment`
+
+    Returns:
+        tuple[str, list[int | float]] - the synchronised characters and durations
+    """
+
+    alignment = [
+        FastCharAlignment(character=char, duration=duration)
+        for char, duration in zip(characters, durations)
+    ]
+    sync_alignment(alignment, reference_text, **options)
+
+    return ''.join(al.character for al in alignment), [al.duration for al in alignment]
+
+
+def _copy_reference_characters(alignment: Alignment | ColumnarAlignment, reference_text: str) -> None:
+    """
+    Replaces the characters of the synchronised alignment that differ from the reference ones, keeping their durations
+    """
 
-    if both_integers and og_alignment_duration != new_alignment_duration:
+    # A wrong length is left for the checks to report
+    if len(alignment) != len(reference_text):
+        return
+
+    if isinstance(alignment, ColumnarAlignment):
+        alignment.characters = reference_text
+        return
+
+    new_char = get_char_factory(alignment)
+    for i, char in enumerate(reference_text):
+        if alignment[i].character != char:
+            alignment[i] = new_char(character=char, duration=alignment[i].duration)
+
+
+def _check_synchronised(
+        alignment: Alignment | ColumnarAlignment, reference_text: str, alignment_text: str, verify: str,
+        duration_change: int | float | Fraction,
+        og_alignment_duration: int | float | None = None, original_durations: list[int | float] | None = None
+    ) -> None:
+    """
+    Raises if the synchronised alignment lost duration or doesn't match the reference text, see `sync_alignment`
+    The cheap checks only use the tracked change of duration and the length, the full ones go through the whole alignment
+    """
+
+    duration_changed = not math.isclose(duration_change, 0, abs_tol=DURATION_TOLERANCE)
+
+    if verify == "full" and not duration_changed:
+        new_alignment_duration = get_alignment_duration(alignment)
+
+        # Only check if both are integers, otherwise we'd possibly have floating point errors
+        both_integers = isinstance(og_alignment_duration, int) and isinstance(new_alignment_duration, int)
+        duration_changed = both_integers and og_alignment_duration != new_alignment_duration
+
+    if duration_changed:
+        original_alignment = _original_alignment(alignment_text, original_durations)
         raise Exception(f"Alignment duration changed!\n\nOriginal alignment: {original_alignment}\nReference text: {reference_text}\n\nNew alignment: {alignment}")
-    
-    new_alignment_text = ''.join(al.character for al in alignment)
 
-    if new_alignment_text != reference_text:
+    # The cheap mode only checks the length, the full one the whole text
+    synchronised = (
+        len(alignment) == len(reference_text) and
+        (verify != "full" or get_alignment_text(alignment) == reference_text)
+    )
+
+    if not synchronised:
+        original_alignment = _original_alignment(alignment_text, original_durations)
         raise Exception(f"Alignment didn't synchronise to reference text!\n\nOriginal alignment: {original_alignment}\nReference text: {reference_text}\n\nNew alignment: {alignment}")
-    ## ---
 
 
+def _original_alignment(alignment_text: str, original_durations: list[int | float] | None) -> Alignment | str:
+    """
+    Rebuilds the original alignment for error reports, if its durations were kept
+    """
+
+    if original_durations is None:
+        return "(not kept, use verify=\"full\")"
 
+    return [
+        CharAlignment(character=char, duration=duration)
+        for char, duration in zip(alignment_text, original_durations)
+    ]
@@ -0,0 +1,264 @@
+import bisect
+import re
+from array import array
+
+from .matching import WORD_PATTERN
+from .models import Alignment, ColumnarAlignment
+from .utils import get_alignment_text, get_durations
+
+
+LINE_PATTERN = re.compile(r"[^\n]+")
+
+
+
+class _Spans:
+    """
+    Spans of characters (words or lines) of a text, with their starts and ends in separate arrays to bisect them
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, text: str, pattern: re.Pattern):
+        self.starts = array('q')
+        self.ends = array('q')
+        for match in pattern.finditer(text):
+            self.starts.append(match.start())
+            self.ends.append(match.end())
+
+    def containing(self, i: int) -> int | None:
+        """
+        Returns the index of the span containing the character, or None
+        """
+
+        k = bisect.bisect_right(self.starts, i) - 1
+        if k >= 0 and i < self.ends[k]:
+            return k
+        return None
+
+    def overlapping(self, start: int, end: int) -> range:
+        """
+        Returns the indexes of the spans overlapping the characters from start to end (excluded)
+        """
+
+        return range(bisect.bisect_right(self.ends, start), bisect.bisect_left(self.starts, end))
+
+
+
+class AlignmentTimeline:
+    """
+    Start time of every character of a synchronised alignment, as cumulative sums in a compact array
+    Answers "what is spoken at t" and "when is character i spoken" by bisection, in O(log n), without going through the alignment again
+
+    Words and lines are only found on first use, and given as character spans, no `CharAlignment` is made.
+    The timeline doesn't follow later changes of the alignment, build a new one after them
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+        offset: int | float = 0 - start time of the first character, in ms
+    """
+
+    __slots__ = ("text", "starts", "_words", "_lines")
+
+    def __init__(self, alignment: Alignment | ColumnarAlignment, offset: int | float = 0):
+        self.text = get_alignment_text(alignment)
+
+        # One more than the characters, the last one is the end of the alignment
+        self.starts = array('d', [offset])
+        time = offset
+        for duration in get_durations(alignment):
+            time += duration
+            self.starts.append(time)
+
+        self._words: _Spans | None = None
+        self._lines: _Spans | None = None
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def start_time(self) -> float:
+        return self.starts[0]
+
+    @property
+    def end_time(self) -> float:
+        return self.starts[-1]
+
+    def span(self, i: int) -> tuple[float, float]:
+        """
+        Returns the start and end time of character i
+
+        Parameters:
+            i: int
+
+        Returns:
+            tuple[float, float]
+        """
+
+        if not 0 <= i < len(self.text):
+            raise IndexError(f"Character index out of range: {i}")
+
+        return self.starts[i], self.starts[i+1]
+
+    def time_span(self, start: int, end: int) -> tuple[float, float]:
+        """
+        Returns the start and end time of the characters from start to end (excluded)
+
+        Parameters:
+            start: int
+            end: int
+
+        Returns:
+            tuple[float, float]
+        """
+
+        if not 0 <= start <= end <= len(self.text):
+            raise IndexError(f"Character span out of range: {start}, {end}")
+
+        return self.starts[start], self.starts[end]
+
+    def char_at(self, time: float) -> int | None:
+        """
+        Returns the index of the character spoken at the given time, or None if it is outside the alignment
+        Characters without duration are never spoken
+
+        Parameters:
+            time: float - in ms
+
+        Returns:
+            int | None
+        """
+
+        if not self.starts[0] <= time < self.starts[-1]:
+            return None
+
+        return bisect.bisect_right(self.starts, time) - 1
+
+    def chars_between(self, start_time: float, end_time: float) -> range:
+        """
+        Returns the indexes of the characters spoken at some point from start_time to end_time (excluded)
+
+        Parameters:
+            start_time: float - in ms
+            end_time: float - in ms
+
+        Returns:
+            range
+        """
+
+        # Characters ending after the start time, and starting before the end time
+        first = bisect.bisect_right(self.starts, start_time, 1) - 1
+        last = min(bisect.bisect_left(self.starts, end_time), len(self.text))
+
+        return range(first, max(first, last))
+
+    @property
+    def words(self) -> list[tuple[int, int]]:
+        """
+        Character spans (start, end excluded) of the words, separated by whitespace
+        """
+
+        return list(zip(self._word_spans().starts, self._word_spans().ends))
+
+    @property
+    def lines(self) -> list[tuple[int, int]]:
+        """
+        Character spans (start, end excluded) of the non-empty lines
+        """
+
+        return list(zip(self._line_spans().starts, self._line_spans().ends))
+
+    def word_at(self, time: float) -> int | None:
+        """
+        Returns the index of the word spoken at the given time, or None between words and outside the alignment
+
+        Parameters:
+            time: float - in ms
+
+        Returns:
+            int | None
+        """
+
+        i = self.char_at(time)
+        return None if i is None else self._word_spans().containing(i)
+
+    def words_between(self, start_time: float, end_time: float) -> range:
+        """
+        Returns the indexes of the words spoken at some point from start_time to end_time (excluded)
+
+        Parameters:
+            start_time: float - in ms
+            end_time: float - in ms
+
+        Returns:
+            range
+        """
+
+        chars = self.chars_between(start_time, end_time)
+        return self._word_spans().overlapping(chars.start, chars.stop)
+
+    def line_at(self, time: float) -> int | None:
+        """
+        Returns the index of the line spoken at the given time, or None between lines and outside the alignment
+
+        Parameters:
+            time: float - in ms
+
+        Returns:
+            int | None
+        """
+
+        i = self.char_at(time)
+        return None if i is None else self._line_spans().containing(i)
+
+    def lines_between(self, start_time: float, end_time: float) -> range:
+        """
+        Returns the indexes of the lines spoken at some point from start_time to end_time (excluded)
+
+        Parameters:
+            start_time: float - in ms
+            end_time: float - in ms
+
+        Returns:
+            range
+        """
+
+        chars = self.chars_between(start_time, end_time)
+        return self._line_spans().overlapping(chars.start, chars.stop)
+
+    def word_span(self, k: int) -> tuple[float, float]:
+        """
+        Returns the start and end time of word k
+
+        Parameters:
+            k: int
+
+        Returns:
+            tuple[float, float]
+        """
+
+        words = self._word_spans()
+        return self.starts[words.starts[k]], self.starts[words.ends[k]]
+
+    def line_span(self, k: int) -> tuple[float, float]:
+        """
+        Returns the start and end time of line k
+
+        Parameters:
+            k: int
+
+        Returns:
+            tuple[float, float]
+        """
+
+        lines = self._line_spans()
+        return self.starts[lines.starts[k]], self.starts[lines.ends[k]]
+
+    def _word_spans(self) -> _Spans:
+        if self._words is None:
+            self._words = _Spans(self.text, WORD_PATTERN)
+        return self._words
+
+    def _line_spans(self) -> _Spans:
+        if self._lines is None:
+            self._lines = _Spans(self.text, LINE_PATTERN)
+        return self._lines
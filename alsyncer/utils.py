@@ -1,6 +1,10 @@
 import math
+from array import array
+from fractions import Fraction
+from typing import Callable, MutableSequence
 
-from .models import Alignment, CharAlignment
+from .models import Alignment, CharAlignment, ColumnarAlignment, FastCharAlignment
+from .vectorized import np, round_durations, use_numpy
 
 
 def chunk(indexes: list[int]) -> list[list[int]]:
@@ -38,9 +42,190 @@ def chunk(indexes: list[int]) -> list[list[int]]:
 
 
 
+def get_alignment_text(alignment: Alignment | ColumnarAlignment) -> str:
+    """
+    Returns the text of the alignment
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+
+    Returns:
+        str
+    """
+
+    if isinstance(alignment, ColumnarAlignment):
+        return alignment.characters
+
+    return ''.join(al.character for al in alignment)
+
+
+def get_alignment_duration(alignment: Alignment | ColumnarAlignment) -> int | float:
+    """
+    Returns the total duration of the alignment
+    NOTE: Columnar alignments store floats, their total is given as an integer when it is one
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+
+    Returns:
+        int | float
+    """
+
+    if isinstance(alignment, ColumnarAlignment):
+        total = sum(alignment.durations)
+        return int(total) if total.is_integer() else total
+
+    return sum(al.duration for al in alignment)
+
+
+class _DurationsView:
+    """
+    Mutable sequence over the durations of a list of `CharAlignment`, without copying them
+    """
+
+    __slots__ = ("alignment",)
+
+    def __init__(self, alignment: Alignment):
+        self.alignment = alignment
+
+    def __len__(self) -> int:
+        return len(self.alignment)
+
+    def __getitem__(self, i: int) -> int | float:
+        return self.alignment[i].duration
+
+    def __setitem__(self, i: int, duration: int | float) -> None:
+        self.alignment[i].duration = duration
+
+
+def get_durations(alignment: Alignment | ColumnarAlignment) -> MutableSequence[int | float]:
+    """
+    Returns the durations of the alignment, as a sequence that can be read and written by index
+    Writing to it updates the alignment
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+
+    Returns:
+        MutableSequence[int | float]
+    """
+
+    if isinstance(alignment, ColumnarAlignment):
+        return alignment.durations
+
+    return _DurationsView(alignment)
+
+
+def get_char_factory(alignment: Alignment) -> Callable[..., CharAlignment | FastCharAlignment]:
+    """
+    Returns how to build new characters of the same type as the ones of the alignment
+
+    Parameters:
+        alignment: Alignment
+
+    Returns:
+        Callable[..., CharAlignment | FastCharAlignment] - takes character and duration keywords
+    """
+
+    if alignment and isinstance(alignment[0], FastCharAlignment):
+        return FastCharAlignment
+
+    return CharAlignment
+
+
+def insert_chars(alignment: Alignment | ColumnarAlignment, insertions: list[tuple[int, list[str], list[int | float]]]) -> None:
+    """
+    Inserts characters with their durations into the alignment, merging everything in a single pass
+    Each insertion is given at its index in the alignment before any insertion
+    NOTE: Expects the insertions to be sorted by index
+    Mutates in place
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+        insertions: list[tuple[int, list[str], list[int | float]]] - index, characters and durations
+    """
+
+    if not insertions:
+        return
+
+    if isinstance(alignment, ColumnarAlignment):
+        characters = alignment.characters
+        durations = alignment.durations
+
+        new_characters: list[str] = []
+        new_durations = array('d')
+        start = 0
+        for index, inserted_characters, inserted_durations in insertions:
+            new_characters.append(characters[start:index])
+            new_characters.extend(inserted_characters)
+            new_durations.extend(durations[start:index])
+            new_durations.extend(inserted_durations)
+            start = index
+        new_characters.append(characters[start:])
+        new_durations.extend(durations[start:])
+
+        alignment.characters = ''.join(new_characters)
+        alignment.durations = new_durations
+        return
+
+    new_char = get_char_factory(alignment)
+
+    merged: Alignment = []
+    start = 0
+    for index, inserted_characters, inserted_durations in insertions:
+        merged.extend(alignment[start:index])
+        merged.extend(
+            new_char(character=char, duration=duration)
+            for char, duration in zip(inserted_characters, inserted_durations)
+        )
+        start = index
+    merged.extend(alignment[start:])
+
+    # Slice assignment keeps the same list
+    alignment[:] = merged
+
+
+def remove_chars(alignment: Alignment | ColumnarAlignment, indexes: list[int]) -> None:
+    """
+    Removes the characters at the given indexes from the alignment, in a single sweep
+    NOTE: Expects the indexes to be sorted
+    Mutates in place
+
+    Parameters:
+        alignment: Alignment | ColumnarAlignment
+        indexes: list[int]
+    """
+
+    # Keep the runs of characters between the removed ones
+    runs: list[tuple[int, int]] = []
+    start = 0
+    for i in indexes:
+        if i != start:
+            runs.append((start, i))
+        start = i + 1
+    runs.append((start, len(alignment)))
+
+    if isinstance(alignment, ColumnarAlignment):
+        characters = alignment.characters
+        durations = alignment.durations
+        alignment.characters = ''.join([characters[run_start:run_end] for run_start, run_end in runs])
+        alignment.durations = array('d')
+        for run_start, run_end in runs:
+            alignment.durations.extend(durations[run_start:run_end])
+        return
+
+    kept: Alignment = []
+    for run_start, run_end in runs:
+        kept.extend(alignment[run_start:run_end])
+
+    # Slice assignment keeps the same list
+    alignment[:] = kept
+
+
+
 EPS = 1e-9
 
-def round_alignment(alignment: Alignment) -> None:
+def round_alignment(alignment: Alignment | ColumnarAlignment, bias: float = 0, backend: str = "auto") -> float:
     """
     After processing, the alignment may contain floating point number
     This function takes care of rounding those to ensure the alignment contains only integers, which are often needed for further processing.
@@ -51,7 +236,13 @@ def round_alignment(alignment: Alignment) -> None:
     This ensures local smoothness.
 
     Parameters:
-        alignment: Alignment
+        alignment: Alignment | ColumnarAlignment
+        bias: float = 0 - bias carried from a previous alignment, when rounding one in several parts
+        backend: str = "auto" - "python", "numpy", or "auto" to use NumPy when it is installed, see `vectorized.use_numpy`.
+                                NumPy falls back to Python when it can't be sure to round the same, see `vectorized.round_durations`
+
+    Returns:
+        float - the bias left at the end, to carry to the next part
 
     -----------
 
@@ -63,11 +254,50 @@ def round_alignment(alignment: Alignment) -> None:
         [0.5, 1.5] -> [2] (because 0.5 does not exceed 0.5)
     """
 
-    sum_durs = sum(al.duration for al in alignment)
-    if not math.isclose(sum_durs, round(sum_durs), abs_tol=EPS):
+    # Exact fractions need no tolerance
+    sum_durs = get_alignment_duration(alignment)
+    if isinstance(sum_durs, Fraction):
+        integer_sum = sum_durs.denominator == 1
+    else:
+        integer_sum = math.isclose(sum_durs, round(sum_durs), abs_tol=EPS)
+
+    if not integer_sum:
         raise Exception("The sum of all the durations of the alignment is not an integer!")
 
-    bias = 0
+    if use_numpy(backend, len(alignment)):
+        if isinstance(alignment, ColumnarAlignment):
+            durations = np.frombuffer(alignment.durations, dtype=np.float64)
+        else:
+            durations = np.fromiter((al.duration for al in alignment), dtype=np.float64, count=len(alignment))
+
+        rounded = round_durations(durations, bias)
+        if rounded is not None:
+            new_durations, bias = rounded
+
+            if isinstance(alignment, ColumnarAlignment):
+                durations[:] = new_durations
+            else:
+                for al, new_duration in zip(alignment, new_durations.tolist()):
+                    al.duration = new_duration
+
+            return bias
+
+    # Columnar durations stay floats, but hold integer values
+    if isinstance(alignment, ColumnarAlignment):
+        durations = alignment.durations
+        for i, duration in enumerate(durations):
+            bias += duration - int(duration)
+
+            new_duration = int(duration)
+
+            if bias > 0.5:
+                bias -= 1
+                new_duration += 1
+
+            durations[i] = new_duration
+
+        return bias
+
     for al in alignment:
         bias += al.duration - int(al.duration)
 
@@ -78,3 +308,5 @@ def round_alignment(alignment: Alignment) -> None:
             new_duration += 1
 
         al.duration = new_duration
+
+    return bias
\ No newline at end of file
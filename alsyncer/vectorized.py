@@ -0,0 +1,319 @@
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, the pure Python path is used without it
+    np = None
+
+
+# Below this number of indexes, the pure Python path is faster
+NUMPY_THRESHOLD = 64
+
+# Same for missing characters, each chunk of them costs more to set up in NumPy
+MISSING_NUMPY_THRESHOLD = 128
+
+# Fractions with at most this many bits after the point are summed exactly by floats, whatever the order
+EXACT_FRACTION_BITS = 20
+
+# Size of the blocks the cumulative sums of the rounding are taken in
+CUMSUM_BLOCK = 1024
+
+
+
+def use_numpy(backend: str, size: int, threshold: int = NUMPY_THRESHOLD) -> bool:
+    """
+    Returns whether to use the NumPy backend
+
+    Parameters:
+        backend: str - "python", "numpy", or "auto" to use NumPy when it is installed and there is enough work
+        size: int - number of indexes to process
+        threshold: int = NUMPY_THRESHOLD - size from which "auto" uses NumPy
+
+    Returns:
+        bool
+    """
+
+    if backend == "python":
+        return False
+
+    if backend == "numpy":
+        if np is None:
+            raise Exception("NumPy is not installed")
+        return True
+
+    if backend == "auto":
+        return np is not None and size >= threshold
+
+    raise Exception(f"Unknown backend: {backend}")
+
+
+
+def _chunk_bounds(indexes: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Returns the start and end positions (in the indexes array) of each chunk of contiguous indexes
+    """
+
+    breaks = np.flatnonzero(np.diff(indexes) != 1) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(indexes)]))
+    return starts, ends
+
+
+def _sequential_sums(values: "np.ndarray", starts: "np.ndarray", counts: "np.ndarray") -> "np.ndarray":
+    """
+    Sums `counts` values from each start, adding them one after the other like `sum` does
+    Vectorized over the sums, so floats are rounded exactly like in pure Python
+    """
+
+    sums = np.zeros(len(starts))
+    for k in range(int(counts.max(initial=0))):
+        running = counts > k
+        sums[running] += values[starts[running] + k]
+    return sums
+
+
+
+def redistribute_additions(
+        values: "np.ndarray", additions: list[int], alignment_length: int,
+        integer_values: "np.ndarray | None" = None
+    ) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Vectorized equivalent of the distribution in `syncer.remove_additions`
+
+    Parameters:
+        values: np.ndarray - durations of the additions, as floats
+        additions: list[int]
+        alignment_length: int
+        integer_values: np.ndarray | None = None - whether each duration of the additions was an integer
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray] - indexes receiving a duration, in the order they receive it,
+                                                    the received durations, and whether each one would be an integer in pure Python
+    """
+
+    additions = np.asarray(additions)
+    starts, ends = _chunk_bounds(additions)
+    counts = ends - starts
+
+    first = additions[starts]
+    last = additions[ends - 1]
+
+    from_beginning = first == 0
+    to_end = ~from_beginning & (last == alignment_length - 1)
+    middle = ~from_beginning & ~to_end
+
+    # Chunks at an edge give everything to their only neighbour
+    halves = counts // 2
+    left_counts = np.where(middle, halves, counts)
+    left_sums = _sequential_sums(values, starts, left_counts)
+    right_sums = _sequential_sums(values, ends - halves, halves)
+
+    # If odd, split the middle
+    odd = middle & (counts % 2 == 1)
+    middle_halves = values[starts + halves] / 2
+    left_sums[odd] += middle_halves[odd]
+    right_sums[odd] += middle_halves[odd]
+
+    # Sums of integers stay integers, unless the middle was split
+    if integer_values is None:
+        left_integer = right_integer = np.zeros(len(first), dtype=bool)
+    else:
+        non_integers = np.concatenate(([0], np.cumsum(~integer_values)))
+        left_integer = (non_integers[starts + left_counts] == non_integers[starts]) & ~odd
+        right_integer = (non_integers[ends] == non_integers[ends - halves]) & ~odd
+
+    # Each chunk gives to its left neighbour, then to its right one
+    targets = np.stack((
+        np.where(from_beginning, last + 1, first - 1),
+        last + 1
+    ), axis=1)
+    received = np.stack((left_sums, right_sums), axis=1)
+    gives = np.stack((np.ones(len(first), dtype=bool), middle), axis=1)
+    integers = np.stack((left_integer, right_integer), axis=1)
+
+    return targets[gives], received[gives], integers[gives]
+
+
+
+def missing_neighbours(missing: list[int], alignment_length: int) -> "np.ndarray":
+    """
+    Returns the indexes of the only durations `distribute_missing` reads: the previous and next characters of each chunk of missing characters,
+    so they can be gathered without loading the whole alignment
+
+    Parameters:
+        missing: list[int]
+        alignment_length: int
+
+    Returns:
+        np.ndarray - for each chunk, the index of its previous and next characters in the alignment (clipped to it)
+    """
+
+    missing = np.asarray(missing)
+    starts, ends = _chunk_bounds(missing)
+    counts = ends - starts
+
+    # Index of the next char in the original alignment
+    next_i = missing[starts] - (np.cumsum(counts) - counts)
+
+    return np.clip(np.stack((next_i - 1, next_i), axis=1), 0, alignment_length - 1)
+
+
+def distribute_missing(
+        neighbour_durations: "np.ndarray", alignment_length: int, reference_length: int, missing: list[int]
+    ) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Vectorized equivalent of the distribution in `syncer.add_missing`
+    Only reads the durations of the neighbours of each chunk, see `missing_neighbours`
+
+    Parameters:
+        neighbour_durations: np.ndarray - durations at the indexes given by `missing_neighbours`, as floats
+        alignment_length: int
+        reference_length: int
+        missing: list[int]
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] - updated indexes and their new durations,
+                                                                          and for each chunk its index in the original alignment, its bounds in the missing indexes,
+                                                                          followed by the durations of all the inserted characters
+    """
+
+    missing = np.asarray(missing)
+    starts, ends = _chunk_bounds(missing)
+    counts = ends - starts
+
+    first = missing[starts]
+    last = missing[ends - 1]
+
+    # Index of the next char in the original alignment
+    next_i = first - (np.cumsum(counts) - counts)
+
+    prev_counts = np.concatenate(([0], counts[:-1]))
+    next_counts = np.concatenate((counts[1:], [0]))
+    prev_distributed = np.concatenate(([False], last[:-1] == first[1:] - 2))
+    next_distributed = np.concatenate((first[1:] == last[:-1] + 2, [False]))
+    prev_starts = np.concatenate(([False], first[:-1] == 0))
+    next_ends = np.concatenate((last[1:] == reference_length - 1, [False]))
+
+    from_beginning = first == 0
+    to_end = ~from_beginning & (last == reference_length - 1)
+    middle = ~from_beginning & ~to_end
+
+    # Neighbour durations are always read before being updated
+    prev_dur = neighbour_durations[:, 0]
+    next_dur = neighbour_durations[:, 1]
+
+    # Edges split evenly with their only neighbour
+    beginning_per_char = np.where(
+        next_distributed,
+        np.where(
+            next_ends,
+            next_dur / (counts + 1 + next_counts),
+            2 / (2 * counts + 2 + next_counts) * next_dur
+        ),
+        next_dur / (counts + 1)
+    )
+    end_per_char = np.where(
+        prev_distributed,
+        np.where(
+            prev_starts,
+            prev_dur / (counts + 1 + prev_counts),
+            2 / (2 * counts + 2 + prev_counts) * prev_dur
+        ),
+        prev_dur / (counts + 1)
+    )
+
+    # Middle chunks take from both neighbours
+    prev_div = counts + 2 + np.where(prev_distributed, np.where(prev_starts, 2 * prev_counts, prev_counts), 0)
+    next_div = counts + 2 + np.where(next_distributed, np.where(next_ends, 2 * next_counts, next_counts), 0)
+    from_prev = 2 / prev_div * prev_dur
+    from_next = 2 / next_div * next_dur
+    from_both = prev_dur / prev_div + next_dur / next_div
+
+    # Updated neighbours, at most one update per index
+    updated_indexes = np.concatenate((
+        np.zeros(np.count_nonzero(from_beginning & ~next_distributed), dtype=np.int64),
+        np.full(np.count_nonzero(to_end), alignment_length - 1),
+        next_i[middle] - 1,
+        next_i[middle & ~next_distributed],
+    ))
+    updated_durations = np.concatenate((
+        beginning_per_char[from_beginning & ~next_distributed],
+        end_per_char[to_end],
+        from_prev[middle],
+        from_next[middle & ~next_distributed],
+    ))
+
+    # Inserted characters, as (left, middle, right) runs for each chunk
+    per_char = np.where(from_beginning, beginning_per_char, end_per_char)
+    run_durations = np.stack((
+        np.where(middle, from_prev, per_char),
+        from_both,
+        np.where(middle, from_next, per_char),
+    ), axis=1)
+    halves = counts // 2
+    run_counts = np.stack((
+        np.where(middle, halves, counts),
+        np.where(middle, counts % 2, 0),
+        np.where(middle, halves, 0),
+    ), axis=1)
+    inserted_durations = np.repeat(run_durations.ravel(), run_counts.ravel())
+
+    return updated_indexes, updated_durations, next_i, np.stack((starts, ends), axis=1), inserted_durations
+
+
+
+def round_durations(durations: "np.ndarray", bias: float = 0) -> tuple["np.ndarray", float] | None:
+    """
+    Vectorized equivalent of `utils.round_alignment`, on durations
+    The carried bias is replaced by a cumulative sum of the fractional parts: each duration is rounded up
+    whenever that sum goes over the number of durations rounded up so far, plus 0.5
+
+    A cumulative sum doesn't round floats like the carried bias does. The result is only given when it is surely the same:
+    when fractional parts are summed exactly, or when no cumulative sum comes closer to a tie than both rounding errors. Otherwise, returns None
+
+    Parameters:
+        durations: np.ndarray - as floats
+        bias: float = 0
+
+    Returns:
+        tuple[np.ndarray, float] | None - rounded durations as integers, and the bias left at the end
+    """
+
+    length = len(durations)
+    if not length:
+        return np.zeros(0, dtype=np.int64), bias
+
+    floors = np.trunc(durations)
+    fractions = durations - floors
+
+    # Sums are taken within blocks, then offset by the total of the previous blocks, to keep their error small
+    blocks = -(-length // CUMSUM_BLOCK)
+    padded = np.zeros(blocks * CUMSUM_BLOCK)
+    padded[:length] = fractions
+    local = np.cumsum(padded.reshape(blocks, CUMSUM_BLOCK), axis=1)
+    offsets = bias + np.concatenate(([0], np.cumsum(local[:, -1])[:-1]))
+    cumulative = (local + offsets[:, None]).ravel()[:length]
+
+    shifted = cumulative - 0.5
+    rounded_up = np.ceil(shifted)
+
+    scaled = fractions * 2**EXACT_FRACTION_BITS
+    exact = (
+        float(bias * 2**EXACT_FRACTION_BITS).is_integer() and
+        np.array_equal(scaled, np.trunc(scaled)) and
+        length < 2**(52 - EXACT_FRACTION_BITS)
+    )
+
+    if not exact:
+        # Bound of the errors of the cumulative sums, and of the carried bias (at most 0.75 eps per step)
+        eps = np.finfo(np.float64).eps
+        tolerance = eps * (
+            CUMSUM_BLOCK * CUMSUM_BLOCK
+            + (blocks + 2) * float(np.abs(cumulative).max())
+            + length
+        )
+        if np.any(np.abs(shifted - np.round(shifted)) <= tolerance):
+            return None
+
+    increments = np.diff(rounded_up, prepend=0)
+    new_durations = floors.astype(np.int64) + increments.astype(np.int64)
+
+    return new_durations, float(cumulative[-1] - rounded_up[-1])
@@ -0,0 +1,34 @@
+"""
+Measures how `add_missing` scales with the number of missing characters
+The time should grow linearly with the number of missing characters, for a fixed alignment length
+
+Run from the repository root:
+    python -m benchmarks.bench_add
+"""
+import random
+import time
+
+from alsyncer import FastCharAlignment
+from alsyncer.syncer import add_missing
+
+
+def main() -> None:
+    length = 200_000
+    print(f"alignment of {length} chars")
+    print(f"{'missing':>10} {'time (s)':>10} {'us/missing':>11}")
+
+    for count in (1_000, 5_000, 20_000, 50_000, 100_000):
+        rng = random.Random(count)
+        reference_text = "a" * (length + count)
+        missing = sorted(rng.sample(range(length + count), count))
+        alignment = [FastCharAlignment("a", rng.randint(20, 120)) for _ in range(length)]
+
+        start = time.perf_counter()
+        add_missing(alignment, reference_text, missing)
+        elapsed = time.perf_counter() - start
+
+        print(f"{count:>10} {elapsed:>10.3f} {elapsed / count * 1e6:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares the pure Python and NumPy backends of the duration distribution and rounding, and what "auto" picks
+Includes small edits on long alignments, where NumPy should lose and "auto" should stay on Python
+
+Run from the repository root:
+    python -m benchmarks.bench_backends
+"""
+import random
+import time
+
+from alsyncer import ColumnarAlignment, FastCharAlignment
+from alsyncer.syncer import add_missing, remove_additions
+from alsyncer.utils import round_alignment
+
+
+# (form, length, number of additions, number of missing chars)
+CASES = [
+    ("columnar", 200_000, 20_000, 20_000),
+    ("list", 200_000, 20_000, 20_000),
+    ("list", 200_000, 200, 200),
+    ("list", 5_000, 100, 100),
+    ("columnar", 200_000, 64, 64),
+]
+
+
+def time_backend(form: str, length: int, additions: list[int], missing: list[int], durations: list[int], backend: str) -> tuple[float, float, float]:
+    """
+    Returns the time to remove the additions, add the missing chars and round, with the given backend
+    """
+    reference_text = "a" * (length - len(additions) + len(missing))
+    if form == "columnar":
+        alignment = ColumnarAlignment("a" * length, durations)
+    else:
+        alignment = [FastCharAlignment("a", duration) for duration in durations]
+
+    start = time.perf_counter()
+    remove_additions(alignment, additions, backend)
+    removed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    add_missing(alignment, reference_text, missing, backend)
+    added = time.perf_counter() - start
+
+    start = time.perf_counter()
+    round_alignment(alignment, backend=backend)
+    rounded = time.perf_counter() - start
+
+    return removed, added, rounded
+
+
+def main() -> None:
+    print(f"{'form':>8} {'length':>8} {'edits':>6} {'backend':>8} {'remove (s)':>11} {'add (s)':>8} {'round (s)':>10}")
+
+    for form, length, addition_count, missing_count in CASES:
+        rng = random.Random(0)
+        durations = [rng.randint(20, 120) for _ in range(length)]
+        additions = sorted(rng.sample(range(length), addition_count))
+        missing = sorted(rng.sample(range(length - addition_count + missing_count), missing_count))
+
+        for backend in ("python", "numpy", "auto"):
+            # Best of a few runs, small cases are noisy
+            best = [min(times) for times in zip(*(
+                time_backend(form, length, additions, missing, durations, backend) for _ in range(5)
+            ))]
+            print(f"{form:>8} {length:>8} {addition_count:>6} {backend:>8} {best[0]:>11.4f} {best[1]:>8.4f} {best[2]:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Measures how `sync_many` scales from 1 to N worker processes
+
+Run from the repository root:
+    python -m benchmarks.bench_batch
+"""
+import os
+import random
+import time
+
+from alsyncer import CharAlignment, sync_many
+from benchmarks.bench_fit import make_pair
+
+
+def make_pairs(count: int, length: int) -> list[tuple[list[CharAlignment], str]]:
+    """
+    Makes (alignment, reference text) pairs with random integer durations
+    """
+    pairs = []
+    for seed in range(count):
+        alignment_text, reference_text = make_pair(length, edit_rate=0.02, seed=seed)
+        rng = random.Random(seed)
+        alignment = [CharAlignment(character=char, duration=rng.randint(20, 120)) for char in alignment_text]
+        pairs.append((alignment, reference_text))
+    return pairs
+
+
+def main() -> None:
+    count = 200
+    length = 2000
+
+    print(f"{count} pairs of {length} chars")
+    print(f"{'workers':>8} {'time (s)':>10} {'speedup':>8}")
+
+    baseline = None
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        pairs = make_pairs(count, length)
+        start = time.perf_counter()
+        sync_many(pairs, workers=workers, chunksize=4)
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Loads alignments from JSON lines into pydantic models, and from a binary file written with `write_alignments`
+Reports the size of both files, the time to open them and load every record, and the time to load a single record
+
+Run from the repository root:
+    python -m benchmarks.bench_binary
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from alsyncer import AlignmentFile, ColumnarAlignment, write_alignments
+from alsyncer.utils import CharAlignment
+
+
+RECORDS = 2000
+LENGTH = 500
+
+
+def make_alignments(seed: int = 0) -> list[ColumnarAlignment]:
+    """
+    Makes random alignments of about LENGTH characters
+    """
+    rng = random.Random(seed)
+    return [
+        ColumnarAlignment(
+            "".join(rng.choice("abcdefgh ") for _ in range(LENGTH)),
+            [rng.randint(0, 200) for _ in range(LENGTH)]
+        )
+        for _ in range(RECORDS)
+    ]
+
+
+def main() -> None:
+    alignments = make_alignments()
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "alignments.jsonl")
+        binary_path = os.path.join(directory, "alignments.bin")
+
+        with open(json_path, "w") as file:
+            for alignment in alignments:
+                file.write(json.dumps([char.model_dump() for char in alignment.to_alignment()]) + "\n")
+        write_alignments(binary_path, alignments)
+
+        start = time.perf_counter()
+        with open(json_path) as file:
+            loaded = [[CharAlignment(**char) for char in json.loads(line)] for line in file]
+        json_all = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(json_path) as file:
+            for k, line in enumerate(file):
+                if k == RECORDS // 2:
+                    [CharAlignment(**char) for char in json.loads(line)]
+                    break
+        json_one = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with AlignmentFile(binary_path) as file:
+            loaded_binary = list(file)
+        binary_all = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with AlignmentFile(binary_path) as file:
+            file[RECORDS // 2]
+        binary_one = time.perf_counter() - start
+
+        assert [alignment.to_alignment() for alignment in loaded_binary] == loaded
+
+        print(f"{'format':>8} {'size (KB)':>10} {'all (s)':>10} {'one (s)':>10}")
+        print(f"{'json':>8} {os.path.getsize(json_path) / 1024:>10.0f} {json_all:>10.4f} {json_one:>10.5f}")
+        print(f"{'binary':>8} {os.path.getsize(binary_path) / 1024:>10.0f} {binary_all:>10.4f} {binary_one:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
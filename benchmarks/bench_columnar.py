@@ -0,0 +1,47 @@
+"""
+Compares a list of `CharAlignment` with a `ColumnarAlignment`
+Reports the memory taken by the alignment itself and the time of a full `sync_alignment`
+
+Run from the repository root:
+    python -m benchmarks.bench_columnar
+"""
+import random
+import time
+import tracemalloc
+
+from alsyncer import CharAlignment, ColumnarAlignment, sync_alignment
+from benchmarks.bench_fit import make_pair
+
+
+def build_list(text: str, durations: list[int]) -> list[CharAlignment]:
+    return [CharAlignment(character=char, duration=duration) for char, duration in zip(text, durations)]
+
+
+def build_columnar(text: str, durations: list[int]) -> ColumnarAlignment:
+    return ColumnarAlignment(text, durations)
+
+
+def main() -> None:
+    print(f"{'length':>8} {'form':>9} {'build (s)':>10} {'memory (KiB)':>13} {'sync (s)':>9}")
+    for length in (2000, 9000, 50000):
+        alignment_text, reference_text = make_pair(length, edit_rate=0.02)
+        rng = random.Random(length)
+        durations = [rng.randint(20, 120) for _ in alignment_text]
+
+        for form, build in (("list", build_list), ("columnar", build_columnar)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            alignment = build(alignment_text, durations)
+            built = time.perf_counter() - start
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            sync_alignment(alignment, reference_text, words=True)
+            synced = time.perf_counter() - start
+
+            print(f"{length:>8} {form:>9} {built:>10.4f} {memory / 1024:>13.1f} {synced:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
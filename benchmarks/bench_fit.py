@@ -0,0 +1,66 @@
+"""
+Compares the fitting engines on a synthetic transcript
+Reports wall time and peak memory (traced Python allocations) for each engine
+
+Run from the repository root:
+    python -m benchmarks.bench_fit
+"""
+import random
+import time
+import tracemalloc
+
+from alsyncer.syncer import fit_alignment
+
+
+def make_pair(length: int, edit_rate: float, seed: int = 0) -> tuple[str, str]:
+    """
+    Makes an (alignment text, reference text) pair where the alignment text has random substitutions
+    """
+    rng = random.Random(seed)
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9))) for _ in range(500)]
+
+    reference_text = ""
+    while len(reference_text) < length:
+        reference_text += rng.choice(words) + " "
+    reference_text = reference_text[:length]
+
+    alignment_chars = list(reference_text)
+    for _ in range(int(length * edit_rate)):
+        alignment_chars[rng.randrange(length)] = rng.choice("XYZ")
+
+    return "".join(alignment_chars), reference_text
+
+
+def measure(alignment_text: str, reference_text: str, engine: str, anchors: bool = False, words: bool = False) -> tuple[float, int]:
+    """
+    Returns the wall time and the peak traced memory of one fit
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    fit_alignment(alignment_text, reference_text, engine=engine, anchors=anchors, words=words)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    print(f"{'length':>8} {'engine':>18} {'time (s)':>10} {'peak (KiB)':>11}")
+    for length in (500, 2000, 9000, 50000):
+        alignment_text, reference_text = make_pair(length, edit_rate=0.02)
+        for engine, anchors, words in (
+            ("greedy", False, False),
+            ("automaton", False, False),
+            ("automaton", True, False),
+            ("automaton", False, True),
+        ):
+            # The greedy scan is cubic, skip it where it would take minutes
+            if engine == "greedy" and length > 500:
+                continue
+            elapsed, peak = measure(alignment_text, reference_text, engine, anchors, words)
+            name = engine + ("+anchors" if anchors else "") + ("+words" if words else "")
+            print(f"{length:>8} {name:>18} {elapsed:>10.3f} {peak / 1024:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Fits several hypotheses of one reference text, with the raw string and with a `ReferenceIndex` built once
+The build time of the index is reported separately
+
+Run from the repository root:
+    python -m benchmarks.bench_index
+"""
+import random
+import time
+
+from alsyncer import ReferenceIndex
+from alsyncer.syncer import fit_alignment
+from benchmarks.bench_fit import make_pair
+
+
+HYPOTHESES = 8
+
+
+def make_hypothesis(reference_text: str, edit_rate: float, seed: int) -> str:
+    """
+    Makes another alignment text of the same reference text, with its own random substitutions
+    """
+    rng = random.Random(seed)
+    chars = list(reference_text)
+    for _ in range(int(len(chars) * edit_rate)):
+        chars[rng.randrange(len(chars))] = rng.choice("XYZ")
+    return "".join(chars)
+
+
+def main() -> None:
+    print(f"{'length':>8} {'mode':>6} {'build (s)':>10} {'string (s)':>11} {'index (s)':>10}")
+    for length in (2000, 20000, 50000, 100000):
+        _, reference_text = make_pair(length, edit_rate=0.02)
+        hypotheses = [make_hypothesis(reference_text, 0.02, seed) for seed in range(HYPOTHESES)]
+
+        start = time.perf_counter()
+        index = ReferenceIndex(reference_text)
+        built = time.perf_counter() - start
+
+        for mode in ("chars", "words"):
+            words = mode == "words"
+            if not words and length > 50000:
+                continue
+
+            timings = []
+            for reference in (reference_text, index):
+                start = time.perf_counter()
+                for alignment_text in hypotheses:
+                    fit_alignment(alignment_text, reference, engine="automaton", words=words)
+                timings.append(time.perf_counter() - start)
+
+            print(f"{length:>8} {mode:>6} {built:>10.3f} {timings[0]:>11.3f} {timings[1]:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
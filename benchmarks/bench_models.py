@@ -0,0 +1,37 @@
+"""
+Compares building `CharAlignment` (pydantic) with `FastCharAlignment` (slotted dataclass)
+Reports construction time and memory per object
+
+Run from the repository root:
+    python -m benchmarks.bench_models
+"""
+import time
+import tracemalloc
+
+from alsyncer import CharAlignment, FastCharAlignment
+
+
+def main() -> None:
+    count = 100_000
+    print(f"{count} objects")
+    print(f"{'model':>27} {'build (s)':>10} {'bytes/object':>13}")
+
+    builders = (
+        ("CharAlignment", lambda i: CharAlignment(character="a", duration=i)),
+        ("FastCharAlignment", lambda i: FastCharAlignment(character="a", duration=i)),
+        ("FastCharAlignment.validated", lambda i: FastCharAlignment.validated("a", i)),
+    )
+    for name, build in builders:
+        tracemalloc.start()
+        start = time.perf_counter()
+        objects = [build(i) for i in range(count)]
+        elapsed = time.perf_counter() - start
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objects
+
+        print(f"{name:>27} {elapsed:>10.4f} {memory / count:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
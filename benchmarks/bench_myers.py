@@ -0,0 +1,97 @@
+"""
+Compares the Myers diff matcher with the greedy longest common substring one
+Reports the time of both on synthetic workloads, then where their fits differ on a corpus of small pairs
+
+Run from the repository root:
+    python -m benchmarks.bench_myers
+"""
+import time
+
+from alsyncer.syncer import fit_alignment
+from benchmarks.workload import EDIT_TYPES, make_workload
+
+
+def show(text: str, removed: list[int]) -> str:
+    """
+    Shows the removed characters of a text in brackets
+    """
+    removed = set(removed)
+    return "".join(f"[{char}]" if i in removed else char for i, char in enumerate(text))
+
+
+def timings() -> None:
+    print(f"{'length':>8} {'mode':>6} {'greedy (s)':>11} {'myers (s)':>10} {'greedy edits':>13} {'myers edits':>12}")
+    for length in (1000, 10_000, 100_000):
+        alignment_text, _, reference_text = make_workload(length, edit_rate=0.02, burst_size=3)
+
+        for mode in ("chars", "words"):
+            # Char by char, both are too slow on long texts
+            if mode == "chars" and length > 10_000:
+                continue
+
+            row = []
+            for matcher in ("greedy", "myers"):
+                start = time.perf_counter()
+                additions, missing = fit_alignment(alignment_text, reference_text, words=mode == "words", matcher=matcher)
+                row.append((time.perf_counter() - start, len(additions) + len(missing)))
+
+            (greedy_time, greedy_edits), (myers_time, myers_edits) = row
+            print(f"{length:>8} {mode:>6} {greedy_time:>11.3f} {myers_time:>10.3f} {greedy_edits:>13} {myers_edits:>12}")
+
+
+def differences() -> None:
+    corpus = [
+        make_workload(200, edit_rate=0.05, burst_size=burst, edit_types=(edit_type,), seed=seed)
+        for edit_type in EDIT_TYPES
+        for burst in (1, 4)
+        for seed in range(25)
+    ]
+
+    different = 0
+    fewer_edits = 0
+    same_edits = 0
+    examples: list[tuple[str, str, str, str]] = []
+    for alignment_text, _, reference_text in corpus:
+        greedy = fit_alignment(alignment_text, reference_text)
+        myers = fit_alignment(alignment_text, reference_text, matcher="myers")
+        if greedy == myers:
+            continue
+
+        different += 1
+        greedy_edits = len(greedy[0]) + len(greedy[1])
+        myers_edits = len(myers[0]) + len(myers[1])
+        fewer_edits += myers_edits < greedy_edits
+        same_edits += myers_edits == greedy_edits
+
+        if len(examples) < 3:
+            # Only show around the first difference of each text
+            alignment_window = _window(set(greedy[0]) ^ set(myers[0]))
+            reference_window = _window(set(greedy[1]) ^ set(myers[1]), alignment_window.start)
+            examples.append((
+                show(alignment_text, greedy[0])[alignment_window], show(reference_text, greedy[1])[reference_window],
+                show(alignment_text, myers[0])[alignment_window], show(reference_text, myers[1])[reference_window],
+            ))
+
+    print(f"\n{different} of {len(corpus)} fits differ")
+    print(f"myers has fewer edits in {fewer_edits}, the same number in {same_edits} (same edits at other positions)")
+    for greedy_alignment, greedy_reference, myers_alignment, myers_reference in examples:
+        print(f"\ngreedy: {greedy_alignment!r}\n        {greedy_reference!r}")
+        print(f"myers:  {myers_alignment!r}\n        {myers_reference!r}")
+
+
+def _window(differing: set[int], default: int = 0) -> slice:
+    """
+    Returns a window of characters around the first differing index
+    Indexes are shown with brackets around them, so this is rough when many are removed
+    """
+    first = min(differing, default=default)
+    return slice(max(first - 15, 0), first + 25)
+
+
+def main() -> None:
+    timings()
+    differences()
+
+
+if __name__ == "__main__":
+    main()
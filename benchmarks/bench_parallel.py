@@ -0,0 +1,37 @@
+"""
+Compares `sync_alignment` with `sync_parallel` on one long synthetic transcript
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel
+"""
+import time
+
+from alsyncer import ColumnarAlignment, sync_alignment, sync_parallel
+from benchmarks.workload import make_workload
+
+
+def main() -> None:
+    alignment_text, durations, reference_text = make_workload(1_000_000, edit_rate=0.02, burst_size=3)
+    print(f"{len(alignment_text)} chars")
+    print(f"{'mode':>9} {'sequential (s)':>15} {'2 workers (s)':>14} {'4 workers (s)':>14}")
+
+    for mode, options in (("words", {"words": True}), ("band", {"band": 64})):
+        timings = []
+
+        sequential = ColumnarAlignment(alignment_text, durations)
+        start = time.perf_counter()
+        sync_alignment(sequential, reference_text, **options)
+        timings.append(time.perf_counter() - start)
+
+        for workers in (2, 4):
+            parallel = ColumnarAlignment(alignment_text, durations)
+            start = time.perf_counter()
+            sync_parallel(parallel, reference_text, workers=workers, **options)
+            timings.append(time.perf_counter() - start)
+            assert parallel == sequential
+
+        print(f"{mode:>9} " + " ".join(f"{elapsed:>14.3f}" for elapsed in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Measures how `remove_additions` scales with the number of additions
+The time should grow linearly with the number of additions, for a fixed alignment length
+
+Run from the repository root:
+    python -m benchmarks.bench_remove
+"""
+import random
+import time
+
+from alsyncer import FastCharAlignment
+from alsyncer.syncer import remove_additions
+
+
+def main() -> None:
+    length = 200_000
+    print(f"alignment of {length} chars")
+    print(f"{'additions':>10} {'time (s)':>10} {'us/addition':>12}")
+
+    for count in (1_000, 5_000, 20_000, 50_000, 100_000):
+        rng = random.Random(count)
+        alignment = [FastCharAlignment("a", rng.randint(20, 120)) for _ in range(length)]
+        additions = sorted(rng.sample(range(length), count))
+
+        start = time.perf_counter()
+        remove_additions(alignment, additions)
+        elapsed = time.perf_counter() - start
+
+        print(f"{count:>10} {elapsed:>10.3f} {elapsed / count * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
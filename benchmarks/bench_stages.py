@@ -0,0 +1,124 @@
+"""
+Times each stage of a sync (fit, remove additions, add missing, round) on synthetic workloads, see `benchmarks.workload`
+Results are printed, and written as JSON to compare runs across commits with `benchmarks.compare`
+
+Run from the repository root:
+    python -m benchmarks.bench_stages --lengths 1000 100000 --output before.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import time
+
+from alsyncer import ColumnarAlignment, FastCharAlignment
+from alsyncer.syncer import add_missing, fit_alignment, remove_additions
+from alsyncer.utils import round_alignment
+from benchmarks.workload import EDIT_TYPES, make_workload
+
+
+STAGES = ("fit", "remove", "add", "round")
+
+
+
+def time_stages(
+        alignment_text: str, durations: list[int], reference_text: str,
+        form: str, mode: str, backend: str, band: int | str | None = None, normalize: bool = False
+    ) -> tuple[dict[str, float], int, int]:
+    """
+    Syncs once, stage by stage
+    Returns the time of each stage, and the number of additions and missing chars
+    """
+    if form == "columnar":
+        alignment = ColumnarAlignment(alignment_text, durations)
+    else:
+        alignment = [FastCharAlignment(char, duration) for char, duration in zip(alignment_text, durations)]
+
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    additions, missing = fit_alignment(alignment_text, reference_text, anchors=mode == "anchors", words=mode == "words", band=band, normalize=normalize)
+    timings["fit"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    remove_additions(alignment, additions, backend)
+    timings["remove"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    add_missing(alignment, reference_text, missing, backend)
+    timings["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    round_alignment(alignment, backend=backend)
+    timings["round"] = time.perf_counter() - start
+
+    return timings, len(additions), len(missing)
+
+
+def git_commit() -> str | None:
+    """
+    Returns the current commit, if run from a git checkout
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Times each stage of a sync on synthetic workloads")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 1000, 10_000, 100_000])
+    parser.add_argument("--edit-rate", type=float, default=0.02)
+    parser.add_argument("--burst-size", type=int, default=1)
+    parser.add_argument("--edit-types", nargs="+", choices=EDIT_TYPES, default=list(EDIT_TYPES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=("chars", "anchors", "words"), default="words")
+    parser.add_argument("--form", choices=("list", "columnar"), default="list")
+    parser.add_argument("--backend", choices=("auto", "python", "numpy"), default="auto")
+    parser.add_argument("--band", type=lambda value: value if value == "adaptive" else int(value), help="band width, or adaptive")
+    parser.add_argument("--normalize", action="store_true", help="fit ignoring case, quotes, spacing and punctuation")
+    parser.add_argument("--repeat", type=int, default=3, help="the best time of each stage is kept")
+    parser.add_argument("--output", help="JSON file to write the results to")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'length':>8} {'additions':>10} {'missing':>8} " + " ".join(f"{stage + ' (s)':>10}" for stage in STAGES))
+
+    for length in args.lengths:
+        alignment_text, durations, reference_text = make_workload(
+            length, args.edit_rate, args.burst_size, tuple(args.edit_types), args.seed
+        )
+
+        best: dict[str, float] = {}
+        for _ in range(args.repeat):
+            timings, additions, missing = time_stages(
+                alignment_text, durations, reference_text, args.form, args.mode, args.backend, args.band, args.normalize
+            )
+            for stage, elapsed in timings.items():
+                best[stage] = min(best.get(stage, elapsed), elapsed)
+
+        results.append({
+            "length": length,
+            "additions": additions,
+            "missing": missing,
+            "stages": best,
+            "total": sum(best.values()),
+        })
+        print(f"{length:>8} {additions:>10} {missing:>8} " + " ".join(f"{best[stage]:>10.4f}" for stage in STAGES))
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "config": {key: value for key, value in vars(args).items() if key not in ("output", "lengths")},
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Compares two JSON reports of `benchmarks.bench_stages`, stage by stage
+Ratios below 1 mean the second run is faster
+
+Run from the repository root:
+    python -m benchmarks.compare before.json after.json
+"""
+import argparse
+import json
+
+from benchmarks.bench_stages import STAGES
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compares two reports of benchmarks.bench_stages")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    with open(args.before) as file:
+        before = json.load(file)
+    with open(args.after) as file:
+        after = json.load(file)
+
+    if before["config"] != after["config"]:
+        print("Warning: the runs were made with different configurations")
+
+    print(f"{before['commit']} -> {after['commit']}")
+    print(f"{'length':>8} " + " ".join(f"{stage:>8}" for stage in (*STAGES, "total")))
+
+    before_results = {result["length"]: result for result in before["results"]}
+    for result in after["results"]:
+        previous = before_results.get(result["length"])
+        if previous is None:
+            continue
+
+        ratios = [
+            result["stages"][stage] / previous["stages"][stage] if previous["stages"][stage] else float("nan")
+            for stage in STAGES
+        ]
+        ratios.append(result["total"] / previous["total"] if previous["total"] else float("nan"))
+        print(f"{result['length']:>8} " + " ".join(f"{ratio:>7.2f}x" for ratio in ratios))
+
+
+if __name__ == "__main__":
+    main()
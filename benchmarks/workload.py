@@ -0,0 +1,115 @@
+"""
+Seeded generator of synthetic STT-vs-script workloads
+The script is made of sentences, with capitals and punctuation, and the STT output gets edits in bursts
+
+Run from the repository root to print a sample:
+    python -m benchmarks.workload
+"""
+import random
+import string
+
+
+EDIT_TYPES = ("insertion", "deletion", "substitution", "punctuation")
+
+PUNCTUATION = ",.?!;:'\"-"
+
+
+
+def make_script(length: int, rng: random.Random) -> str:
+    """
+    Makes a reference text of the given length, made of sentences over a fixed vocabulary
+    Words are drawn with a Zipf-like frequency, like in natural language
+    """
+    vocabulary = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 10)))
+        for _ in range(2000)
+    ]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+    parts: list[str] = []
+    size = 0
+    while size < length:
+        sentence = rng.choices(vocabulary, weights, k=rng.randint(3, 18))
+        sentence[0] = sentence[0].capitalize()
+        for i in range(len(sentence) - 1):
+            if rng.random() < 0.08:
+                sentence[i] += rng.choice(",;:")
+        text = " ".join(sentence) + rng.choice("..........?!") + " "
+        if rng.random() < 0.05:
+            text = '"' + text.rstrip() + '" '
+        parts.append(text)
+        size += len(text)
+
+    return "".join(parts)[:length]
+
+
+def _edit(burst: str, edit_type: str, rng: random.Random) -> str:
+    """
+    Returns what the STT output has instead of the given burst of the script
+    """
+    if edit_type == "insertion":
+        return burst + "".join(rng.choice(string.ascii_lowercase + " ") for _ in burst)
+
+    if edit_type == "deletion":
+        return ""
+
+    if edit_type == "substitution":
+        return "".join(rng.choice(string.ascii_lowercase) if char != " " else char for char in burst)
+
+    if edit_type == "punctuation":
+        # STT usually drops punctuation and casing
+        return "".join(char for char in burst if char not in PUNCTUATION).lower()
+
+    raise Exception(f"Unknown edit type: {edit_type}")
+
+
+def make_workload(
+        length: int,
+        edit_rate: float = 0.02,
+        burst_size: int = 1,
+        edit_types: tuple[str, ...] = EDIT_TYPES,
+        seed: int = 0
+    ) -> tuple[str, list[int], str]:
+    """
+    Makes an STT-like alignment of a script
+
+    Parameters:
+        length: int - length of the script
+        edit_rate: float = 0.02 - fraction of the characters of the script that get edited
+        burst_size: int = 1 - number of consecutive characters edited at once
+        edit_types: tuple[str, ...] = EDIT_TYPES - edits drawn evenly, among "insertion", "deletion", "substitution" and "punctuation"
+        seed: int = 0
+
+    Returns:
+        tuple[str, list[int], str] - alignment text, its durations (in milliseconds), and the reference text
+    """
+    rng = random.Random(seed)
+    reference_text = make_script(length, rng)
+
+    bursts = int(length * edit_rate / burst_size)
+    starts = sorted(rng.sample(range(max(length - burst_size, 0) + 1), min(bursts, length)))
+
+    parts: list[str] = []
+    position = 0
+    for start in starts:
+        # Bursts don't overlap
+        if start < position:
+            continue
+        parts.append(reference_text[position:start])
+        parts.append(_edit(reference_text[start:start + burst_size], rng.choice(edit_types), rng))
+        position = start + burst_size
+    parts.append(reference_text[position:])
+
+    alignment_text = "".join(parts)
+    durations = [rng.randint(60, 140) if char == " " else rng.randint(20, 120) for char in alignment_text]
+
+    return alignment_text, durations, reference_text
+
+
+def main() -> None:
+    alignment_text, _, reference_text = make_workload(300, edit_rate=0.05, burst_size=3)
+    print(f"Script:\n{reference_text}\n\nSTT:\n{alignment_text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from alsyncer import AsyncSyncer, ColumnarAlignment, ReferenceIndex, sync_alignment, sync_alignment_async, sync_many_async
+from alsyncer.utils import CharAlignment
+
+
+def make_alignment(text, duration=10):
+    return [CharAlignment(character=char, duration=duration) for char in text]
+
+
+def test_same_as_sync():
+    alignment = make_alignment("helxo wrld")
+    expected = make_alignment("helxo wrld")
+    asyncio.run(sync_alignment_async(alignment, "hello world", words=True))
+    sync_alignment(expected, "hello world", words=True)
+    assert alignment == expected
+    assert all(type(al) is CharAlignment for al in alignment)
+
+
+def test_process_executor_and_index():
+    alignment = ColumnarAlignment("helxo wrld", [10] * 10)
+    expected = ColumnarAlignment("helxo wrld", [10] * 10)
+
+    async def main():
+        with ProcessPoolExecutor(1) as executor:
+            await sync_alignment_async(alignment, ReferenceIndex("hello world"), executor=executor)
+
+    asyncio.run(main())
+    sync_alignment(expected, "hello world")
+    assert alignment == expected
+
+
+def test_many_returns_errors_in_order():
+    pairs = [
+        (make_alignment("helo"), "hello"),
+        (make_alignment(""), "a"), # Empty alignment, fails
+        (make_alignment("ab"), "abc"),
+    ]
+    errors = asyncio.run(sync_many_async(pairs))
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], Exception)
+    assert len(pairs[0][0]) == 5 and len(pairs[1][0]) == 0
+
+
+def test_backpressure(monkeypatch):
+    running = 0
+    most = 0
+    lock = threading.Lock()
+
+    def slow_sync(alignment, reference_text, **options):
+        nonlocal running, most
+        with lock:
+            running += 1
+            most = max(most, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    monkeypatch.setattr("alsyncer.syncer.sync_alignment", slow_sync)
+
+    async def main():
+        with ThreadPoolExecutor(8) as executor:
+            syncer = AsyncSyncer(executor, max_in_flight=2)
+            return await syncer.sync_many([(make_alignment("a"), "a") for _ in range(10)])
+
+    assert asyncio.run(main()) == [None] * 10
+    assert most <= 2
+
+
+def test_timeouts_keep_slots_of_running_jobs(monkeypatch):
+    running = 0
+    most = 0
+    lock = threading.Lock()
+
+    def slow_sync(alignment, reference_text, **options):
+        nonlocal running, most
+        with lock:
+            running += 1
+            most = max(most, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    monkeypatch.setattr("alsyncer.syncer.sync_alignment", slow_sync)
+
+    async def main():
+        with ThreadPoolExecutor(12) as executor:
+            syncer = AsyncSyncer(executor, max_in_flight=2)
+            # Every sync misses its deadline while its job is still running
+            errors = await syncer.sync_many([(make_alignment("a"), "a") for _ in range(12)], timeout=0.01)
+            # Those are still counted after the timeouts
+            await syncer.sync_many([(make_alignment("a"), "a") for _ in range(12)], timeout=0.3)
+            return errors
+
+    errors = asyncio.run(main())
+    assert all(isinstance(error, TimeoutError) for error in errors)
+    assert most <= 2
+
+
+def test_deadline_leaves_alignment_untouched(monkeypatch):
+    monkeypatch.setattr("alsyncer.syncer.sync_alignment", lambda *args, **kwargs: time.sleep(0.2))
+    alignment = make_alignment("helo")
+
+    async def main():
+        await sync_alignment_async(alignment, "hello", timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(main())
+    assert len(alignment) == 4
+
+
+def test_cancellation_leaves_alignment_untouched(monkeypatch):
+    monkeypatch.setattr("alsyncer.syncer.sync_alignment", lambda *args, **kwargs: time.sleep(0.2))
+    alignment = make_alignment("helo")
+
+    async def main():
+        task = asyncio.create_task(sync_alignment_async(alignment, "hello"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert len(alignment) == 4
+
+
+def test_event_loop_stays_free(monkeypatch):
+    monkeypatch.setattr("alsyncer.syncer.sync_alignment", lambda *args, **kwargs: time.sleep(0.1))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await sync_alignment_async(make_alignment("a"), "a")
+        task.cancel()
+
+    asyncio.run(main())
+    assert ticks >= 5
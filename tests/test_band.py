@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from alsyncer import sync_alignment
+from alsyncer.matching import band_gaps
+from alsyncer.syncer import fit_alignment
+from alsyncer.utils import CharAlignment
+
+
+def random_text(length, alphabet="abcdefgh "):
+    return "".join(random.choice(alphabet) for _ in range(length))
+
+
+def kept(text, removed):
+    removed = set(removed)
+    return "".join(char for i, char in enumerate(text) if i not in removed)
+
+
+def edited(text, rate):
+    chars = list(text)
+    for _ in range(int(len(chars) * rate)):
+        chars[random.randrange(len(chars))] = random.choice("XYZ")
+    return "".join(chars)
+
+
+@pytest.mark.parametrize("band", [1, 8, 64, "adaptive"])
+@pytest.mark.parametrize("matcher", ["greedy", "myers"])
+def test_valid_fit(band, matcher):
+    random.seed(f"{band}{matcher}")
+    for _ in range(50):
+        reference = random_text(random.randint(0, 400))
+        alignment = edited(reference, 0.05) if reference and random.random() < 0.8 else random_text(random.randint(0, 400))
+        additions, missing = fit_alignment(alignment, reference, band=band, matcher=matcher)
+        assert kept(alignment, additions) == kept(reference, missing)
+
+
+def test_same_fit_on_near_identical_texts():
+    random.seed(0)
+    reference = random_text(3000)
+    alignment = edited(reference, 0.01)
+    assert fit_alignment(alignment, reference, band=64) == fit_alignment(alignment, reference)
+
+
+def test_falls_back_when_nothing_matches_in_band():
+    # The alignment only starts matching far from the diagonal
+    reference = "x" * 100 + "hello world"
+    additions, missing = fit_alignment("hello world", reference, band=8)
+    assert additions == [] and missing == list(range(100))
+
+
+def test_gaps_cover_the_rest():
+    # Once the rest fits in the band, it is left as a gap to fit
+    gaps = band_gaps("abcXdef", "abcdef", 0, 7, 0, 6, 2)
+    assert gaps == [(3, 4, 3, 3), (5, 7, 4, 6)]
+
+
+def test_invalid_band_raises():
+    with pytest.raises(Exception):
+        fit_alignment("abc", "abc", band=0)
+    with pytest.raises(Exception):
+        fit_alignment("abc", "abc", band="some")
+
+
+def test_sync():
+    alignment = [CharAlignment(character=char, duration=10) for char in "helxo wrld"]
+    sync_alignment(alignment, "hello world", band="adaptive", verify="full")
+    assert sum(al.duration for al in alignment) == 100
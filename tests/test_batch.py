@@ -0,0 +1,34 @@
+from alsyncer import sync_alignment, sync_many, CharAlignment
+
+
+def AL(chars, durs):
+    return [CharAlignment(character=c, duration=d) for c, d in zip(chars, durs)]
+
+
+def test_same_as_sync_alignment_in_order():
+    pairs = [
+        (AL("Hi", [100, 50]), "Hi!"),
+        (AL("Hel", [100, 50, 150]), "Hello"),
+        (AL("?He!lo??", [12, 80, 60, 30, 40, 70, 15, 25]), "Hello!"),
+    ]
+    expected = []
+    for alignment, reference_text in pairs:
+        copy = [al.model_copy() for al in alignment]
+        sync_alignment(copy, reference_text)
+        expected.append(copy)
+
+    errors = sync_many(pairs, workers=2)
+
+    assert errors == [None, None, None]
+    assert [alignment for alignment, _ in pairs] == expected
+
+
+def test_failure_is_reported_per_item():
+    ok = AL("Hi", [100, 50])
+    empty = AL("", [])
+    errors = sync_many([(empty, "Hi"), (ok, "Hi!")], workers=1)
+
+    assert isinstance(errors[0], Exception)
+    assert errors[1] is None
+    assert empty == []
+    assert [al.duration for al in ok] == [100, 25, 25]
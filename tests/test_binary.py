@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from alsyncer import AlignmentFile, ColumnarAlignment, FastCharAlignment, sync_alignment, write_alignments
+from alsyncer.utils import CharAlignment
+
+
+def random_alignments(count):
+    random.seed(count)
+    alignments = []
+    for _ in range(count):
+        text = "".join(random.choice("abc dé€😀") for _ in range(random.randint(0, 30)))
+        alignments.append([CharAlignment(character=char, duration=random.randint(0, 200)) for char in text])
+    return alignments
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "alignments.bin")
+    alignments = random_alignments(50)
+    assert write_alignments(path, alignments) == 50
+
+    with AlignmentFile(path) as file:
+        assert len(file) == 50
+        assert [record.to_alignment() for record in file] == alignments
+        assert file[-1].to_alignment() == alignments[-1]
+
+
+def test_mixed_inputs_and_floats(tmp_path):
+    path = str(tmp_path / "alignments.bin")
+    write_alignments(path, [
+        ColumnarAlignment("ab", [1.5, 2]),
+        [FastCharAlignment("c", 0.25)],
+        [],
+    ])
+
+    with AlignmentFile(path) as file:
+        assert list(file[0].durations) == [1.5, 2.0]
+        assert file[1].characters == "c"
+        assert len(file[2]) == 0
+        with pytest.raises(IndexError):
+            file[3]
+
+
+def test_view_does_not_copy(tmp_path):
+    path = str(tmp_path / "alignments.bin")
+    write_alignments(path, [ColumnarAlignment("hi", [100, 50])])
+
+    with AlignmentFile(path) as file:
+        text, durations = file.view(0)
+        assert text == "hi"
+        assert durations.readonly and durations.format == 'd'
+        assert durations.tolist() == [100, 50]
+        durations.release()
+
+
+def test_sync_records(tmp_path):
+    path = str(tmp_path / "alignments.bin")
+    write_alignments(path, [ColumnarAlignment("Hi", [100, 50])])
+
+    with AlignmentFile(path) as file:
+        alignment = file[0]
+    sync_alignment(alignment, "Hi!")
+    assert alignment.to_alignment() == [
+        CharAlignment(character="H", duration=100),
+        CharAlignment(character="i", duration=25),
+        CharAlignment(character="!", duration=25),
+    ]
+
+
+def test_not_an_alignment_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(Exception):
+        AlignmentFile(str(path))
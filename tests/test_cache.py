@@ -0,0 +1,84 @@
+from alsyncer import FitCache, SyncStats, sync_alignment
+from alsyncer.syncer import fit_alignment
+from alsyncer.utils import CharAlignment
+
+
+def make_alignment(text, duration=10):
+    return [CharAlignment(character=char, duration=duration) for char in text]
+
+
+def test_hit_skips_fitting(monkeypatch):
+    cache = FitCache()
+    assert cache.fit("helo wrld", "hello world") == fit_alignment("helo wrld", "hello world")
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    monkeypatch.setattr("alsyncer.cache.fit_alignment", lambda *args, **kwargs: 1 / 0)
+    assert cache.fit("helo wrld", "hello world") == fit_alignment("helo wrld", "hello world")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_options_are_part_of_the_key():
+    assert FitCache.key("a b", "a b") != FitCache.key("a b", "a b", words=True)
+    assert FitCache.key("ab", "c") != FitCache.key("a", "bc")
+
+
+def test_lru_cap():
+    cache = FitCache(max_entries=2)
+    cache.fit("a", "b")
+    cache.fit("b", "c")
+    cache.fit("a", "b") # Most recent now
+    cache.fit("c", "d") # Drops "b"
+    assert len(cache) == 2
+    assert cache.get(FitCache.key("b", "c")) is None
+    assert cache.get(FitCache.key("a", "b")) is not None
+
+
+def test_disk_tier(tmp_path):
+    path = str(tmp_path / "fits.sqlite")
+    cache = FitCache(path=path)
+    result = cache.fit("helo", "hello")
+    cache.close()
+
+    cache = FitCache(path=path)
+    assert cache.fit("helo", "hello") == result
+    assert (cache.hits, cache.disk_hits, cache.misses) == (0, 1, 0)
+    assert cache.fit("helo", "hello") == result
+    assert cache.hits == 1
+    cache.close()
+
+
+def test_disk_cap(tmp_path):
+    cache = FitCache(max_entries=1, path=str(tmp_path / "fits.sqlite"), max_disk_entries=2)
+    for text in ("a", "b", "c"):
+        cache.fit(text, "abc")
+
+    assert cache.get(FitCache.key("a", "abc")) is None
+    assert cache.get(FitCache.key("b", "abc")) is not None
+    cache.close()
+
+
+def test_sync_with_cache():
+    cache = FitCache()
+    for _ in range(2):
+        alignment = make_alignment("helo wrld")
+        expected = make_alignment("helo wrld")
+        sync_alignment(alignment, "hello world", cache=cache)
+        sync_alignment(expected, "hello world")
+        assert alignment == expected
+    assert cache.hits == 1
+
+
+def test_sync_with_cache_counts_fitting():
+    cache = FitCache()
+    stats = SyncStats()
+    expected = SyncStats()
+    sync_alignment(make_alignment("helo wrld"), "hello world", stats=expected)
+    sync_alignment(make_alignment("helo wrld"), "hello world", cache=cache, stats=stats)
+    assert stats.probes == expected.probes > 0
+    assert stats.searched == expected.searched > 0
+    assert stats.max_depth == expected.max_depth > 0
+
+    # A hit doesn't fit again
+    sync_alignment(make_alignment("helo wrld"), "hello world", cache=cache, stats=stats)
+    assert stats.probes == expected.probes
+    assert stats.syncs == 2
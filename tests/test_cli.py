@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+from alsyncer import AlignmentFile, ColumnarAlignment, write_alignments
+from alsyncer.cli import main
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    # Runs without --failures write failures.jsonl in the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def record(text, durations, reference, **extra):
+    return json.dumps({
+        **extra,
+        "alignment": [{"character": char, "duration": duration} for char, duration in zip(text, durations)],
+        "reference": reference,
+    })
+
+
+def read_jsonl(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_jsonl_in_order_with_failures(tmp_path, workers):
+    lines = []
+    for k in range(20):
+        lines.append(record("Hi", [100, 50], "Hi!", id=k))
+        if k % 7 == 0:
+            lines.append("not json")
+    lines.append(record("ab", [10, 10], None))
+
+    source = tmp_path / "in.jsonl"
+    source.write_text("\n".join(lines) + "\n")
+    output = tmp_path / "out.jsonl"
+    failures = tmp_path / "failures.jsonl"
+
+    code = main([str(source), "-o", str(output), "--failures", str(failures), "-j", str(workers), "--max-in-flight", "3", "-q"])
+    assert code == 1
+
+    synced = read_jsonl(output)
+    assert [result["id"] for result in synced] == list(range(20))
+    assert synced[0]["alignment"] == [
+        {"character": "H", "duration": 100},
+        {"character": "i", "duration": 25},
+        {"character": "!", "duration": 25},
+    ]
+
+    failed = read_jsonl(failures)
+    assert len(failed) == 4
+    assert failed[0]["input"] == "not json"
+    assert "no reference" in failed[-1]["error"]
+
+
+def test_failures_on_stderr_are_jsonl(tmp_path, capsys):
+    source = tmp_path / "in.jsonl"
+    source.write_text("\n".join([record("Hi", [100, 50], "Hi!"), "not json", record("ab", [10, 10], None)]) + "\n")
+
+    assert main([str(source), "--failures", "-", "-j", "1"]) == 1
+
+    captured = capsys.readouterr()
+    failed = [json.loads(line) for line in captured.err.splitlines()]
+    assert [failure["record"] for failure in failed] == [1, 2]
+    assert len(captured.out.splitlines()) == 1
+
+
+def test_failures_file_and_summary_by_default(tmp_path, capsys):
+    source = tmp_path / "in.jsonl"
+    source.write_text("\n".join([record("Hi", [100, 50], "Hi!"), "not json"]) + "\n")
+
+    assert main([str(source), "-j", "1"]) == 1
+
+    assert [failure["record"] for failure in read_jsonl(tmp_path / "failures.jsonl")] == [1]
+    assert capsys.readouterr().err.startswith("alsyncer: 2 records (1 failed)")
+
+
+def test_progress_needs_failures_file(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "in.jsonl"), "--progress", "--failures", "-"])
+
+
+def test_shared_reference_and_options(tmp_path):
+    source = tmp_path / "in.jsonl"
+    source.write_text(json.dumps({"alignment": [{"character": "H", "duration": 100}, {"character": "i", "duration": 50}]}) + "\n")
+    reference = tmp_path / "reference.txt"
+    reference.write_text("Hi!")
+    output = tmp_path / "out.jsonl"
+
+    assert main([str(source), "-o", str(output), "--reference-file", str(reference), "--words", "-j", "1", "-q"]) == 0
+    assert [al["duration"] for al in read_jsonl(output)[0]["alignment"]] == [100, 25, 25]
+
+
+def test_binary_in_and_out(tmp_path):
+    source = tmp_path / "in.bin"
+    write_alignments(str(source), [ColumnarAlignment("Hi", [100, 50]), ColumnarAlignment("ab", [10, 10])])
+    references = tmp_path / "references.jsonl"
+    references.write_text('"Hi!"\n"abc"\n')
+    output = tmp_path / "out.bin"
+
+    assert main([str(source), "--format", "binary", "--references", str(references), "--output-format", "binary", "-o", str(output), "-j", "1", "-q"]) == 0
+
+    with AlignmentFile(str(output)) as file:
+        assert [record.characters for record in file] == ["Hi!", "abc"]
+        assert list(file[0].durations) == [100, 25, 25]
+
+
+@pytest.mark.parametrize("rounding", [[], ["--no-round"]])
+def test_binary_in_jsonl_out_keeps_integers(tmp_path, rounding):
+    source = tmp_path / "in.bin"
+    write_alignments(str(source), [ColumnarAlignment("Hi", [100, 50])])
+    references = tmp_path / "references.jsonl"
+    references.write_text('"Hi!"\n')
+    output = tmp_path / "out.jsonl"
+
+    assert main([str(source), "--format", "binary", "--references", str(references), "-o", str(output), "--verify", "full", "-j", "2", "-q", *rounding]) == 0
+
+    durations = [al["duration"] for al in read_jsonl(output)[0]["alignment"]]
+    assert durations == [100, 25, 25]
+    assert all(type(duration) is int for duration in durations)
+
+
+def test_binary_needs_references(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "in.bin"), "--format", "binary"])
@@ -0,0 +1,54 @@
+import pytest
+
+from alsyncer import sync_alignment, CharAlignment, ColumnarAlignment
+from alsyncer.syncer import add_missing, remove_additions
+
+
+def AL(chars, durs):
+    return [CharAlignment(character=c, duration=d) for c, d in zip(chars, durs)]
+
+
+def test_round_trip():
+    al = AL("Hi!", [100, 25.5, 24.5])
+    columnar = ColumnarAlignment.from_alignment(al)
+    assert columnar.characters == "Hi!"
+    assert list(columnar.durations) == [100, 25.5, 24.5]
+    assert columnar.to_alignment() == al
+    assert isinstance(columnar.to_alignment()[0].duration, int)
+
+
+def test_mismatched_lengths_raise():
+    with pytest.raises(Exception):
+        ColumnarAlignment("ab", [1])
+
+
+def test_remove_additions():
+    columnar = ColumnarAlignment("ABCDE", [100, 200, 300, 400, 500])
+    remove_additions(columnar, [1, 2, 3])
+    assert columnar == ColumnarAlignment("AE", [450, 1050])
+
+
+def test_add_missing():
+    columnar = ColumnarAlignment("AB", [175, 75])
+    add_missing(columnar, "kkAkB", [0, 1, 3])
+    assert columnar == ColumnarAlignment("kkAkB", [50, 50, 50, 50, 50])
+
+
+@pytest.mark.parametrize(
+    "altext,aldurs,rtext",
+    [
+        ("Hi", (100, 50), "Hi!"),
+        ("Hello", (100, 50, 50, 50, 50), "Hel"),
+        ("Heo", (100, 60, 40), "Hello"),
+        ("H!lo", (90, 30, 30, 50), "Hello"),
+        ("?He!lo??", (12, 80, 60, 30, 40, 70, 15, 25), "Hello!"),
+    ],
+)
+def test_sync_same_as_list(altext, aldurs, rtext):
+    al = AL(altext, aldurs)
+    sync_alignment(al, rtext)
+
+    columnar = ColumnarAlignment(altext, aldurs)
+    sync_alignment(columnar, rtext)
+
+    assert columnar.to_alignment() == al
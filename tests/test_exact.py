@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from alsyncer import ColumnarAlignment, sync_alignment
+from alsyncer.utils import CharAlignment
+
+
+def make_alignment(text, durations):
+    return [CharAlignment(character=char, duration=duration) for char, duration in zip(text, durations)]
+
+
+def random_case(seed):
+    random.seed(seed)
+    reference = "".join(random.choice("ab cd") for _ in range(random.randint(1, 40)))
+    text = list(reference)
+    for _ in range(random.randint(0, 10)):
+        i = random.randint(0, len(text))
+        if random.random() < 0.5 and text:
+            del text[min(i, len(text) - 1)]
+        else:
+            text.insert(i, random.choice("abxyz "))
+    # An alignment full of additions can't be synchronised
+    if not set(text) & set(reference):
+        text.append(reference[-1])
+    durations = [random.randint(0, 500) for _ in text]
+    return "".join(text), durations, reference
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_exact_gives_integers_and_keeps_duration(seed):
+    text, durations, reference = random_case(seed)
+    alignment = make_alignment(text, durations)
+    sync_alignment(alignment, reference, exact=True, verify="full")
+
+    assert "".join(al.character for al in alignment) == reference
+    assert all(type(al.duration) is int for al in alignment)
+    assert sum(al.duration for al in alignment) == sum(durations)
+
+
+def test_exact_close_to_float_path():
+    for seed in range(200):
+        text, durations, reference = random_case(seed)
+        exact = make_alignment(text, durations)
+        floats = make_alignment(text, durations)
+        sync_alignment(exact, reference, exact=True)
+        sync_alignment(floats, reference, backend="python")
+
+        assert all(abs(a.duration - b.duration) <= 1 for a, b in zip(exact, floats))
+
+
+def test_exact_thirds():
+    # 100 split in three can't be exact in floats, fractions round it with the carried bias
+    alignment = make_alignment("a", [100])
+    sync_alignment(alignment, "abc", exact=True)
+    assert [al.duration for al in alignment] == [33, 34, 33]
+
+
+def test_exact_columnar():
+    text, durations, reference = random_case(7)
+    columnar = ColumnarAlignment(text, durations)
+    alignment = make_alignment(text, durations)
+    sync_alignment(columnar, reference, exact=True)
+    sync_alignment(alignment, reference, exact=True)
+
+    assert columnar.to_alignment() == alignment
+
+
+def test_exact_non_integer_sum_raises():
+    alignment = make_alignment("ab", [1, 1.5])
+    with pytest.raises(Exception):
+        sync_alignment(alignment, "abc", exact=True)
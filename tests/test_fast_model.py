@@ -0,0 +1,36 @@
+import pytest
+from pydantic import ValidationError
+
+from alsyncer import sync_alignment, CharAlignment, FastCharAlignment
+
+
+def test_equal_to_pydantic_model():
+    assert FastCharAlignment("H", 100) == CharAlignment(character="H", duration=100)
+    assert CharAlignment(character="H", duration=100) == FastCharAlignment("H", 100)
+    assert FastCharAlignment("H", 100) != CharAlignment(character="H", duration=50)
+
+
+def test_no_validation_by_default():
+    assert FastCharAlignment(character=1, duration="x").duration == "x"
+
+
+def test_validated():
+    assert FastCharAlignment.validated("H", 100) == FastCharAlignment("H", 100)
+    with pytest.raises(ValidationError):
+        FastCharAlignment.validated("H", "x")
+
+
+def test_to_model():
+    assert FastCharAlignment("H", 100).to_model() == CharAlignment(character="H", duration=100)
+
+
+def test_no_instance_dict():
+    with pytest.raises(AttributeError):
+        FastCharAlignment("H", 100).other = 1
+
+
+def test_sync_keeps_fast_characters():
+    alignment = [FastCharAlignment("H", 100), FastCharAlignment("i", 50)]
+    sync_alignment(alignment, "Hi!")
+    assert alignment == [FastCharAlignment("H", 100), FastCharAlignment("i", 25), FastCharAlignment("!", 25)]
+    assert all(type(al) is FastCharAlignment for al in alignment)
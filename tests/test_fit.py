@@ -185,3 +185,54 @@ def test_idempotence_when_equal():
 def test_large_shared_middle_with_noise_both_sides():
     # Shared core "middle" should be kept; noise at edges identified correctly
     assert_result("XXmiddleYY", "ZmiddleW", [0, 1, 8, 9], [0, 7])
+
+
+def test_long_chain_does_not_hit_recursion_limit():
+    # Equal-length blocks are matched from left to right, which used to recurse once per block
+    blocks = [f"{i:04d}" for i in range(1100)]
+    alignment_text = "#".join(blocks)
+    reference_text = "".join(blocks)
+    additions, missing = fit_alignment(alignment_text, reference_text)
+    assert len(alignment_text) - len(additions) == len(reference_text) - len(missing)
+    assert all(alignment_text[i] != "#" or i in additions for i in range(4, len(alignment_text), 5))
+
+
+# ----------------------------
+# Unique anchors pre-pass
+# ----------------------------
+
+def test_anchors_same_fit_on_near_identical_text():
+    a = "the quick brown fox jumps ovr the lazy dog"
+    r = "the quick brown fox jumps over the lazy dog!"
+    assert fit_alignment(a, r, anchors=True) == fit_alignment(a, r)
+
+
+def test_anchors_skip_words_out_of_order():
+    # "alpha" and "beta" are swapped, only one of them can be kept as an anchor
+    additions, missing = fit_alignment("beta alpha gamma", "alpha beta gamma", anchors=True)
+    assert len("beta alpha gamma") - len(additions) == len("alpha beta gamma") - len(missing)
+    assert additions == sorted(set(additions))
+    assert missing == sorted(set(missing))
+
+
+def test_anchors_without_unique_words():
+    assert fit_alignment("aa aa", "aa aa", anchors=True) == ([], [])
+    assert fit_alignment("aXa aa", "aa aa", anchors=True) == ([1], [])
+
+
+# ----------------------------
+# Word-level coarse fit
+# ----------------------------
+
+def test_words_substituted_word_refined_by_characters():
+    # "brwn" is fitted character by character against "brown"
+    additions, missing = fit_alignment("the brwn fox", "the brown fox", words=True)
+    assert (additions, missing) == ([], [6])
+
+
+def test_words_same_fit_on_identical_text():
+    assert fit_alignment("a b c a b", "a b c a b", words=True) == ([], [])
+
+
+def test_words_without_words():
+    assert fit_alignment("   ", "  ", words=True) == ([2], [])
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from alsyncer.matching import SuffixAutomaton, greedy_longest_common_substring, longest_common_substring
+from alsyncer.syncer import fit_alignment
+
+
+def random_text(length, alphabet):
+    return "".join(random.choice(alphabet) for _ in range(length))
+
+
+def test_automaton_finds_longest():
+    assert SuffixAutomaton("ZmiddleW").longest_common_substring("XXmiddleYY") == (2, 1, 6)
+
+
+def test_automaton_no_match():
+    assert SuffixAutomaton("abc").longest_common_substring("xyz")[2] == 0
+
+
+def test_automaton_leftmost_then_first_in_reference():
+    # "ab" and "cd" both have length 2, the leftmost one in the alignment wins
+    # "ab" appears twice in the reference, the first occurrence wins
+    assert SuffixAutomaton("cdabab").longest_common_substring("abXcd") == (0, 2, 2)
+
+
+def test_unknown_engine_raises():
+    with pytest.raises(Exception):
+        longest_common_substring("a", "a", engine="unknown")
+
+
+@pytest.mark.parametrize("alphabet", ["a", "ab", "ab c", "abcdefgh"])
+def test_engines_agree(alphabet):
+    random.seed(alphabet)
+    for _ in range(300):
+        a = random_text(random.randint(0, 25), alphabet)
+        r = random_text(random.randint(0, 25), alphabet)
+        assert greedy_longest_common_substring(a, r, 0, len(a), 0, len(r)) == SuffixAutomaton(r).longest_common_substring(a)
+        assert fit_alignment(a, r, engine="greedy") == fit_alignment(a, r, engine="automaton")
+
+
+def test_bounds():
+    # Only "cd" is searched in the alignment, only "xcdx" in the reference
+    for engine in ("greedy", "automaton"):
+        assert longest_common_substring("abcd", "abxcdx", engine, 2, 4, 2, 6) == (2, 3, 2)
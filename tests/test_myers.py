@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from alsyncer import sync_alignment
+from alsyncer.matching import myers_diff
+from alsyncer.syncer import fit_alignment
+from alsyncer.utils import CharAlignment
+
+
+def random_text(length, alphabet):
+    return "".join(random.choice(alphabet) for _ in range(length))
+
+
+def lcs_length(a, b):
+    previous = [0] * (len(b) + 1)
+    for char_a in a:
+        current = [0]
+        for j, char_b in enumerate(b):
+            current.append(previous[j] + 1 if char_a == char_b else max(previous[j+1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def kept(text, removed):
+    removed = set(removed)
+    return "".join(char for i, char in enumerate(text) if i not in removed)
+
+
+@pytest.mark.parametrize("alphabet", ["a", "ab", "abc", "ab cdef"])
+def test_shortest_edit_script(alphabet):
+    random.seed(alphabet)
+    for _ in range(500):
+        a = random_text(random.randint(0, 25), alphabet)
+        r = random_text(random.randint(0, 25), alphabet)
+        additions, missing = myers_diff(a, r)
+
+        assert additions == sorted(set(additions)) and missing == sorted(set(missing))
+        assert kept(a, additions) == kept(r, missing)
+        assert len(a) - len(additions) == lcs_length(a, r)
+
+
+def test_bounds():
+    assert myers_diff("xxabcxx", "yyaXcyy", 2, 5, 2, 5) == ([3], [3])
+
+
+def test_never_more_edits_than_greedy():
+    random.seed(0)
+    for _ in range(300):
+        a = random_text(random.randint(0, 30), "abc ")
+        r = random_text(random.randint(0, 30), "abc ")
+        greedy = fit_alignment(a, r)
+        myers = fit_alignment(a, r, matcher="myers")
+        assert len(myers[0]) + len(myers[1]) <= len(greedy[0]) + len(greedy[1])
+
+
+@pytest.mark.parametrize("mode", [{}, {"anchors": True}, {"words": True}])
+def test_fit_modes(mode):
+    random.seed(str(mode))
+    for _ in range(200):
+        a = random_text(random.randint(0, 40), "ab cd e")
+        r = random_text(random.randint(0, 40), "ab cd e")
+        additions, missing = fit_alignment(a, r, matcher="myers", **mode)
+        assert kept(a, additions) == kept(r, missing)
+
+
+def test_unknown_matcher_raises():
+    with pytest.raises(Exception):
+        fit_alignment("a", "a", matcher="unknown")
+
+
+def test_sync():
+    alignment = [CharAlignment(character=char, duration=10) for char in "helxo wrld"]
+    sync_alignment(alignment, "hello world", matcher="myers", verify="full")
+    assert sum(al.duration for al in alignment) == 100
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from alsyncer import ColumnarAlignment, FitCache, sync_alignment
+from alsyncer.normalize import NormalizedText
+from alsyncer.syncer import fit_alignment
+from alsyncer.utils import CharAlignment
+
+
+def make_alignment(text, duration=10):
+    return [CharAlignment(character=char, duration=duration) for char in text]
+
+
+def test_offsets_map_back():
+    text = "“Hello,”  she\tSAID — fine."
+    view = NormalizedText(text)
+    assert view.normalized == "hello she said fine"
+    assert len(view.folded) == len(text)
+    assert all(view.folded[view.offsets[i]] == char for i, char in enumerate(view.normalized))
+
+
+def test_folding_keeps_length():
+    text = "İstanbul ÉTÉ"
+    view = NormalizedText(text)
+    assert len(view.folded) == len(text)
+    assert view.folded.endswith("été")
+
+
+def test_case_only_is_a_full_match():
+    assert fit_alignment("hello world", "Hello World", normalize=True) == ([], [])
+
+
+def test_dropped_punctuation_is_missing():
+    assert fit_alignment("hello world", "Hello, world.", normalize=True) == ([], [5, 12])
+    assert fit_alignment("it’s", "it's", normalize=True) == ([], [])
+
+
+@pytest.mark.parametrize("words", [False, True])
+def test_sync_gives_reference_characters(words):
+    alignment = make_alignment("hello  world its fine")
+    reference_text = "Hello, world! It's fine."
+    sync_alignment(alignment, reference_text, normalize=True, words=words, verify="full")
+    assert "".join(al.character for al in alignment) == reference_text
+    assert sum(al.duration for al in alignment) == 210
+    # Case-only differences keep their durations
+    assert alignment[0] == CharAlignment(character="H", duration=10)
+
+
+def test_columnar():
+    alignment = ColumnarAlignment("HELLO", [10] * 5)
+    sync_alignment(alignment, "hello!", normalize=True)
+    assert alignment.characters == "hello!"
+    assert list(alignment.durations)[:4] == [10] * 4
+
+
+def test_random_texts_synchronise():
+    random.seed(25)
+    for _ in range(300):
+        # Both share at least a character, an alignment made of additions only can't be synced
+        reference_text = "".join(random.choice("aAbB ,.'’\n") for _ in range(random.randint(0, 25))) + "a"
+        alignment_text = "".join(random.choice("aAbB ,.'’\n") for _ in range(random.randint(0, 25))) + "a"
+        alignment = make_alignment(alignment_text, 12)
+        sync_alignment(alignment, reference_text, normalize=True, verify="full")
+        assert "".join(al.character for al in alignment) == reference_text
+
+
+def test_cache_key():
+    assert FitCache.key("a", "A") != FitCache.key("a", "A", normalize=True)
+    assert FitCache().fit("a", "A", normalize=True) == ([], [])
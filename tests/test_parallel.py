@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from alsyncer import ColumnarAlignment, FastCharAlignment, sync_alignment, sync_parallel
+from alsyncer.parallel import _segments
+from alsyncer.utils import CharAlignment
+
+
+WORDS = ["the", "cat", "sat", "on", "a", "mat", "and", "then", "it", "slept", "all", "day"]
+
+
+def make_pair(length, seed):
+    random.seed(seed)
+    reference = ""
+    while len(reference) < length:
+        reference += random.choice(WORDS) + random.choice("  ,.")
+    chars = list(reference)
+    for _ in range(length // 20):
+        i = random.randrange(len(chars))
+        kind = random.random()
+        if kind < 0.3:
+            del chars[i]
+        elif kind < 0.6:
+            chars.insert(i, random.choice("xyz"))
+        else:
+            chars[i] = random.choice("xyz")
+    durations = [random.randint(10, 120) for _ in chars]
+    return "".join(chars), durations, reference
+
+
+def list_alignment(text, durations):
+    return [FastCharAlignment(char, duration) for char, duration in zip(text, durations)]
+
+
+@pytest.mark.parametrize("mode", [{}, {"anchors": True}, {"words": True}, {"band": 32}, {"words": True, "matcher": "myers"}])
+@pytest.mark.parametrize("round_alignment", [True, False])
+def test_same_as_sequential(mode, round_alignment):
+    for seed in range(5):
+        text, durations, reference = make_pair(2000, seed)
+        sequential = list_alignment(text, durations)
+        parallel = list_alignment(text, durations)
+
+        sync_alignment(sequential, reference, round_alignment=round_alignment, **mode)
+        sync_parallel(parallel, reference, workers=1, segments=16, round_alignment=round_alignment, **mode)
+
+        assert [(al.character, al.duration) for al in parallel] == [(al.character, al.duration) for al in sequential]
+        assert [type(al.duration) for al in parallel] == [type(al.duration) for al in sequential]
+
+
+def test_process_pool_and_columnar():
+    text, durations, reference = make_pair(3000, 0)
+    sequential = ColumnarAlignment(text, durations)
+    parallel = ColumnarAlignment(text, durations)
+
+    sync_alignment(sequential, reference, words=True)
+    sync_parallel(parallel, reference, workers=2, words=True)
+
+    assert parallel == sequential
+
+
+def test_keeps_model_type():
+    alignment = [CharAlignment(character=char, duration=10) for char in "helo wrld"]
+    sync_parallel(alignment, "hello world", workers=1)
+    assert all(type(al) is CharAlignment for al in alignment)
+    assert sum(al.duration for al in alignment) == 90
+
+
+def test_segments_cut_inside_matches():
+    # Ranges (0, 1, 0, 1) and (5, 6, 5, 6) are separated by a 4 characters match
+    ranges = [(0, 1, 0, 1), (5, 6, 5, 6)]
+    segments = _segments(8, 8, ranges, 2)
+    assert [bounds[:4] for bounds in segments] == [(0, 3, 0, 3), (3, 8, 3, 8)]
+
+
+def test_errors_propagate():
+    with pytest.raises(Exception):
+        sync_parallel([CharAlignment(character="a", duration=1)], "b", workers=1)
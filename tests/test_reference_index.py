@@ -0,0 +1,95 @@
+import pickle
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from alsyncer import ReferenceIndex, sync_alignment
+from alsyncer.matching import SuffixAutomaton, indexed_longest_common_substring
+from alsyncer.syncer import fit_alignment
+from alsyncer.utils import CharAlignment
+
+
+def random_text(length, alphabet="ab cd ef"):
+    return "".join(random.choice(alphabet) for _ in range(length))
+
+
+@pytest.mark.parametrize("mode", [{}, {"anchors": True}, {"words": True}])
+@pytest.mark.parametrize("engine", ["auto", "greedy", "automaton"])
+def test_same_fit_as_string(mode, engine):
+    random.seed(f"{mode}{engine}")
+    for _ in range(100):
+        reference = random_text(random.randint(0, 60))
+        index = ReferenceIndex(reference)
+        for _ in range(3):
+            alignment = random_text(random.randint(0, 60))
+            assert fit_alignment(alignment, index, engine=engine, **mode) == fit_alignment(alignment, reference, engine=engine, **mode)
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "abcdefgh ", "abcdefghijklmnopqrstuvwxyz "])
+def test_range_search_matches_automaton(alphabet):
+    random.seed(alphabet)
+    for _ in range(300):
+        reference = random_text(random.randint(10, 400), alphabet)
+        index = ReferenceIndex(reference, words=False)
+        alignment = list(reference[random.randint(0, len(reference) // 3):])
+        for _ in range(random.randint(0, 20)):
+            if alignment:
+                alignment[random.randrange(len(alignment))] = random.choice(alphabet)
+        alignment = "".join(alignment)
+
+        alignment_start = random.randint(0, len(alignment))
+        alignment_end = random.randint(alignment_start, len(alignment))
+        reference_start = random.randint(0, len(reference))
+        reference_end = random.randint(reference_start, len(reference))
+
+        found = indexed_longest_common_substring(alignment, index, alignment_start, alignment_end, reference_start, reference_end)
+        if found is not None:
+            automaton = SuffixAutomaton(reference, reference_start, reference_end)
+            assert found == automaton.longest_common_substring(alignment, alignment_start, alignment_end)
+
+
+def test_unpickled_once_per_process():
+    index = ReferenceIndex("hello world")
+    copy = pickle.loads(pickle.dumps(index))
+    assert copy is not index and copy.text == index.text
+    assert pickle.loads(pickle.dumps(index)) is copy
+    assert pickle.loads(pickle.dumps(ReferenceIndex("hello world", words=False))) is not copy
+
+
+def test_immutable():
+    index = ReferenceIndex("hello world")
+    with pytest.raises(Exception):
+        index.text = "other"
+
+
+def test_tokenize_unknown_words():
+    index = ReferenceIndex("a b a")
+    tokens, spans = index.tokenize("b c a c")
+    assert tokens[0] == index.word_index.text[1]
+    assert tokens[1] == tokens[3] and tokens[1] not in index.word_index.text
+    assert spans == [(0, 1), (2, 3), (4, 5), (6, 7)]
+
+
+def test_without_words():
+    index = ReferenceIndex("a b", words=False)
+    assert fit_alignment("a c", index) == fit_alignment("a c", "a b")
+    with pytest.raises(Exception):
+        index.tokenize("a")
+
+
+def test_shared_between_threads():
+    random.seed(0)
+    reference = random_text(300)
+    index = ReferenceIndex(reference)
+    hypotheses = [random_text(300) for _ in range(16)]
+
+    def sync(text, reference_text):
+        alignment = [CharAlignment(character=char, duration=10) for char in text]
+        sync_alignment(alignment, reference_text, words=True)
+        return alignment
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(sync, hypotheses, [index] * len(hypotheses)))
+
+    assert results == [sync(text, reference) for text in hypotheses]
@@ -0,0 +1,52 @@
+from alsyncer import SyncStats, sync_alignment
+from alsyncer.syncer import fit_alignment
+from alsyncer.utils import CharAlignment
+
+
+def make_alignment(text, duration=10):
+    return [CharAlignment(character=char, duration=duration) for char in text]
+
+
+def test_counters():
+    stats = SyncStats()
+    # "x" is added, "l" and "d" are missing
+    sync_alignment(make_alignment("helxo worl"), "hello world", stats=stats)
+
+    assert stats.syncs == 1
+    assert (stats.removed, stats.inserted) == (1, 2)
+    assert (stats.addition_chunks, stats.missing_chunks) == (1, 2)
+    assert stats.probes >= 3
+    assert stats.searched >= len("helxo worl") + len("hello world")
+    assert stats.max_depth >= 1
+    assert all(seconds >= 0 for seconds in stats.seconds.values())
+
+
+def test_accumulates():
+    stats = SyncStats()
+    for _ in range(3):
+        sync_alignment(make_alignment("helo"), "hello", stats=stats)
+    assert stats.syncs == 3
+    assert stats.inserted == 3
+
+
+def test_fit_depth():
+    stats = SyncStats()
+    # Every other char matches, each match leaves a range before and after it
+    fit_alignment("aXbXcXdXe", "abcde", engine="greedy", stats=stats)
+    assert stats.max_depth >= 2
+
+
+def test_same_result_with_stats():
+    with_stats = make_alignment("helxo worl")
+    without = make_alignment("helxo worl")
+    sync_alignment(with_stats, "hello world", words=True, stats=SyncStats())
+    sync_alignment(without, "hello world", words=True)
+    assert with_stats == without
+
+
+def test_export():
+    stats = SyncStats()
+    sync_alignment(make_alignment("ab"), "abc", stats=stats)
+    exported = stats.as_dict()
+    assert set(exported) >= {"fit_seconds", "remove_seconds", "add_seconds", "round_seconds", "probes", "max_depth", "inserted"}
+    assert exported["inserted"] == 1
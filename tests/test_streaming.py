@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from alsyncer import CharAlignment, sync_alignment
+from alsyncer.streaming import StreamingSyncer
+
+
+def AL(chars, durs):
+    return [CharAlignment(character=c, duration=d) for c, d in zip(chars, durs)]
+
+
+def stream(alignment, reference_text, fragment_size, lookahead):
+    syncer = StreamingSyncer(reference_text, lookahead=lookahead)
+    result = []
+    for i in range(0, len(alignment), fragment_size):
+        result.extend(syncer.feed(alignment[i:i+fragment_size]))
+    result.extend(syncer.finish())
+    return result
+
+
+@pytest.mark.parametrize("fragment_size", [1, 3, 10])
+def test_same_as_full_sync(fragment_size):
+    rtext = "The quick brown fox jumps over the lazy dog. " * 6
+    altext = rtext.replace("quick", "quikc").replace("over", "ovr").replace(". ", " ")
+    rng = random.Random(fragment_size)
+    durs = [rng.randint(20, 120) for _ in altext]
+
+    expected = AL(altext, durs)
+    sync_alignment(expected, rtext)
+
+    result = stream(AL(altext, durs), rtext, fragment_size, lookahead=8)
+
+    assert result == expected
+
+
+def test_holds_back_only_lookahead():
+    rtext = "abcdefghij" * 10
+    syncer = StreamingSyncer(rtext, lookahead=5)
+    finalized = 0
+    for i, char in enumerate(rtext):
+        finalized += len(syncer.feed(AL(char, [10])))
+        assert i + 1 - finalized < 2 * 5
+    assert finalized + len(syncer.finish()) == len(rtext)
+
+
+def test_finish_distributes_the_rest():
+    syncer = StreamingSyncer("Hi!", lookahead=1)
+    assert syncer.feed(AL("Hi", [100, 50])) == AL("H", [100])
+    assert syncer.finish() == AL("i!", [25, 25])
+
+
+@pytest.mark.parametrize("noise", ["xyz", "ab "])
+def test_pending_stays_within_cap_without_matches(noise):
+    rng = random.Random(noise)
+    rtext = "".join(rng.choice("ab ") for _ in range(500))
+    altext = rtext[:100] + "".join(rng.choice(noise) for _ in range(3000)) + rtext[100:]
+    durs = [rng.randint(1, 100) for _ in altext]
+
+    syncer = StreamingSyncer(rtext, lookahead=8)
+    result = []
+    for i in range(0, len(altext), 3):
+        result.extend(syncer.feed(AL(altext[i:i+3], durs[i:i+3])))
+        assert len(syncer._pending) < syncer.max_pending
+    result.extend(syncer.finish())
+
+    assert "".join(al.character for al in result) == rtext
+    assert sum(al.duration for al in result) == sum(durs)
+
+
+def test_max_pending_above_two_lookaheads():
+    with pytest.raises(Exception):
+        StreamingSyncer("abc", lookahead=4, max_pending=8)
+
+
+@pytest.mark.parametrize("lookahead", [1, 4, 32])
+def test_random_streams_keep_reference_and_duration(lookahead):
+    rng = random.Random(lookahead)
+    for _ in range(200):
+        rtext = "".join(rng.choice("ab ") for _ in range(rng.randint(1, 80)))
+        altext = "".join(
+            ("x" if rng.random() < 0.05 else "") + char
+            for char in rtext if rng.random() > 0.05
+        ) + rtext[-1]
+        durs = [rng.randint(1, 100) for _ in altext]
+
+        result = stream(AL(altext, durs), rtext, rng.randint(1, 5), lookahead)
+
+        assert "".join(al.character for al in result) == rtext
+        assert sum(al.duration for al in result) == sum(durs)
+        assert all(isinstance(al.duration, int) for al in result)
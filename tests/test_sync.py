@@ -1,3 +1,5 @@
+import pytest
+
 from alsyncer import sync_alignment, CharAlignment
 
 
@@ -192,3 +194,64 @@ def test_11():
         "Hello!",
         (92, 50, 43, 37, 55, 55)
     )
+
+
+def test_words_mode_keeps_invariants():
+    altext = "the quikc brown fox jumsp over teh lazy dog"
+    rtext = "The quick brown fox jumps over the lazy dog."
+    alignment = [CharAlignment(character=char, duration=10 + i % 7) for i, char in enumerate(altext)]
+    total = sum(al.duration for al in alignment)
+    sync_alignment(alignment, rtext, words=True)
+    assert ''.join(al.character for al in alignment) == rtext
+    assert sum(al.duration for al in alignment) == total
+
+
+@pytest.mark.parametrize("verify", ["off", "cheap", "full"])
+def test_verify_modes(verify):
+    alignment = [CharAlignment(character="H", duration=100), CharAlignment(character="i", duration=50)]
+    sync_alignment(alignment, "Hi!", verify=verify)
+    assert [al.duration for al in alignment] == [100, 25, 25]
+
+
+def test_unknown_verify_mode_raises():
+    with pytest.raises(Exception):
+        sync_alignment([CharAlignment(character="H", duration=100)], "H", verify="some")
+
+
+def test_full_verify_reports_original(monkeypatch):
+    # Simulate a distribution bug that loses duration
+    import alsyncer.syncer
+    # Rounding returns the bias left, none here
+    monkeypatch.setattr(alsyncer.syncer, "round_alignment_func", lambda alignment, **kwargs: setattr(alignment[0], "duration", 0) or 0)
+    alignment = [CharAlignment(character="H", duration=100), CharAlignment(character="i", duration=50)]
+    with pytest.raises(Exception, match="Original alignment: \\[CharAlignment"):
+        sync_alignment(alignment, "Hi", verify="full")
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_cheap_verify_catches_lost_duration(monkeypatch, backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+
+    # Simulate a distribution bug that gives nothing to the neighbours
+    import alsyncer.syncer
+    monkeypatch.setattr(alsyncer.syncer, "_share", lambda div, duration: 0)
+    monkeypatch.setattr(alsyncer.syncer, "distribute_missing", _losing_distribute_missing(alsyncer.syncer.distribute_missing))
+    alignment = [CharAlignment(character=char, duration=100) for char in "Hi"]
+    with pytest.raises(Exception, match="duration changed"):
+        sync_alignment(alignment, "H!!i", verify="cheap", backend=backend)
+
+
+def _losing_distribute_missing(distribute_missing):
+    def losing(*args):
+        updated_indexes, updated_durations, *rest = distribute_missing(*args)
+        return (updated_indexes, updated_durations * 0, *rest)
+    return losing
+
+
+def test_verify_is_off_by_default(monkeypatch):
+    import alsyncer.syncer
+    monkeypatch.setattr(alsyncer.syncer, "_check_synchronised", lambda *args: 1 / 0)
+    alignment = [CharAlignment(character="H", duration=100), CharAlignment(character="i", duration=50)]
+    sync_alignment(alignment, "Hi!")
+    assert [al.duration for al in alignment] == [100, 25, 25]
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from alsyncer import AlignmentTimeline, ColumnarAlignment
+from alsyncer.utils import CharAlignment
+
+
+def make_alignment(text, durations):
+    return [CharAlignment(character=char, duration=duration) for char, duration in zip(text, durations)]
+
+
+def test_char_spans():
+    timeline = AlignmentTimeline(make_alignment("Hi!", [100, 25, 25]))
+    assert timeline.span(0) == (0, 100)
+    assert timeline.span(2) == (125, 150)
+    assert timeline.time_span(1, 3) == (100, 150)
+    assert (timeline.start_time, timeline.end_time) == (0, 150)
+    with pytest.raises(IndexError):
+        timeline.span(3)
+
+
+def test_char_at():
+    timeline = AlignmentTimeline(make_alignment("abc", [10, 0, 10]), offset=1000)
+    assert timeline.char_at(999) is None
+    assert timeline.char_at(1000) == 0
+    assert timeline.char_at(1010) == 2 # "b" has no duration
+    assert timeline.char_at(1020) is None
+
+
+def test_chars_between_matches_scan():
+    random.seed(0)
+    durations = [random.choice([0, 5, 10, 20]) for _ in range(200)]
+    timeline = AlignmentTimeline(ColumnarAlignment("a" * 200, durations))
+    starts = [sum(durations[:i]) for i in range(201)]
+
+    for _ in range(500):
+        start_time = random.uniform(-10, starts[-1] + 10)
+        end_time = start_time + random.uniform(0, 100)
+        expected = [i for i in range(200) if starts[i] < end_time and starts[i+1] > start_time]
+        assert list(timeline.chars_between(start_time, end_time)) == expected
+
+
+def test_words_and_lines():
+    text = "hello world\nsecond line"
+    timeline = AlignmentTimeline(make_alignment(text, [10] * len(text)))
+
+    assert timeline.words == [(0, 5), (6, 11), (12, 18), (19, 23)]
+    assert timeline.lines == [(0, 11), (12, 23)]
+
+    assert timeline.word_at(65) == 1
+    assert timeline.word_at(55) is None # The space
+    assert timeline.word_span(1) == (60, 110)
+    assert list(timeline.words_between(40, 130)) == [0, 1, 2]
+
+    assert timeline.line_at(125) == 1
+    assert timeline.line_span(0) == (0, 110)
+    assert list(timeline.lines_between(100, 130)) == [0, 1]
@@ -0,0 +1,94 @@
+import random
+import struct
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from alsyncer import CharAlignment, ColumnarAlignment
+from alsyncer.syncer import add_missing, remove_additions
+from alsyncer.utils import round_alignment
+from alsyncer.vectorized import round_durations
+
+
+def AL(chars, durs):
+    return [CharAlignment(character=c, duration=d) for c, d in zip(chars, durs)]
+
+
+def bits(al):
+    # Exact float bits and int/float type of every duration
+    return [(x.character, type(x.duration), struct.pack("d", x.duration)) for x in al]
+
+
+def random_durations(rng, length):
+    return [rng.choice([rng.randint(1, 100), rng.random() * 100]) for _ in range(length)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_remove_additions_same_as_python(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        length = rng.randint(2, 60)
+        durs = random_durations(rng, length)
+        additions = sorted(rng.sample(range(length), rng.randint(0, length - 1)))
+
+        expected = AL("a" * length, durs)
+        remove_additions(expected, additions, backend="python")
+
+        al = AL("a" * length, durs)
+        remove_additions(al, additions, backend="numpy")
+        assert bits(al) == bits(expected)
+
+        columnar = ColumnarAlignment("a" * length, durs)
+        remove_additions(columnar, additions, backend="numpy")
+        assert list(columnar.durations) == [x.duration for x in expected]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_add_missing_same_as_python(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        length = rng.randint(1, 40)
+        missing_count = rng.randint(0, 40)
+        reference_text = "".join(rng.choice("abc") for _ in range(length + missing_count))
+        missing = sorted(rng.sample(range(len(reference_text)), missing_count))
+        chars = [c for i, c in enumerate(reference_text) if i not in missing]
+        durs = random_durations(rng, length)
+
+        expected = AL(chars, durs)
+        add_missing(expected, reference_text, missing, backend="python")
+
+        al = AL(chars, durs)
+        add_missing(al, reference_text, missing, backend="numpy")
+        assert bits(al) == bits(expected)
+
+        columnar = ColumnarAlignment("".join(chars), durs)
+        add_missing(columnar, reference_text, missing, backend="numpy")
+        assert columnar.characters == reference_text
+        assert list(columnar.durations) == [x.duration for x in expected]
+
+
+@pytest.mark.parametrize(
+    "durs",
+    [
+        [1.2, 2.4, 3.4],
+        [0.5, 1.5],
+        [100, 50, 100/3, 200/3, 25.5, 24.5],
+        [92, 50, 43 + 1/3, 36 + 2/3, 55, 55],
+    ],
+)
+def test_round_same_as_python(durs):
+    expected = AL("a" * len(durs), durs)
+    expected_bias = round_alignment(expected, backend="python")
+
+    al = AL("a" * len(durs), durs)
+    bias = round_alignment(al, backend="numpy")
+
+    assert bits(al) == bits(expected)
+    assert bias == pytest.approx(expected_bias)
+
+
+def test_round_gives_up_near_ties():
+    import numpy as np
+    # 0.1 + 0.2 + 0.2 is a tie in exact arithmetic, but not in floats
+    assert round_durations(np.array([0.1, 0.2, 0.2, 0.5])) is None